@@ -13,6 +13,11 @@
 teams                = 12       # Teams in the fantasy league
 auction_money        = 220      # Money alloted to each team for an auction draft
 roster_slots         = 17       # Roster slots available per team (total)
+my_team              = "Me"     # Owner name used for your team in the draft sheet
+draft_position       = 1        # Your pick in the first round of a snake draft
+# Owner names of every team in the draft sheet, "Team <n>" names fill in up to teams
+team_names           = ["Me", "Pomy", "HDR", "MUGG", "FISH", "HELL", "(._. )", "Psycho",
+                        "Osos", "MOON", "Dr.", "865"]
 
 # SCORING ===================================================================================
 pass_completion      = 0.05     # Points per pass completion (QB)
@@ -37,23 +42,65 @@ starting_qbs         = 1.0      # Max number of starting QBs per team
 starting_rbs         = 2.83     # Max number of starting RBs per team
 starting_wrs         = 2.83     # Max number of starting WRs per team
 starting_tes         = 1.33     # Max number of starting TEs per team
+# Tier cut-offs as a multiple of the starters per position (roster uses expected drafted)
+top_reserve_ratio    = 1.5      # Top reserve tier cut-off
+elite_starter_ratio  = 0.5      # Elite starter tier cut-off
 
-# KEEPERS ===================================================================================
-# Projected Keepers
-#         Me                Pomy              HDR               MUGG
-#         FISH              HELL              (._. )            Psycho
-#         Osos              MOON              Dr.               865
-#         EdLa, AJGr, ShVe, DeMu, DoMa, ZaSt, DrBr, AnEl, JuTh, PeMa, CaJo, MaFo,
-#         RG3 , PeHa, MiCr, DeTh, BrMa, CoPa, MaSt, GiBe, RaJe, AlMo, JoNe, JoGo,
-#         WeWe, MaLy, VeDa, JuJo, JiGr, DeBr, ReBu, AlJe, JoBe, ????, ????, ????
-kpr_pr  = ( 43  + 7   + 7   + 1   + 16  + 3   + 41  + 1   + 1   + 31  + 38  + 61
-          + 17  + 13  + 4   + 1   + 35  + 2   + 6   + 32  + 1   + 1   + 21  + 2
-          + 14  + 41  + 13  + 7   + 1   + 28  + 17  + 5   + 1   + 0   + 0   + 0  )
-kpr_val = ( 44  + 36  + 30  + 44  + 38  + 33  + 29  + 34  + 32  + 39  + 49  + 61
-          + 13  + 16  + 22  + 46  + 38  + 17  + 18  + 43  + 24  + 26  + 30  + 0
-          + 7   + 35  + 17  + 39  + 48  + 40  + 31  + 31  + 31  + 0   + 0   + 0  )
+# QUALITY STARTS ============================================================================
+# Quality starts from weekly game logs (ff_draft_organizer.py -g). A game worth at least a
+# position's good start points in custom scoring is a good start, at least its great start
+# points a great start. Quality start = good starts * weight + great starts * weight.
+qb_good_start        = 18.0     # Custom points for a good QB game
+qb_great_start       = 25.0     # Custom points for a great QB game
+rb_good_start        = 12.0     # Custom points for a good RB game
+rb_great_start       = 20.0     # Custom points for a great RB game
+wr_good_start        = 12.0     # Custom points for a good WR game
+wr_great_start       = 20.0     # Custom points for a great WR game
+te_good_start        = 9.0      # Custom points for a good TE game
+te_great_start       = 15.0     # Custom points for a great TE game
+good_start_weight    = 4.0      # Quality start points per good game
+great_start_weight   = 6.25     # Quality start points per great game (16 great = 100)
 
-keeper_money_used    = kpr_pr   # Total amount of auction money used towards keepers
-keeper_value         = kpr_val  # Total amount of projected value absorbed by keepers
+# KEEPERS ===================================================================================
+# Candidate keepers for each team with the price it would cost to keep them. Each team is
+# assumed to keep the candidates that give it the most auction value over keeper price
+# (using this program's auction values), up to keepers_per_team.
+keepers_per_team     = 3        # Max keepers per team
+keeper_candidates    = {
+    "Me"     : [("Eddie Lacy",            43), ("Robert Griffin",   17),
+                ("Wes Welker",            14)],
+    "Pomy"   : [("A.J. Green",             7), ("Percy Harvin",     13),
+                ("Marshawn Lynch",        41)],
+    "HDR"    : [("Shane Vereen",           7), ("Michael Crabtree",  4),
+                ("Vernon Davis",          13)],
+    "MUGG"   : [("DeMarco Murray",         1), ("Demaryius Thomas",  1),
+                ("Julio Jones",            7)],
+    "FISH"   : [("Doug Martin",           16), ("Brandon Marshall", 35),
+                ("Jimmy Graham",           1)],
+    "HELL"   : [("Zac Stacy",              3), ("Cordarrelle Patterson", 2),
+                ("Dez Bryant",            28)],
+    "(._. )" : [("Drew Brees",            41), ("Matthew Stafford",  6),
+                ("Reggie Bush",           17)],
+    "Psycho" : [("Andre Ellington",        1), ("Giovani Bernard",  32),
+                ("Alshon Jeffery",         5)],
+    "Osos"   : [("Julius Thomas",          1), ("Rashad Jennings",   1),
+                ("Joique Bell",            1)],
+    "MOON"   : [("Peyton Manning",        31), ("Alfred Morris",     1)],
+    "Dr."    : [("Calvin Johnson",        38), ("Jordy Nelson",     21)],
+    "865"    : [("Matt Forte",            61), ("Josh Gordon",       2)],
+}
 
+# DATA SOURCES ==============================================================================
+# Base URLs of the scraped sites. Point both at ff_fixtures.py to run offline.
+fantasypros_url      = "http://www.fantasypros.com"
+cbssports_url        = "http://www.cbssports.com"
+fetch_timeout        = 30       # Seconds before a page request is abandoned
 
+# VALUATION CACHE ===========================================================================
+# Valued player tables can be cached by a hash of the parsed data and the settings above,
+# so commands run again on the same data skip the valuation. Off when cache_dir is "", set
+# it (e.g. ".ff_cache") or use ff_draft_organizer.py -c to turn it on.
+cache_dir            = ""
+cache_entries        = 8        # Valued tables kept in memory by a running program
+cache_max_mb         = 64       # Disk cache size limit, least recently used evicted first
+cache_max_days       = 7        # Disk cache entries older than this are evicted
@@ -0,0 +1,330 @@
+# HEADER ====================================================================================
+# File   : ff_backtest.py
+# Version: 0.1
+# Summary:
+# Backtests the valuation model on past seasons. Each season directory holds archived
+# preseason projections and the actual final season stats, and optionally the auction
+# results. For every season the tier / marginal value model from ff_draft_organizer.py
+# is replayed on the projections (predicted $) and on the actual stats (realized $, the
+# value the player turned out to be worth under the same league settings). Accuracy is
+# scored as the rank correlation of projected to actual points, the rank correlation of
+# predicted to realized $ and the mean $ error. With auction results the keeper inflation
+# formula is checked against the prices paid. A grid search over marginal scoring settings
+# ranks each combination's predicted $ by mean $ error across the seasons, always against
+# the same realized $, valued once under the base league settings.
+# Seasons are scored once into per-position point columns; every grid point then only
+# recomputes the tier cut-offs and value columns, so a sweep takes well under a second
+# per hundred combinations.
+#
+# Season directory (one per season, e.g. backtest/2012):
+# projections.tsv  [name, team, pos and stat columns named as in STAT_COLUMNS]
+# actuals.tsv      [same layout, final season totals]
+# prices.tsv       [optional: name, price and keeper (Y for kept players)]
+#
+# Grid file (JSON, values to try for marginal scoring settings of config.py):
+# { "marginal" : { "top_reserve_ratio" : [1.25, 1.5, 2.0], "starting_rbs" : [2.5, 3.0] } }
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import itertools
+import json
+import math
+import os
+import sys
+import getopt
+import time
+import ff_draft_organizer as ffdo
+import ff_keepers
+import ff_rules
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+DEFAULT_GRID     = {"marginal" : {"top_reserve_ratio"   : [1.25, 1.5, 1.75, 2.0],
+                                  "elite_starter_ratio" : [0.25, 0.5, 0.75]}}
+
+# Program Settings
+VERBOSITY        = 1
+DATA_DIR         = 'backtest'
+GRID_FILE        = ''
+RULES_FILE       = ''
+TOP_RESULTS      = 10
+HELP_MSG  = (
+"Usage: python ff_backtest.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = season results (default), 2 = debug]\n"
+"-d <dir>     [backtest directory, one sub-directory per season (default backtest)]\n"
+"-r <file>    [rules file with the league settings used for every season]\n"
+"-g <file>    [grid file, JSON lists of marginal scoring settings to search]\n"
+"-n <count>   [grid results to show (default 10)]\n"
+)
+
+
+# CLASSES ===================================================================================
+# One season's projected and actual points by position, aligned by player
+class Season:
+    def __init__(self, path):
+        self.name      = os.path.basename(os.path.normpath(path))
+        projections    = load_stats(os.path.join(path, "projections.tsv"))
+        actuals        = load_stats(os.path.join(path, "actuals.tsv"))
+        self.names     = {}
+        self.projected = {}
+        self.actual    = {}
+        for position in POSITIONS:
+            actual = dict([(name, ffdo.score_stats(position, stats))
+                           for (name, stats) in actuals.get(position, [])])
+            rows   = projections.get(position, [])
+            self.names[position]     = [name for (name, stats) in rows]
+            self.projected[position] = [ffdo.score_stats(position, stats)
+                                        for (name, stats) in rows]
+            # Projected players missing from the actual stats did not play
+            self.actual[position]    = [actual.get(name, 0.0) for (name, stats) in rows]
+
+        self.prices  = {}
+        self.keepers = {}
+        prices_path  = os.path.join(path, "prices.tsv")
+        if os.path.exists(prices_path):
+            for row in read_table(prices_path):
+                price = int(row["price"].replace('$', ''))
+                if (row.get("keeper", "").upper() == "Y"):
+                    self.keepers[row["name"]] = price
+                else:
+                    self.prices[row["name"]] = price
+
+
+# FUNCTIONS =================================================================================
+def read_table( path ):
+    # Rows of a tab delimited file with a header line, as dictionaries
+    with open(path) as f:
+        header = f.readline().rstrip('\n').split('\t')
+        rows   = []
+        for line in f:
+            if line.strip():
+                rows.append(dict(zip(header, line.rstrip('\n').split('\t'))))
+    return rows
+
+def load_stats( path ):
+    # (name, stats) per position with stats in STAT_COLUMNS order, missing stats are 0
+    players = {}
+    for row in read_table(path):
+        position = row["pos"].upper()
+        if position not in ffdo.STAT_COLUMNS:
+            continue
+        stats = [float(row.get(stat) or 0) for stat in ffdo.STAT_COLUMNS[position]]
+        players.setdefault(position, []).append((row["name"], stats))
+    return players
+
+def load_seasons( data_dir ):
+    seasons = []
+    for name in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, name)
+        if os.path.isfile(os.path.join(path, "projections.tsv")):
+            seasons.append(Season(path))
+    return seasons
+
+def dollar_values( points ):
+    # Auction value of every player from a points column per position. The same tiers,
+    # marginal value and auction value as player_tiers, assign_marginal_value and
+    # value_players, on plain columns instead of Player objects.
+    marg_val  = {}
+    total_val = 0.0
+    for position in points:
+        column = points[position]
+        ranked = sorted(column, reverse=True)
+        # Cut-offs clamped to short seasons, as in player_tiers
+        cuts   = [ranked[min(max(i, 0), len(ranked) - 1)]
+                  for i in ffdo.tier_indices(position)] if ranked else []
+        marg_val[position] = [sum([pts - cut for cut in cuts if (pts >= cut)])
+                              for pts in column]
+        total_val += sum(marg_val[position])
+
+    per_dollar = (total_val / ffdo.DISCR_MONEY) or 1.0
+    return dict([(position, [math.ceil(val / per_dollar + 1)
+                             for val in marg_val[position]]) for position in marg_val])
+
+def ranks( values ):
+    # Ranks starting at 1, ties get their average rank
+    order  = sorted(range(len(values)), key=values.__getitem__)
+    result = [0.0] * len(values)
+    i = 0
+    while (i < len(order)):
+        j = i
+        while (j + 1 < len(order)) and (values[order[j + 1]] == values[order[i]]):
+            j += 1
+        for k in range(i, j + 1):
+            result[order[k]] = (i + j) / 2.0 + 1
+        i = j + 1
+    return result
+
+def spearman( x, y ):
+    # Rank correlation, 0.0 when either side has no spread
+    if (len(x) < 2):
+        return 0.0
+    rx, ry = ranks(x), ranks(y)
+    mean   = (len(x) + 1) / 2.0
+    cov    = sum([(a - mean) * (b - mean) for (a, b) in zip(rx, ry)])
+    var_x  = sum([(a - mean) ** 2 for a in rx])
+    var_y  = sum([(b - mean) ** 2 for b in ry])
+    if (var_x == 0) or (var_y == 0):
+        return 0.0
+    return cov / math.sqrt(var_x * var_y)
+
+def flatten( columns ):
+    return [value for position in POSITIONS for value in columns.get(position, [])]
+
+def score_season( season, predicted, realized ):
+    # Accuracy of one season's predicted $ against realized $
+    pts_rho = sum([spearman(season.projected[position], season.actual[position])
+                   for position in POSITIONS]) / len(POSITIONS)
+
+    # Players worth more than $1 either way, the $1 tail would swamp the comparison
+    pairs = [(p, r) for (p, r) in zip(flatten(predicted), flatten(realized))
+             if (p > 1) or (r > 1)]
+    pred  = [p for (p, r) in pairs]
+    real  = [r for (p, r) in pairs]
+    result = {"pts_rho" : pts_rho,
+              "usd_rho" : spearman(pred, real),
+              "usd_mae" : sum([abs(p - r) for (p, r) in pairs]) / max(1, len(pairs))}
+
+    if season.prices:
+        # Keeper inflation from the players actually kept, checked on the prices paid
+        value = dict(zip(flatten(season.names), flatten(predicted)))
+        kept  = [value[name] for name in season.keepers if (name in value)]
+        inflation = ff_keepers.keeper_inflation(sum(season.keepers.values()), sum(kept),
+                                                ffdo.TOTAL_MONEY)
+        sold  = [(value[name], price) for (name, price) in season.prices.items()
+                 if (name in value)]
+        result["inflation"] = inflation
+        result["raw_mae"]   = sum([abs(v - price)
+                                   for (v, price) in sold]) / max(1, len(sold))
+        result["infl_mae"]  = sum([abs(v * inflation - price)
+                                   for (v, price) in sold]) / max(1, len(sold))
+    return result
+
+def grid_rules( base, grid ):
+    # Rules for every combination of grid values on top of the base rules
+    keys   = [(section, key) for section in sorted(grid) for key in sorted(grid[section])]
+    combos = []
+    for values in itertools.product(*[grid[section][key] for (section, key) in keys]):
+        rules = json.loads(json.dumps(base))
+        for ((section, key), value) in zip(keys, values):
+            rules.setdefault(section, {})[key] = value
+        combos.append((dict(zip([key for (section, key) in keys], values)), rules))
+    return combos
+
+def load_grid( path ):
+    with open(path) as f:
+        grid = json.load(f)
+    for section in grid:
+        if (section != "marginal"):
+            raise ValueError(path + ": only marginal scoring settings can be searched")
+        for key in grid[section]:
+            if not isinstance(grid[section][key], list):
+                raise ValueError(path + ": " + section + "." + key + " must be a list")
+    # Every value must be a valid rule
+    for (params, rules) in grid_rules({}, grid):
+        ff_rules.check_rules(rules, path)
+    return grid
+
+def use_rules( rules ):
+    ff_rules.apply_rules(rules)
+    ffdo.load_settings()
+
+def print_season( season, result ):
+    line = (season.name.ljust(10) + "%8.3f" % result["pts_rho"] +
+            "%8.3f" % result["usd_rho"] + "%8.2f" % result["usd_mae"])
+    if ("inflation" in result):
+        line += ("%8.3f" % result["inflation"] + "%8.2f" % result["raw_mae"] +
+                 "%8.2f" % result["infl_mae"])
+    print (line)
+
+def mean_result( results, key ):
+    return sum([result[key] for result in results]) / len(results)
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global DATA_DIR
+    global GRID_FILE
+    global RULES_FILE
+    global TOP_RESULTS
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:d:r:g:n:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-d'):
+            DATA_DIR = arg
+        elif (opt == '-r'):
+            RULES_FILE = arg
+        elif (opt == '-g'):
+            GRID_FILE = arg
+        elif (opt == '-n'):
+            TOP_RESULTS = int(arg)
+
+    try:
+        base = ff_rules.load_rules(RULES_FILE) if RULES_FILE else {}
+        grid = load_grid(GRID_FILE) if GRID_FILE else DEFAULT_GRID
+    except ValueError as e:
+        print (e)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    use_rules(base)
+    seasons = load_seasons(DATA_DIR)
+    if not seasons:
+        print ("No seasons with projections.tsv found in " + DATA_DIR)
+        sys.exit(2)
+
+    # Realized $ under the base rules is the one fixed target every combination is scored
+    # against. Revaluing it per combination would reward settings that only make
+    # projected and actual $ look alike.
+    realized = [dollar_values(season.actual) for season in seasons]
+    results  = [score_season(season, dollar_values(season.projected), real)
+                for (season, real) in zip(seasons, realized)]
+    if (VERBOSITY >= 1):
+        print ("Season     Pts.rho   $.rho   $.MAE   Infl. Pay.MAE Inf.MAE")
+        for (season, result) in zip(seasons, results):
+            print_season(season, result)
+    print ("Mean $ rank correlation %.3f, mean $ error %.2f over %d seasons" %
+           (mean_result(results, "usd_rho"), mean_result(results, "usd_mae"), len(seasons)))
+
+    # Grid search over the marginal scoring settings, only the predictions change
+    scored = []
+    for (params, rules) in grid_rules(base, grid):
+        use_rules(rules)
+        results = [score_season(season, dollar_values(season.projected), real)
+                   for (season, real) in zip(seasons, realized)]
+        scored.append((mean_result(results, "usd_mae"), -mean_result(results, "usd_rho"),
+                       params))
+        if (VERBOSITY >= 2):
+            print (params, "%.2f" % scored[-1][0])
+    use_rules(base)
+    scored.sort(key=lambda entry : (entry[0], entry[1]))
+
+    print ('\n===== GRID SEARCH ======')
+    for (mae, neg_rho, params) in scored[:TOP_RESULTS]:
+        print ("$.MAE %6.2f  $.rho %6.3f  " % (mae, -neg_rho) +
+               ", ".join([key + "=" + str(params[key]) for key in sorted(params)]))
+    print ("%d combinations x %d seasons in %.2f s" % (len(scored), len(seasons),
+                                                      time.perf_counter() - start))
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,292 @@
+# HEADER ====================================================================================
+# File   : ff_board.py
+# Version: 0.1
+# Summary:
+# Terminal draft board for a projector during a live draft. Shows the player table sorted
+# by marginal value with dynamic inflation, paging and a position filter. Draft events
+# are entered at the prompt under the board and recorded through the draft log
+# (ff_draft_log.py). The screen is drawn once. After each event only the screen lines
+# that changed are rewritten using ANSI cursor addressing, in a single write. Sales,
+# picks, undo and redo re-tier the undrafted players (with the -m tier method and -r rules
+# file the table was created with) and re-rank the board.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import shutil
+import sys
+import getopt
+import time
+import ff_draft_organizer as ffdo
+import ff_draft_log
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+# ANSI escape sequences
+ALT_SCREEN_ON    = "\x1b[?1049h"
+ALT_SCREEN_OFF   = "\x1b[?1049l"
+CLEAR_SCREEN     = "\x1b[2J"
+CLEAR_LINE       = "\x1b[2K"
+MOVE_CURSOR      = "\x1b[%d;1H"
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+LOG_FILE         = 'draft.log'
+HELP_MSG  = (
+"Usage: python ff_board.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = board (default), 2 = show redraw time]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+"-l <file>    [draft log file, restored if it exists (default draft.log)]\n"
+"-m <method>  [tier method the table was created with, fixed (default) or cluster]\n"
+"-r <file>    [rules file the table was created with, JSON league/scoring settings]\n"
+)
+BOARD_KEYS = ("n <player> | s <player>, <owner>, <price> | p <player>, <owner> | u | r | "
+              "] next page | [ prev page | f <QB/RB/WR/TE> filter | a all | d drafted | q")
+
+
+# CLASSES ===================================================================================
+# Remembers what is on each screen line and rewrites only the lines that differ
+class ScreenRenderer:
+    def __init__(self, out = sys.stdout):
+        self.out   = out
+        self.lines = []
+
+    def start( self ):
+        self.out.write(ALT_SCREEN_ON + CLEAR_SCREEN)
+        self.out.flush()
+        self.lines = []
+
+    def stop( self ):
+        self.out.write(ALT_SCREEN_OFF)
+        self.out.flush()
+
+    def draw( self, lines ):
+        # Returns the number of screen lines rewritten
+        chunks = []
+        for row in range(max(len(lines), len(self.lines))):
+            new = lines[row] if (row < len(lines)) else ""
+            old = self.lines[row] if (row < len(self.lines)) else None
+            if (new != old):
+                chunks.append(MOVE_CURSOR % (row + 1) + CLEAR_LINE + new)
+        self.lines = list(lines)
+        if chunks:
+            self.out.write(''.join(chunks))
+            self.out.flush()
+        return len(chunks)
+
+    def prompt_row( self, row, text ):
+        # Put the cursor on the prompt line; the line is redrawn with the next frame
+        self.out.write(MOVE_CURSOR % row + CLEAR_LINE)
+        self.out.flush()
+        if (row - 1 < len(self.lines)):
+            self.lines[row - 1] = None
+        return input(text)
+
+# Board view over the draft state
+class DraftBoard:
+    def __init__(self, draft, player_table):
+        self.draft   = draft
+        self.state   = draft.state
+        self.page    = 0
+        self.filter  = ""
+        self.drafted = False
+        self.message = ""
+        self.players = player_table
+        self.rank()
+
+    def rank( self ):
+        # Sort the board on the marginal values the draft state re-tiered
+        self.ranked = sorted(self.players, key=lambda player : (player.marg_val,
+                             player.cus_fpts), reverse=True)
+
+    def visible( self ):
+        players = []
+        for player in self.ranked:
+            if self.filter and (player.pos != self.filter):
+                continue
+            if (bool(player.owner) != self.drafted):
+                continue
+            players.append(player)
+        return players
+
+    def frame( self, width, height, note = "" ):
+        # Screen lines: status, table header, one page of rows, message line.
+        # The last two terminal lines are kept for the prompt. note is shown after the
+        # message (the time the previous frame took to draw, with -v 2).
+        # Snake tables have no auction values, so no dynamic inflation column
+        auction = (ffdo.DRAFT_TYPE == "auction")
+        header  = ffdo.console_header()[-2:]
+        header  = [header[0] + ("Dyn" + ' | ' if auction else "") + "Owner".ljust(8)] + \
+                  ['-' * min(width, len(header[0]) + (14 if auction else 8))]
+        rows    = max(1, height - len(header) - 5)
+        players = self.visible()
+        pages   = max(1, -(-len(players) // rows))
+        self.page = min(self.page, pages - 1)
+
+        inflation = self.state.inflation()
+        status = (("Dynamic Inflation: %.3f   " % inflation if auction else "") +
+                  "Nominated: " + (self.state.nominee or "-") + "   " +
+                  (self.filter or "All") + (" drafted" if self.drafted else " available") +
+                  "   Page %d/%d" % (self.page + 1, pages))
+
+        lines = [status[:width]] + [line[:width] for line in header]
+        start = self.page * rows
+        for i, player in enumerate(players[start : start + rows]):
+            line = ffdo.console_row(start + i + 1, player)
+            if auction:
+                if player.owner:
+                    dyn = player.price
+                else:
+                    dyn = "$%d" % int(player.auct_val * inflation)
+                line += dyn.rjust(4) + ' | '
+            line += player.owner.ljust(8)
+            lines.append(line[:width])
+        while (len(lines) < rows + len(header) + 1):
+            lines.append("")
+        lines.append("   ".join([text for text in (self.message, note) if text])[:width])
+        lines.append(BOARD_KEYS[:width])
+        return lines
+
+    def command( self, line ):
+        cmd  = line[0].lower()
+        args = [arg.strip() for arg in line[1:].split(',')]
+        self.message = ""
+
+        if (cmd == ']'):
+            self.page += 1
+        elif (cmd == '['):
+            self.page = max(0, self.page - 1)
+        elif (cmd == 'f') and (args[0].upper() in POSITIONS):
+            self.filter = args[0].upper()
+            self.page   = 0
+        elif (cmd == 'a'):
+            self.filter = ""
+            self.page   = 0
+        elif (cmd == 'd'):
+            self.drafted = not self.drafted
+            self.page    = 0
+        elif (cmd == 'u'):
+            if self.draft.undo():
+                self.rank()
+            else:
+                self.message = "Nothing to undo"
+        elif (cmd == 'r'):
+            if self.draft.redo():
+                self.rank()
+            else:
+                self.message = "Nothing to redo"
+        elif (cmd in "nsp") and args[0]:
+            name  = ff_draft_log.find_player(self.state, args[0])
+            owner = ff_draft_log.find_team(self.state, args[1]) if (len(args) > 1) else None
+            if name is None:
+                self.message = "No player matching " + args[0]
+            elif (name in self.state.drafted) and (cmd != 'n'):
+                self.message = name + " already drafted by " + self.state.drafted[name][0]
+            elif (cmd == 'n'):
+                self.draft.nominate(name)
+            elif (cmd in "sp") and (len(args) > 1) and (owner is None):
+                self.message = "No team named " + args[1]
+            elif (cmd == 's') and (len(args) == 3) and \
+                 not args[2].replace('$', '').isdigit():
+                self.message = "Price must be a whole number of dollars, see the keys below"
+            elif (cmd == 's') and (len(args) == 3):
+                price = int(args[2].replace('$', ''))
+                try:
+                    self.draft.sale(name, owner, price)
+                    self.rank()
+                    self.message = name + " sold to " + owner + " for $%d" % price
+                except ValueError as e:
+                    self.message = "Sale not logged: " + str(e)
+            elif (cmd == 'p') and (len(args) == 2):
+                self.draft.pick(name, owner)
+                self.rank()
+                self.message = name + " picked by " + owner
+            else:
+                self.message = "Unknown command: " + line
+        else:
+            self.message = "Unknown command: " + line
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global LOG_FILE
+
+    rules_file  = ''
+    tier_method = "fixed"
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:l:m:r:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-l'):
+            LOG_FILE = arg
+        elif (opt == '-m'):
+            if ((arg == 'fixed') or (arg == 'cluster')):
+                tier_method = arg
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-r'):
+            rules_file = arg
+
+    if not IN_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    try:
+        ff_draft_log.use_settings(rules_file, tier_method)
+    except (ValueError, OSError) as e:
+        print ("Rules not applied: " + str(e))
+        sys.exit(2)
+    # The board shows the layout of the file, auction or snake
+    player_table = ff_draft_log.load_table(IN_FILE)
+    draft    = ff_draft_log.DraftLog(LOG_FILE, player_table)
+    board    = DraftBoard(draft, player_table)
+    renderer = ScreenRenderer()
+
+    renderer.start()
+    note = ""
+    try:
+        while True:
+            (width, height) = shutil.get_terminal_size()
+            start   = time.perf_counter()
+            redrawn = renderer.draw(board.frame(width, height, note))
+            if (VERBOSITY >= 2):
+                note = ("Redrew %d lines in %.2f ms" %
+                        (redrawn, (time.perf_counter() - start) * 1000))
+
+            line = renderer.prompt_row(height - 1, "Draft> ").strip()
+            if not line:
+                continue
+            if (line.lower() == 'q'):
+                break
+            board.command(line)
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        renderer.stop()
+        draft.close()
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,154 @@
+# HEADER ====================================================================================
+# File   : ff_cache.py
+# Version: 0.1
+# Summary:
+# Result cache for the valuation pipeline (custom points, tiers, marginal values, auction
+# values and keepers). A result is keyed by a SHA-256 hash of the parsed player data, every
+# config.py setting a rules file can change (see ff_rules.py) and the draft type and tier
+# method, so any change to the inputs is a different key and entries never need
+# invalidating.
+# Two tiers: an in-process LRU of encoded results, and a directory of JSON files shared by
+# every command run on the same data. Disk entries are evicted once older than
+# cache_max_days, then least recently used first until the directory is under
+# cache_max_mb. Results are stored as plain JSON rather than pickles, so a table valued
+# by one program loads in any other.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import time
+import config
+import ff_rules
+
+
+# GLOBALS ===================================================================================
+CACHE_VERSION    = 2
+CACHE_SUFFIX     = ".json"
+
+
+# CLASSES ===================================================================================
+# In-process LRU in front of an on-disk cache directory
+class ValuationCache:
+    def __init__(self, directory, entries = 8, max_bytes = 64 << 20, max_age = 7 * 86400):
+        self.directory = directory
+        self.entries   = entries
+        self.max_bytes = max_bytes
+        self.max_age   = max_age
+        self.memory    = collections.OrderedDict()    # Key -> encoded result
+
+    def path( self, key ):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get( self, key ):
+        # Decoded result for key, or None
+        data = self.memory.get(key)
+        if data is not None:
+            self.memory.move_to_end(key)
+        else:
+            data = self.read(key)
+            if data is not None:
+                self.remember(key, data)
+        if data is None:
+            return None
+        return json.loads(data)
+
+    def put( self, key, result ):
+        data = json.dumps(result, separators=(',', ':'))
+        self.remember(key, data)
+        self.write(key, data)
+
+    def remember( self, key, data ):
+        self.memory[key] = data
+        self.memory.move_to_end(key)
+        size = sum([len(value) for value in self.memory.values()])
+        while (len(self.memory) > self.entries) or (size > self.max_bytes):
+            (old_key, old_data) = self.memory.popitem(last=False)
+            size -= len(old_data)
+
+    def read( self, key ):
+        path = self.path(key)
+        try:
+            if (time.time() - os.path.getmtime(path) > self.max_age):
+                os.remove(path)
+                return None
+            with open(path) as f:
+                data = f.read()
+            # The modification time is the last use, for least recently used eviction
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def write( self, key, data ):
+        # Written to a temporary file and renamed, so a command reading the same key at
+        # the same time never sees a partial file
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            handle, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(handle, "w") as f:
+                f.write(data)
+            os.replace(temp, self.path(key))
+            self.evict()
+        except OSError:
+            pass
+
+    def evict( self ):
+        # Removes expired entries, then the least recently used until under max_bytes
+        files = []
+        now   = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = os.stat(path)
+                if (now - info.st_mtime > self.max_age):
+                    os.remove(path)
+                else:
+                    files.append((info.st_mtime, info.st_size, path))
+            except OSError:
+                continue
+
+        size = sum([file_size for (mtime, file_size, path) in files])
+        for (mtime, file_size, path) in sorted(files):
+            if (size <= self.max_bytes):
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= file_size
+
+
+# FUNCTIONS =================================================================================
+def config_settings():
+    # Every config.py setting a rules file can change, current values
+    settings = {}
+    for section in ff_rules.RULE_SECTIONS:
+        for key in ff_rules.RULE_SECTIONS[section]:
+            settings[key] = getattr(config, key)
+    return settings
+
+def valuation_key( rows, draft_type, tier_method ):
+    # Hex key of the parsed player data (JSON serializable rows) and current settings
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CACHE_VERSION, draft_type, tier_method, config_settings()],
+                             sort_keys=True).encode("utf-8"))
+    digest.update(json.dumps(rows).encode("utf-8"))
+    return digest.hexdigest()
+
+def config_cache( directory = None ):
+    # Cache with the config.py settings in directory (default cache_dir), None when
+    # disabled
+    directory = directory or config.cache_dir
+    if not directory:
+        return None
+    return ValuationCache(directory, config.cache_entries,
+                          int(config.cache_max_mb * (1 << 20)),
+                          config.cache_max_days * 86400)
@@ -0,0 +1,537 @@
+# HEADER ====================================================================================
+# File   : ff_draft_log.py
+# Version: 0.1
+# Summary:
+# Live draft log. Every draft event (nomination, sale, snake pick, undo, redo) is appended
+# to a local log file and flushed to disk before it is applied. Derived state (team
+# budgets, rosters, drafted players, dynamic inflation) is snapshotted every few events.
+# The undrafted players are re-tiered after every sale, pick, undo and redo, with the tier
+# method (-m) and rules file (-r) the table was created with. Auction values, the pool
+# value and dynamic inflation follow the new tiers, on the dollar scale of the pre-draft
+# valuation.
+# After a crash the draft is restored from the latest snapshot and only the log events
+# after it are replayed.
+# The player table comes from the tab delimited file created by ff_draft_organizer.py.
+# Players already owned in that file (keepers) are part of the starting state. The
+# draft can be exported back to the same format with Purchase Price, Realized Value,
+# Owner and Dynamic Inflation filled in.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import json
+import math
+import os
+import sys
+import getopt
+import config
+import ff_draft_organizer as ffdo
+import ff_nominate
+import ff_rules
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+AUCTION_MONEY    = config.auction_money
+ROSTER_SLOTS     = config.roster_slots
+TEAMS            = (config.team_names[:config.teams] +
+                    ["Team %d" % (i + 1) for i in range(len(config.team_names),
+                                                         config.teams)])
+SNAPSHOT_EVERY   = 20       # Events between snapshots
+NOMINATIONS      = 5        # Nominations suggested after each sale, pick, undo and redo
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+LOG_FILE         = 'draft.log'
+HELP_MSG  = (
+"Usage: python ff_draft_log.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = draft display (default), 2 = debug]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+"-l <file>    [draft log file, restored if it exists (default draft.log)]\n"
+"-m <method>  [tier method the table was created with, fixed (default) or cluster]\n"
+"-r <file>    [rules file the table was created with, JSON league/scoring settings]\n"
+)
+COMMANDS_MSG = (
+"Commands:\n"
+"n <player>                   [nominate a player]\n"
+"s <player>, <owner>, <price> [player sold in the auction]\n"
+"p <player>, <owner>          [player picked in a snake draft]\n"
+"u                            [undo last nomination, sale or pick]\n"
+"r                            [redo last undone event]\n"
+"b                            [show team budgets and dynamic inflation]\n"
+"a <count>                    [players to nominate, drains opponents' budgets most]\n"
+"e <file>                     [export player table with draft results]\n"
+"q                            [quit, the log is already saved]\n"
+)
+
+
+# CLASSES ===================================================================================
+# Derived draft state, changed only through events
+class DraftState:
+    def __init__(self, player_table):
+        self.players    = {}
+        self.budgets    = {}
+        self.rosters    = {}
+        self.drafted    = {}
+        self.nominee    = ''
+        self.done       = []
+        self.undone     = []
+        self.seq        = 0
+        self.pool_value = 0.0
+
+        # Pre-draft valuation of the whole table with the current tier method and
+        # settings. Live auction values stay on its marginal points per dollar.
+        total_marg_val = 0.0
+        for position in POSITIONS:
+            table = sorted([player for player in player_table if (player.pos == position)],
+                           key=lambda player: player.cus_fpts, reverse=True)
+            total_marg_val += ffdo.retier_players(position, table)
+        self.marg_per_dollar = (total_marg_val / ffdo.DISCR_MONEY) or 1.0
+
+        for player in player_table:
+            self.players[player.name] = player
+            self.assign_value(player)
+            self.pool_value += max(player.auct_val - 1, 0)
+
+        # The league's teams, and any other owner in the player table, start with the full
+        # budget. Players owned in the player table (keepers) start on their rosters.
+        for team in TEAMS + [player.owner for player in player_table if player.owner]:
+            self.budgets[team] = AUCTION_MONEY
+            self.rosters[team] = []
+        for player in player_table:
+            if player.owner:
+                price = player.price.replace('$', '').strip()
+                self.add(player.name, player.owner, int(float(price)) if price else 0)
+        self.retier()
+
+    def add( self, name, owner, price, value = None ):
+        # value is the player's dynamic inflation value when sold
+        if owner not in self.budgets:
+            raise ValueError("unknown team " + owner)
+        player = self.players[name]
+        if value is None:
+            value = int(player.auct_val * self.inflation())
+        self.budgets[owner] -= price
+        self.rosters[owner].append([name, price])
+        self.drafted[name]   = [owner, price, value]
+        self.pool_value     -= max(player.auct_val - 1, 0)
+
+        player.owner    = owner
+        player.price    = "$%d" % price
+        player.real_val = "$%d" % (value - price)
+
+    def remove( self, name ):
+        player              = self.players[name]
+        owner, price, value = self.drafted.pop(name)
+        self.budgets[owner] += price
+        self.rosters[owner]  = [entry for entry in self.rosters[owner] if entry[0] != name]
+        self.pool_value     += max(player.auct_val - 1, 0)
+
+        player.owner    = ''
+        player.price    = ''
+        player.real_val = ''
+
+    def open_slots( self ):
+        return sum([ROSTER_SLOTS - len(self.rosters[team]) for team in self.rosters])
+
+    def inflation( self ):
+        # Discretionary money left over marginal dollars left in the undrafted pool
+        if (self.pool_value <= 0):
+            return 1.0
+        money = sum(self.budgets.values()) - self.open_slots()
+        return money / self.pool_value
+
+    def apply( self, event ):
+        # Undo and redo move actions between the done and undone stacks
+        kind = event["type"]
+        if (kind == "undo"):
+            action = self.done.pop()
+            self.revert(action)
+            self.undone.append(action)
+        elif (kind == "redo"):
+            action = self.undone.pop()
+            self.perform(action)
+            self.done.append(action)
+        else:
+            self.perform(event)
+            self.done.append(event)
+            self.undone = []
+        self.seq = event["seq"]
+        # Every event but a nomination can change the pool
+        if (kind != "nominate"):
+            self.retier()
+
+    def perform( self, event ):
+        kind = event["type"]
+        if (kind == "nominate"):
+            self.nominee = event["player"]
+        elif (kind == "sale") or (kind == "pick"):
+            self.add(event["player"], event["owner"], event["price"])
+            self.nominee = ''
+
+    def revert( self, event ):
+        kind = event["type"]
+        if (kind == "nominate"):
+            self.nominee = event["prev"]
+        elif (kind == "sale") or (kind == "pick"):
+            self.remove(event["player"])
+            self.nominee = event["prev"]
+
+    def snapshot( self ):
+        return {"seq"        : self.seq,
+                "budgets"    : self.budgets,
+                "rosters"    : self.rosters,
+                "drafted"    : self.drafted,
+                "nominee"    : self.nominee,
+                "done"       : self.done,
+                "undone"     : self.undone,
+                "pool_value" : self.pool_value,
+                "inflation"  : self.inflation()}
+
+    def restore( self, snap ):
+        # Put the player table back to the starting state, then to the snapshot state
+        for name in list(self.drafted.keys()):
+            self.remove(name)
+        for name in snap["drafted"]:
+            owner, price, value = snap["drafted"][name]
+            self.add(name, owner, price, value)
+        self.budgets    = snap["budgets"]
+        self.rosters    = snap["rosters"]
+        self.nominee    = snap["nominee"]
+        self.done       = snap["done"]
+        self.undone     = snap["undone"]
+        self.pool_value = snap["pool_value"]
+        self.seq        = snap["seq"]
+        self.retier()
+
+    def retier( self ):
+        # Tiers and marginal value of the undrafted players at each position, cut-offs
+        # moved up by the players already drafted there. Drafted players keep theirs.
+        for position in POSITIONS:
+            players = [player for player in self.players.values()
+                       if (player.pos == position)]
+            pool    = sorted([player for player in players if not player.owner],
+                             key=lambda player: player.cus_fpts, reverse=True)
+            ffdo.retier_players(position, pool, len(players) - len(pool))
+
+        # Auction values and the pool follow the new tiers, then dynamic inflation
+        self.pool_value = 0.0
+        for player in self.players.values():
+            if not player.owner:
+                self.assign_value(player)
+                self.pool_value += max(player.auct_val - 1, 0)
+        self.assign_inflation()
+
+    def assign_value( self, player ):
+        # Auction value from marginal value, as value_players does
+        if (ffdo.DRAFT_TYPE == "auction"):
+            player.auct_val = int(math.ceil((player.marg_val / self.marg_per_dollar) + 1))
+            player.budget   = (player.auct_val / AUCTION_MONEY) * 100
+
+    def assign_inflation( self ):
+        # Dynamic inflation value for every undrafted player
+        inflation = self.inflation()
+        for player in self.players.values():
+            if player.owner:
+                player.d_infl = ''
+            else:
+                player.d_infl = "$%d" % int(player.auct_val * inflation)
+
+# Append-only event log with periodic snapshots
+class DraftLog:
+    def __init__(self, path, player_table):
+        self.path      = path
+        self.snap_path = path + ".snap"
+        self.state     = DraftState(player_table)
+        self.recover()
+        self.log       = open(self.path, "a")
+
+    def recover( self ):
+        # Load the latest snapshot and replay only the events logged after it
+        offset = 0
+        if os.path.exists(self.snap_path):
+            with open(self.snap_path) as f:
+                snap = json.load(f)
+            self.state.restore(snap)
+            offset = snap["offset"]
+            if (VERBOSITY >= 2):
+                print ("Restored snapshot at event %d" % self.state.seq)
+
+        if not os.path.exists(self.path):
+            return
+        replayed = 0
+        with open(self.path, "r+") as f:
+            f.seek(offset)
+            while True:
+                start = f.tell()
+                line  = f.readline()
+                if not line:
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # Partially written event from the crash, drop it from the log
+                    f.seek(start)
+                    f.truncate()
+                    break
+                if (event["seq"] > self.state.seq):
+                    self.state.apply(event)
+                    replayed += 1
+        if (VERBOSITY >= 2):
+            print ("Replayed %d events from %s" % (replayed, self.path))
+
+    def append( self, event ):
+        # The event is on disk before it changes the draft state
+        event["seq"] = self.state.seq + 1
+        self.log.write(json.dumps(event) + '\n')
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.state.apply(event)
+
+        if (event["seq"] % SNAPSHOT_EVERY == 0):
+            self.write_snapshot()
+
+    def write_snapshot( self ):
+        snap           = self.state.snapshot()
+        snap["offset"] = self.log.tell()
+        tmp_path       = self.snap_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snap, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snap_path)
+
+    def nominate( self, name ):
+        self.append({"type" : "nominate", "player" : name, "prev" : self.state.nominee})
+
+    def check_owner( self, owner ):
+        # Checked before the event is logged, so the log never holds an event that fails
+        if owner not in self.state.budgets:
+            raise ValueError("unknown team " + owner)
+
+    def check_price( self, owner, price ):
+        # A team keeps the minimum bid for every other open roster slot
+        slots = ROSTER_SLOTS - len(self.state.rosters[owner])
+        if (slots <= 0):
+            raise ValueError(owner + " has no open roster slot")
+        if (price < 0):
+            raise ValueError("price must not be negative")
+        if (price > self.state.budgets[owner] - (slots - 1)):
+            raise ValueError(owner + " can bid at most $%d" %
+                             (self.state.budgets[owner] - (slots - 1)))
+
+    def sale( self, name, owner, price ):
+        self.check_owner(owner)
+        self.check_price(owner, price)
+        self.append({"type" : "sale", "player" : name, "owner" : owner, "price" : price,
+                     "prev" : self.state.nominee})
+
+    def pick( self, name, owner ):
+        self.check_owner(owner)
+        self.append({"type" : "pick", "player" : name, "owner" : owner, "price" : 0,
+                     "prev" : self.state.nominee})
+
+    def undo( self ):
+        if self.state.done:
+            self.append({"type" : "undo"})
+            return True
+        return False
+
+    def redo( self ):
+        if self.state.undone:
+            self.append({"type" : "redo"})
+            return True
+        return False
+
+    def close( self ):
+        self.write_snapshot()
+        self.log.close()
+
+
+# FUNCTIONS =================================================================================
+def use_settings( rules_file = '', tier_method = "fixed" ):
+    # Rules file (ff_rules.py) and tier method for live re-tiering, the same ones
+    # ff_draft_organizer.py created the table with. Raises ValueError or OSError for a
+    # bad rules file.
+    global AUCTION_MONEY
+    global ROSTER_SLOTS
+    global TEAMS
+
+    ff_rules.apply_rules(ff_rules.load_rules(rules_file) if rules_file else {})
+    ffdo.load_settings()
+    ffdo.TIER_METHOD = tier_method
+    AUCTION_MONEY    = config.auction_money
+    ROSTER_SLOTS     = config.roster_slots
+    TEAMS            = (config.team_names[:config.teams] +
+                        ["Team %d" % (i + 1) for i in range(len(config.team_names),
+                                                             config.teams)])
+
+def load_table( path ):
+    # Player table of path, the draft type set from its layout (auction or snake)
+    with open(path) as f:
+        ffdo.DRAFT_TYPE = ffdo.table_draft_type(f)
+        f.seek(0)
+        return ffdo.load_player_table(f)
+
+def find_player( state, name ):
+    name = name.strip().lower()
+    for player_name in state.players:
+        if (name in player_name.lower()):
+            return player_name
+    return None
+
+def find_team( state, name ):
+    # Team in the draft named name, ignoring case
+    name = name.strip().lower()
+    for team in state.budgets:
+        if (name == team.lower()):
+            return team
+    return None
+
+def print_budgets( state ):
+    print ('-' * 40)
+    print ("Team".ljust(12) + " | " + "Money" + " | " + "Slots" + " | " + "Max Bid")
+    print ('-' * 40)
+    for team in sorted(state.budgets.keys()):
+        slots = ROSTER_SLOTS - len(state.rosters[team])
+        print (team.ljust(12)                                  + " | " +
+               ("$%d" % state.budgets[team]).rjust(5)          + " | " +
+               ("%d" % slots).rjust(5)                         + " | " +
+               ("$%d" % max(state.budgets[team] - slots + 1, 0)).rjust(7))
+    print ('-' * 40)
+    print ("Dynamic Inflation: %.3f" % state.inflation())
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global LOG_FILE
+
+    rules_file  = ''
+    tier_method = "fixed"
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:l:m:r:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-l'):
+            LOG_FILE = arg
+        elif (opt == '-m'):
+            if ((arg == 'fixed') or (arg == 'cluster')):
+                tier_method = arg
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-r'):
+            rules_file = arg
+
+    if not IN_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    try:
+        use_settings(rules_file, tier_method)
+    except (ValueError, OSError) as e:
+        print ("Rules not applied: " + str(e))
+        sys.exit(2)
+    # Exports keep the layout of the file, auction or snake
+    player_table = load_table(IN_FILE)
+    draft   = DraftLog(LOG_FILE, player_table)
+    state   = draft.state
+    advisor = ff_nominate.NominationAdvisor(state)
+    if (VERBOSITY >= 1):
+        print (COMMANDS_MSG)
+        print_budgets(state)
+
+    while True:
+        line = input("Draft> ").strip()
+        if not line:
+            continue
+        cmd  = line[0].lower()
+        args = [arg.strip() for arg in line[1:].split(',')]
+
+        if (cmd == 'q'):
+            break
+        elif (cmd == 'u'):
+            if draft.undo():
+                if (VERBOSITY >= 1):
+                    ff_nominate.print_nominations(advisor.rank(NOMINATIONS))
+            else:
+                print ("Nothing to undo")
+        elif (cmd == 'r'):
+            if draft.redo():
+                if (VERBOSITY >= 1):
+                    ff_nominate.print_nominations(advisor.rank(NOMINATIONS))
+            else:
+                print ("Nothing to redo")
+        elif (cmd == 'b'):
+            print_budgets(state)
+        elif (cmd == 'a'):
+            count = int(args[0]) if args[0].isdigit() else NOMINATIONS
+            ff_nominate.print_nominations(advisor.rank(count))
+        elif (cmd == 'e') and args[0]:
+            state.assign_inflation()
+            with open(args[0], "w") as f:
+                ffdo.print_player_table(sorted(player_table, key=lambda player :
+                                        (player.marg_val, player.cus_fpts), reverse=True), f)
+            print ("File created: " + args[0])
+        elif (cmd in "nsp") and args[0]:
+            name  = find_player(state, args[0])
+            owner = find_team(state, args[1]) if (len(args) > 1) else None
+            if name is None:
+                print ("No player matching " + args[0])
+            elif (name in state.drafted) and (cmd != 'n'):
+                print (name + " already drafted by " + state.drafted[name][0])
+            elif (cmd == 'n'):
+                draft.nominate(name)
+            elif (cmd in "sp") and (len(args) > 1) and (owner is None):
+                print ("No team named " + args[1] + ", teams: " +
+                       ", ".join(sorted(state.budgets.keys())))
+            elif (cmd == 's') and (len(args) == 3):
+                try:
+                    price = int(args[2].replace('$', ''))
+                except ValueError:
+                    print (COMMANDS_MSG)
+                    continue
+                try:
+                    draft.sale(name, owner, price)
+                except ValueError as e:
+                    print ("Sale not logged: " + str(e))
+                    continue
+                if (VERBOSITY >= 1):
+                    ff_nominate.print_nominations(advisor.rank(NOMINATIONS))
+            elif (cmd == 'p') and (len(args) == 2):
+                draft.pick(name, owner)
+                if (VERBOSITY >= 1):
+                    ff_nominate.print_nominations(advisor.rank(NOMINATIONS))
+            else:
+                print (COMMANDS_MSG)
+        else:
+            print (COMMANDS_MSG)
+
+        if (VERBOSITY >= 2):
+            print ("Nominee: " + state.nominee + ", inflation %.3f" % state.inflation())
+
+    draft.close()
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -22,67 +22,135 @@
 
 # IMPORTS ===================================================================================
 import urllib.request
+import io
 import math
 import sys
 import getopt
 import os
 import re
+import time
 import config
+import ff_cache
+import ff_gamelogs
+import ff_keepers
+import ff_rules
 
 from html.parser import HTMLParser
 
 
 # GLOBALS ===================================================================================
-# League Info
-TOTAL_TEAMS      = config.teams
-AUCTION_MONEY    = config.auction_money
-ROSTER_SLOTS     = config.roster_slots
-TOTAL_MONEY      = AUCTION_MONEY * TOTAL_TEAMS
-DISCR_MONEY      = TOTAL_MONEY - (ROSTER_SLOTS * TOTAL_TEAMS)
-# Scoring
-PASS_CMP_PTS     = config.pass_completion
-PASS_YRD_PTS     = config.passing_yard
-PASS_TD_PTS      = config.passing_touchdown
-INT_PTS          = config.interception
-RUSH_ATT_PTS     = config.rushing_attempt
-RUSH_YRD_PTS     = config.rushing_yard
-RUSH_TD_PTS      = config.rushing_touchdown
-FUMB_PTS         = config.fumble
-RECEP_PTS        = config.reception
-REC_YRD_PTS      = config.receiving_yard
-REC_TD_PTS       = config.receiving_touchdown
-# Keepers
-KEEPER_SPENDINGS = config.keeper_money_used
-KEEPER_VALUE     = config.keeper_value
-KEEPER_INFLATION = (TOTAL_MONEY - KEEPER_SPENDINGS) / (TOTAL_MONEY - KEEPER_VALUE)
-# Marginal Scoring
-# ROSTER        = number of expected players drafted at that position (approximation)
-# TOP_RESERVE   = number of starters at position * 1.5
-# STARTER       = number of starters at position
-# ELITE_STARTER = number of starters at position * 0.5
-# NOTE: subtracted 1 for zero-based indexing
-QB_ROSTER        = math.ceil(config.teams * config.expected_drafted_qbs) - 1
-QB_TOP_RESERVE   = math.ceil(config.teams * config.starting_qbs * 1.5) - 1
-QB_STARTER       = math.ceil(config.teams * config.starting_qbs) - 1
-QB_ELITE_STARTER = math.ceil(config.teams * config.starting_qbs * 0.5) - 1
-RB_ROSTER        = math.ceil(config.teams * config.expected_drafted_rbs - 1) - 1
-RB_TOP_RESERVE   = math.ceil(config.teams * config.starting_rbs * 1.5) - 1
-RB_STARTER       = math.ceil(config.teams * config.starting_rbs) - 1
-RB_ELITE_STARTER = math.ceil(config.teams * config.starting_rbs * 0.5) - 1
-WR_ROSTER        = math.ceil(config.teams * config.expected_drafted_wrs - 1) - 1
-WR_TOP_RESERVE   = math.ceil(config.teams * config.starting_wrs * 1.5) - 1
-WR_STARTER       = math.ceil(config.teams * config.starting_wrs) - 1
-WR_ELITE_STARTER = math.ceil(config.teams * config.starting_wrs * 0.5) - 1
-TE_ROSTER        = math.ceil(config.teams * config.expected_drafted_tes - 1) - 1
-TE_TOP_RESERVE   = math.ceil(config.teams * config.starting_tes * 1.5) - 1
-TE_STARTER       = math.ceil(config.teams * config.starting_tes) - 1
-TE_ELITE_STARTER = math.ceil(config.teams * config.starting_tes * 0.5) - 1
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+# Projected stat columns on each position's projections page, between team and points
+STAT_COLUMNS     = {"QB" : ["pass_att", "pass_cmp", "pass_yds", "pass_tds", "pass_ints",
+                            "rush_att", "rush_yds", "rush_tds", "fmbls"],
+                    "RB" : ["rush_att", "rush_yds", "rush_tds", "rec_rec", "rec_yds",
+                            "rec_tds", "fmbls"],
+                    "WR" : ["rush_att", "rush_yds", "rush_tds", "rec_rec", "rec_yds",
+                            "rec_tds", "fmbls"],
+                    "TE" : ["rec_rec", "rec_yds", "rec_tds", "fmbls"]}
+# Keepers (selected from config.keeper_candidates once auction values are known)
+KEEPER_SPENDINGS = 0
+KEEPER_VALUE     = 0.0
+KEEPER_INFLATION = 1.0
+
+def load_settings():
+    # League settings derived from config.py. Called again after a rules file changes
+    # config (see ff_rules.py).
+    global TOTAL_TEAMS, AUCTION_MONEY, ROSTER_SLOTS, TOTAL_MONEY, DISCR_MONEY
+    global PASS_CMP_PTS, PASS_YRD_PTS, PASS_TD_PTS, INT_PTS, RUSH_ATT_PTS, RUSH_YRD_PTS
+    global RUSH_TD_PTS, FUMB_PTS, RECEP_PTS, REC_YRD_PTS, REC_TD_PTS, SCORING_WEIGHTS
+    global QB_ROSTER, QB_TOP_RESERVE, QB_STARTER, QB_ELITE_STARTER
+    global RB_ROSTER, RB_TOP_RESERVE, RB_STARTER, RB_ELITE_STARTER
+    global WR_ROSTER, WR_TOP_RESERVE, WR_STARTER, WR_ELITE_STARTER
+    global TE_ROSTER, TE_TOP_RESERVE, TE_STARTER, TE_ELITE_STARTER
+
+    # League Info
+    TOTAL_TEAMS      = config.teams
+    AUCTION_MONEY    = config.auction_money
+    ROSTER_SLOTS     = config.roster_slots
+    TOTAL_MONEY      = AUCTION_MONEY * TOTAL_TEAMS
+    DISCR_MONEY      = TOTAL_MONEY - (ROSTER_SLOTS * TOTAL_TEAMS)
+    # Scoring
+    PASS_CMP_PTS     = config.pass_completion
+    PASS_YRD_PTS     = config.passing_yard
+    PASS_TD_PTS      = config.passing_touchdown
+    INT_PTS          = config.interception
+    RUSH_ATT_PTS     = config.rushing_attempt
+    RUSH_YRD_PTS     = config.rushing_yard
+    RUSH_TD_PTS      = config.rushing_touchdown
+    FUMB_PTS         = config.fumble
+    RECEP_PTS        = config.reception
+    REC_YRD_PTS      = config.receiving_yard
+    REC_TD_PTS       = config.receiving_touchdown
+    # Scoring compiled to a weight per stat column for each position
+    stat_pts = {"pass_att"  : 0.0,
+                "pass_cmp"  : PASS_CMP_PTS,
+                "pass_yds"  : PASS_YRD_PTS,
+                "pass_tds"  : PASS_TD_PTS,
+                "pass_ints" : INT_PTS,
+                "rush_att"  : RUSH_ATT_PTS,
+                "rush_yds"  : RUSH_YRD_PTS,
+                "rush_tds"  : RUSH_TD_PTS,
+                "rec_rec"   : RECEP_PTS,
+                "rec_yds"   : REC_YRD_PTS,
+                "rec_tds"   : REC_TD_PTS,
+                "fmbls"     : FUMB_PTS}
+    SCORING_WEIGHTS  = {}
+    for position in STAT_COLUMNS:
+        SCORING_WEIGHTS[position] = [stat_pts[stat] for stat in STAT_COLUMNS[position]]
+    # Marginal Scoring
+    # ROSTER        = number of expected players drafted at that position (approximation)
+    # TOP_RESERVE   = number of starters at position * top_reserve_ratio (1.5)
+    # STARTER       = number of starters at position
+    # ELITE_STARTER = number of starters at position * elite_starter_ratio (0.5)
+    # NOTE: subtracted 1 for zero-based indexing
+    reserve_ratio    = config.top_reserve_ratio
+    elite_ratio      = config.elite_starter_ratio
+    QB_ROSTER        = math.ceil(config.teams * config.expected_drafted_qbs) - 1
+    QB_TOP_RESERVE   = math.ceil(config.teams * config.starting_qbs * reserve_ratio) - 1
+    QB_STARTER       = math.ceil(config.teams * config.starting_qbs) - 1
+    QB_ELITE_STARTER = math.ceil(config.teams * config.starting_qbs * elite_ratio) - 1
+    RB_ROSTER        = math.ceil(config.teams * config.expected_drafted_rbs - 1) - 1
+    RB_TOP_RESERVE   = math.ceil(config.teams * config.starting_rbs * reserve_ratio) - 1
+    RB_STARTER       = math.ceil(config.teams * config.starting_rbs) - 1
+    RB_ELITE_STARTER = math.ceil(config.teams * config.starting_rbs * elite_ratio) - 1
+    WR_ROSTER        = math.ceil(config.teams * config.expected_drafted_wrs - 1) - 1
+    WR_TOP_RESERVE   = math.ceil(config.teams * config.starting_wrs * reserve_ratio) - 1
+    WR_STARTER       = math.ceil(config.teams * config.starting_wrs) - 1
+    WR_ELITE_STARTER = math.ceil(config.teams * config.starting_wrs * elite_ratio) - 1
+    TE_ROSTER        = math.ceil(config.teams * config.expected_drafted_tes - 1) - 1
+    TE_TOP_RESERVE   = math.ceil(config.teams * config.starting_tes * reserve_ratio) - 1
+    TE_STARTER       = math.ceil(config.teams * config.starting_tes) - 1
+    TE_ELITE_STARTER = math.ceil(config.teams * config.starting_tes * elite_ratio) - 1
+
+def source_addresses( fantasypros_url, cbssports_url ):
+    # Source page addresses under each site's base URL
+    global PROJECTIONS_ADDR, QUAL_START_ADDR, DEPTH_CHART_ADDR, INJURY_ADDR
+    PROJECTIONS_ADDR = fantasypros_url + "/nfl/projections/"
+    QUAL_START_ADDR  = fantasypros_url + "/nfl/players/quality-starts.php?position="
+    DEPTH_CHART_ADDR = fantasypros_url + "/nfl/depth-charts.php"
+    INJURY_ADDR      = cbssports_url + "/nfl/injuries"
+
+load_settings()
+source_addresses(config.fantasypros_url, config.cbssports_url)
+FETCH_TIMEOUT    = config.fetch_timeout
 
 # Program Settings
 # 0 = minimal, 1 = chart display, 2 = all (debug messaging)
 VERBOSITY        = 1
 OUT_FILE         = ''
 DRAFT_TYPE       = "auction"
+TIER_METHOD      = "fixed"
+RULES_FILE       = ''
+WATCH_RULES      = False
+GAME_LOG_DIR     = ''
+VALUATION_CACHE  = ff_cache.config_cache()
+# Player fields stored in the valuation cache, by name so entries never depend on the
+# order attributes were set in
+CACHE_FIELDS     = ("name", "team", "pos", "cat", "fpts", "cus_fpts", "marg_val",
+                    "auct_val", "budget", "s_infl", "d_infl", "depth", "games", "qual_st",
+                    "qs_per", "injury", "status", "notes", "price", "real_val", "owner",
+                    "stats")
 HELP_MSG  = (
 "Usage: python ff_draft_organizer.py <-opt setting>\n"
 "-option      [description]\n"
@@ -90,6 +158,12 @@ HELP_MSG  = (
 "-v <0-2>     [verbosity, 0 = minimal, 1 = chart display (default), 2 = debug]\n"
 "-o <file>    [output file, tab separated value type, if not specified then none created]\n"
 "-t <type>    [draft type, use snake or auction (default)]\n"
+"-m <method>  [tier method, use fixed (default) or cluster for natural point breaks]\n"
+"-r <file>    [rules file, JSON league/scoring settings that override config.py]\n"
+"-w           [watch the rules file and rescore when it changes, Ctrl-C to exit]\n"
+"-u <url>     [base URL for every source page, e.g. a local ff_fixtures.py server]\n"
+"-g <dir>     [game logs directory, quality starts judged by config.py scoring instead]\n"
+"-c <dir>     [valuation cache directory, reuses valued tables (default config.py, off)]\n"
 )
 
 
@@ -315,6 +389,7 @@ class Player:
         self.price    = price
         self.real_val = real_val
         self.owner    = owner
+        self.stats    = []    # Parsed projection stats, in STAT_COLUMNS order
 
     def __repr__(self):
         return repr((self.name, self.team, self.pos, self.cat, self.fpts, self.cus_fpts,
@@ -324,21 +399,25 @@ class Player:
 
 
 # FUNCTIONS =================================================================================
-def parse_depth_charts():
-    if (VERBOSITY >= 2):
-        print ("Parsing depth charts...")
-    # Create the URL address and open it with urllib.request. Save the source as a
-    # string to be parsed.
-    addr = "http://www.fantasypros.com/nfl/depth-charts.php"
-    url = urllib.request.urlopen(addr)
-    if (VERBOSITY >= 2):
-        print ("Storing HTML source from: " + addr)
-    source = str(url.readlines())
-
-    # Create instance of HTML Parser and feed the source file to be parsed
+def read_lines( url ):
+    # url.readlines() with a limit on the total time. The socket timeout only limits each
+    # read, so a server trickling out bytes could otherwise hold a fetch forever. read1()
+    # (Python 3.5) returns what has arrived; read(n) would block until n bytes or the end.
+    deadline = time.perf_counter() + FETCH_TIMEOUT
+    chunks   = []
+    chunk    = url.read1(65536)
+    while chunk:
+        if (time.perf_counter() > deadline):
+            url.close()
+            raise TimeoutError("reading " + url.geturl() + " took over %d seconds" %
+                               FETCH_TIMEOUT)
+        chunks.append(chunk)
+        chunk = url.read1(65536)
+    return io.BytesIO(b''.join(chunks)).readlines()
+
+def depth_chart_rows( source ):
+    # [name, depth] rows from the depth charts page source
     parser = DC_HTMLParser()
-    if (VERBOSITY >= 2):
-        print ("Parsing HTML...")
     parser.feed(source)
 
     dc_table = []
@@ -348,24 +427,29 @@ def parse_depth_charts():
 
         dc_table.append([name, depth])
 
-    url.close()
     return dc_table
 
-def parse_injuries():
+def parse_depth_charts():
     if (VERBOSITY >= 2):
-        print ("Parsing injuries...")
+        print ("Parsing depth charts...")
     # Create the URL address and open it with urllib.request. Save the source as a
     # string to be parsed.
-    addr = "http://www.cbssports.com/nfl/injuries"
-    url = urllib.request.urlopen(addr)
+    addr = DEPTH_CHART_ADDR
+    url = urllib.request.urlopen(addr, timeout=FETCH_TIMEOUT)
     if (VERBOSITY >= 2):
         print ("Storing HTML source from: " + addr)
-    source = str(url.readlines())
+    source = str(read_lines(url))
 
-    # Create instance of HTML Parser and feed the source file to be parsed
-    parser = Injury_HTMLParser()
     if (VERBOSITY >= 2):
         print ("Parsing HTML...")
+    dc_table = depth_chart_rows(source)
+
+    url.close()
+    return dc_table
+
+def injury_rows( source ):
+    # [name, injury, status] rows for QB/RB/WR/TE from the injuries page source
+    parser = Injury_HTMLParser()
     parser.feed(source)
 
     inj_table = []
@@ -381,6 +465,23 @@ def parse_injuries():
         if ((pos == "RB") or (pos == "QB") or (pos == "WR") or (pos == "TE")):
             inj_table.append([name, merge, status])
 
+    return inj_table
+
+def parse_injuries():
+    if (VERBOSITY >= 2):
+        print ("Parsing injuries...")
+    # Create the URL address and open it with urllib.request. Save the source as a
+    # string to be parsed.
+    addr = INJURY_ADDR
+    url = urllib.request.urlopen(addr, timeout=FETCH_TIMEOUT)
+    if (VERBOSITY >= 2):
+        print ("Storing HTML source from: " + addr)
+    source = str(read_lines(url))
+
+    if (VERBOSITY >= 2):
+        print ("Parsing HTML...")
+    inj_table = injury_rows(source)
+
     url.close()
     return inj_table
 
@@ -389,11 +490,11 @@ def parse_quality_starts( position ):
         print ("Parsing quality starts...")
     # Create the URL address and open it with urllib.request. Save the source as a
     # string to be parsed.
-    addr = "http://www.fantasypros.com/nfl/players/quality-starts.php?position=" + position
-    url = urllib.request.urlopen(addr)
+    addr = QUAL_START_ADDR + position
+    url = urllib.request.urlopen(addr, timeout=FETCH_TIMEOUT)
     if (VERBOSITY >= 2):
         print ("Storing HTML source from: " + addr)
-    source = str(url.readlines())
+    source = str(read_lines(url))
 
     # Create instance of HTML Parser and feed the source file to be parsed
     parser = QS_HTMLParser()
@@ -419,11 +520,11 @@ def parse_projections( position ):
         print ("Parsing projections...")
     # Create the URL address and open it with urllib.request. Save the source as a
     # string to be parsed.
-    addr = "http://www.fantasypros.com/nfl/projections/" + position + ".php"
-    url = urllib.request.urlopen(addr)
+    addr = PROJECTIONS_ADDR + position + ".php"
+    url = urllib.request.urlopen(addr, timeout=FETCH_TIMEOUT)
     if (VERBOSITY >= 2):
         print ("Storing HTML source from: " + addr)
-    source = str(url.readlines())
+    source = str(read_lines(url))
 
     # Create instance of HTML Parser and feed the source file to be parsed
     parser = Projections_HTMLParser()
@@ -444,7 +545,7 @@ def parse_projections( position ):
     url.close()
     return parser.players
 
-def assign_quality_starts( player_table ):
+def site_quality_starts():
     qs_table   = []
     tmp_table  = parse_quality_starts("QB")
     qs_table.extend(tmp_table)
@@ -454,6 +555,22 @@ def assign_quality_starts( player_table ):
     qs_table.extend(tmp_table)
     tmp_table  = parse_quality_starts("TE")
     qs_table.extend(tmp_table)
+    return qs_table
+
+def game_log_quality_starts( path ):
+    # Quality starts from weekly game logs under the custom scoring (ff_gamelogs.py)
+    logs, skipped = ff_gamelogs.read_game_logs(path, STAT_COLUMNS)
+    for (log_file, number) in skipped:
+        if (VERBOSITY >= 2):
+            print ("WARNING: line %d of " % number + log_file + " is not a game, skipped!")
+    return ff_gamelogs.quality_starts(logs, SCORING_WEIGHTS, ff_gamelogs.start_thresholds(),
+                                      config.good_start_weight, config.great_start_weight)
+
+def assign_quality_starts( player_table ):
+    if GAME_LOG_DIR:
+        qs_table = game_log_quality_starts(GAME_LOG_DIR)
+    else:
+        qs_table = site_quality_starts()
 
     name_match = False
 
@@ -506,6 +623,41 @@ def assign_injuries( player_table ):
                 print ("WARNING: " + name + " from injury chart table \
                         not found in player table!")
 
+def assign_keepers( player_table ):
+    global KEEPER_SPENDINGS
+    global KEEPER_VALUE
+    global KEEPER_INFLATION
+
+    # Clear keepers from an earlier valuation of the same players
+    for player in player_table:
+        if (player.notes == "Keeper"):
+            player.price = ""
+            player.owner = ""
+            player.notes = ""
+
+    # Pick each team's keepers with the current auction values and mark them as owned
+    keepers, missing, duplicates = ff_keepers.select_keepers(player_table)
+    for name in missing:
+        if (VERBOSITY >= 2):
+            print ("WARNING: " + name + " from keeper candidates matches no player or " +
+                   "several in player table!")
+    for (name, team, earlier) in duplicates:
+        if (VERBOSITY >= 1):
+            print ("WARNING: " + name + " is a keeper candidate of " + earlier + " and " +
+                   team + ", only " + earlier + " may keep the player!")
+
+    for team in keepers:
+        for (player, price, value) in keepers[team]:
+            player.price = "$%d" % price
+            player.owner = team
+            player.notes = "Keeper"
+            if (VERBOSITY >= 2):
+                print ("Keeper: " + team.ljust(10) + player.name.ljust(30) + "$%d" % price)
+
+    KEEPER_SPENDINGS, KEEPER_VALUE = ff_keepers.keeper_totals(keepers)
+    KEEPER_INFLATION = ff_keepers.keeper_inflation(KEEPER_SPENDINGS, KEEPER_VALUE,
+                                                   TOTAL_MONEY)
+
 def assign_marginal_value( player_table, tier_val, total_marg_val ):
     for player in player_table:
         if (player.cus_fpts - tier_val[0]) >= 0:
@@ -525,30 +677,98 @@ def assign_marginal_value( player_table, tier_val, total_marg_val ):
 
     return total_marg_val
 
-def player_tiers( position, player_table ):
+def cluster_cost( s1, s2, j, i ):
+    # Sum of squared deviations of sorted values j..i using prefix sums
+    n    = i - j + 1
+    tot  = s1[i + 1] - s1[j]
+    return (s2[i + 1] - s2[j]) - (tot * tot / n)
+
+def cluster_fill_row( q, imin, imax, jmin, jmax, s1, s2, cost, back ):
+    # Divide and conquer fill of one dynamic programming row. The optimal start of the
+    # last cluster is monotone in i, so each level only scans its part of [jmin, jmax].
+    if (imin > imax):
+        return
+    i     = (imin + imax) // 2
+    lo    = max(q, jmin)
+    hi    = min(i, jmax)
+    best  = None
+    b_j   = lo
+    for j in range(lo, hi + 1):
+        val = cost[q - 1][j - 1] + cluster_cost(s1, s2, j, i)
+        if (best is None) or (val < best):
+            best = val
+            b_j  = j
+    cost[q][i] = best
+    back[q][i] = b_j
+    cluster_fill_row(q, imin, i - 1, jmin, b_j, s1, s2, cost, back)
+    cluster_fill_row(q, i + 1, imax, b_j, jmax, s1, s2, cost, back)
+
+def optimal_breaks( values, k ):
+    # Optimal 1D k-means clustering (Ckmeans.1d.dp) of ascending sorted values in
+    # O(k*n*log(n)). Returns the start index of each of the k clusters.
+    n = len(values)
+    k = min(k, n)
+    if (k <= 0):
+        return []
+
+    s1 = [0.0] * (n + 1)
+    s2 = [0.0] * (n + 1)
+    for i in range(n):
+        s1[i + 1] = s1[i] + values[i]
+        s2[i + 1] = s2[i] + (values[i] * values[i])
+
+    cost = [[0.0] * n for q in range(k)]
+    back = [[0] * n for q in range(k)]
+    for i in range(n):
+        cost[0][i] = cluster_cost(s1, s2, 0, i)
+    for q in range(1, k):
+        cluster_fill_row(q, q, n - 1, q, n - 1, s1, s2, cost, back)
+
+    # Backtrack cluster starting points from the last value
+    starts = [0] * k
+    i      = n - 1
+    for q in range(k - 1, -1, -1):
+        starts[q] = back[q][i]
+        i         = starts[q] - 1
+
+    return starts
+
+def cluster_tiers( r, player_table ):
+    # Finds natural breaks in the expected drafted pool (table sorted descending on custom
+    # fantasy points down to the roster cut-off). Returns indexes of the lowest player in
+    # each tier [roster, top reserve, starter, elite starter].
+    r      = min(r, len(player_table) - 1)
+    values = [player.cus_fpts for player in reversed(player_table[:r + 1])]
+    starts = optimal_breaks(values, 4)
+    while (len(starts) < 4):
+        starts.append(starts[-1])
+
+    return [r - start for start in starts]
+
+def tier_indices( position ):
+    # Roster, top reserve, starter and elite starter cut-off indices for a position
     if ( position == "QB" ):
-        r  = QB_ROSTER
-        tr = QB_TOP_RESERVE
-        s  = QB_STARTER
-        es = QB_ELITE_STARTER
+        return QB_ROSTER, QB_TOP_RESERVE, QB_STARTER, QB_ELITE_STARTER
     elif (position == "RB" ):
-        r  = RB_ROSTER
-        tr = RB_TOP_RESERVE
-        s  = RB_STARTER
-        es = RB_ELITE_STARTER
+        return RB_ROSTER, RB_TOP_RESERVE, RB_STARTER, RB_ELITE_STARTER
     elif (position == "WR" ):
-        r  = WR_ROSTER
-        tr = WR_TOP_RESERVE
-        s  = WR_STARTER
-        es = WR_ELITE_STARTER
+        return WR_ROSTER, WR_TOP_RESERVE, WR_STARTER, WR_ELITE_STARTER
     elif (position == "TE" ):
-        r  = TE_ROSTER
-        tr = TE_TOP_RESERVE
-        s  = TE_STARTER
-        es = TE_ELITE_STARTER
+        return TE_ROSTER, TE_TOP_RESERVE, TE_STARTER, TE_ELITE_STARTER
     else:
         print (" *** ERROR: " + position + " not valid!")
 
+def player_tiers( position, player_table, drafted = 0 ):
+    # Cut-offs move up by the players of the position already drafted (live re-tiering
+    # of the remaining pool), and never past the end of a short table
+    last = len(player_table) - 1
+    r, tr, s, es = [min(max(i - drafted, 0), last) for i in tier_indices(position)]
+
+    # Natural breaks keep the roster cut-off from config.py but place the upper tiers
+    # at the largest gaps in the point distribution
+    if (TIER_METHOD == "cluster"):
+        r, tr, s, es = cluster_tiers(r, player_table)
+
     tier_val = [player_table[r].cus_fpts,
                 player_table[tr].cus_fpts,
                 player_table[s].cus_fpts,
@@ -567,7 +787,310 @@ def player_tiers( position, player_table ):
 
     return tier_val
 
+def retier_players( position, player_table, drafted = 0 ):
+    # Re-tier a position table (e.g. with the drafted players removed, drafted of them)
+    # and reassign marginal value from scratch. Returns the total marginal value of the
+    # position.
+    for player in player_table:
+        player.cat      = ""
+        player.marg_val = 0.0
+
+    if not player_table:
+        return 0.0
+
+    tier_val = player_tiers(position, player_table, drafted)
+    return assign_marginal_value(player_table, tier_val, 0.0)
+
+def score_stats( position, stats ):
+    # Custom fantasy points from projected stats and the compiled scoring weights
+    cus_fpts = 0.0
+    for (weight, stat) in zip(SCORING_WEIGHTS[position], stats):
+        cus_fpts += weight * stat
+    return cus_fpts
+
+def projection_stats( position, player ):
+    # Name, team, stats in STAT_COLUMNS order and site fantasy points from a parsed
+    # projections row
+    columns = STAT_COLUMNS[position]
+    name    = player[0].replace("\\'","")
+    team    = player[1]
+    stats   = [float(stat.replace(',','')) for stat in player[2:2 + len(columns)]]
+    fpts    = player[2 + len(columns)].replace(',','')
+    return name, team, stats, fpts
+
+def build_position_table( position, player_table ):
+    # Player objects for one position from parsed projection rows, sorted on custom
+    # fantasy points. Stats are kept on each player so scoring can be reapplied.
+    tmp_table = []
+    for player in player_table:
+        name, team, stats, fpts = projection_stats(position, player)
+
+        new_player = Player(name, team, position, "", fpts, 0.0, 0.0, 0.0,
+                            0.0, 0.0, "", "", 0, 0.0, "", "", "", "", "", "", "")
+        new_player.stats    = stats
+        new_player.cus_fpts = score_stats(position, stats)
+        tmp_table.append(new_player)
+
+    return sorted(tmp_table, key=lambda player: player.cus_fpts, reverse=True)
+
+def score_players( player_table ):
+    # Reapply scoring to already parsed stats (no network access)
+    for player in player_table:
+        player.cus_fpts = score_stats(player.pos, player.stats)
+
+def value_players( player_table ):
+    # Tiers, marginal value, auction value and keeper inflation for all players.
+    # Returns the players sorted on marginal value and the total marginal value.
+    total_marg_val = 0.0
+    all_player_table = []
+    for position in POSITIONS:
+        pos_table = sorted([player for player in player_table if (player.pos == position)],
+                           key=lambda player: player.cus_fpts, reverse=True)
+        if not pos_table:
+            continue
+
+        if (VERBOSITY >= 2):
+            print ("Creating " + position + " player tiers and marginal value...")
+        total_marg_val += retier_players(position, pos_table)
+
+        if (VERBOSITY >= 2):
+            print ("Printing player table...")
+            print_player_table (pos_table)
+        all_player_table.extend(pos_table)
+
+    if (DRAFT_TYPE == "auction"):
+        marg_pts_per_dollar = total_marg_val / DISCR_MONEY
+
+        if (VERBOSITY >= 2):
+            print ("Applying auction value and budget percentage...")
+        for player in all_player_table:
+            # Calculate remaining values
+            player.auct_val = math.ceil((player.marg_val / marg_pts_per_dollar) + 1)
+            player.budget   = ( player.auct_val / AUCTION_MONEY ) * 100
+
+        # Keepers depend on auction values, so inflation follows them
+        if (VERBOSITY >= 2):
+            print ("Selecting keepers and applying static inflation...")
+        assign_keepers( all_player_table )
+        for player in all_player_table:
+            player.s_infl   = player.auct_val * KEEPER_INFLATION
+
+    if (VERBOSITY >= 2):
+        print ("Sorting all players by marginal value, then custom fantasy points...")
+    all_player_table = sorted(all_player_table, key=lambda player : (player.marg_val,
+                              player.cus_fpts), reverse=True)
+
+    return all_player_table, total_marg_val
+
+def valuation_rows( player_table ):
+    # Each player's fields that value_players reads or passes through, for the cache key.
+    # Fields it recomputes are left out, as are the keepers it reselects.
+    rows = []
+    for p in player_table:
+        row = [p.name, p.team, p.pos, p.fpts, p.cus_fpts, p.stats, p.d_infl, p.depth,
+               p.games, p.qual_st, p.qs_per, p.injury, p.status, p.real_val]
+        if (p.notes != "Keeper"):
+            row += [p.notes, p.price, p.owner]
+        if (DRAFT_TYPE != "auction"):
+            row += [p.auct_val, p.budget, p.s_infl]
+        rows.append(row)
+    return rows
+
+def cached_value_players( player_table ):
+    # value_players through the valuation cache (ff_cache.py). A hit returns new Player
+    # objects and restores the keeper totals, exactly as value_players would have left them.
+    global KEEPER_SPENDINGS
+    global KEEPER_VALUE
+    global KEEPER_INFLATION
+
+    if VALUATION_CACHE is None:
+        return value_players( player_table )
+
+    key    = ff_cache.valuation_key(valuation_rows(player_table), DRAFT_TYPE, TIER_METHOD)
+    result = VALUATION_CACHE.get(key)
+    if (result is not None) and (tuple(result.get("fields", ())) == CACHE_FIELDS):
+        if (VERBOSITY >= 2):
+            print ("Valuation cache hit: " + key[:12])
+        all_player_table = []
+        for row in result["players"]:
+            values = dict(zip(CACHE_FIELDS, row))
+            stats  = values.pop("stats")
+            player = Player(**values)
+            player.stats = stats
+            all_player_table.append(player)
+        if (DRAFT_TYPE == "auction"):
+            KEEPER_SPENDINGS, KEEPER_VALUE, KEEPER_INFLATION = result["keepers"]
+        return all_player_table, result["total_marg_val"]
+
+    all_player_table, total_marg_val = value_players( player_table )
+    VALUATION_CACHE.put(key, {"fields"         : CACHE_FIELDS,
+                              "players"        : [[getattr(player, field)
+                                                   for field in CACHE_FIELDS]
+                                                  for player in all_player_table],
+                              "total_marg_val" : total_marg_val,
+                              "keepers"        : [KEEPER_SPENDINGS, KEEPER_VALUE,
+                                                  KEEPER_INFLATION]})
+    return all_player_table, total_marg_val
+
+def watch_rules( player_table, poll = 1.0 ):
+    # Rescore and revalue the parsed players each time the rules file changes
+    watcher = ff_rules.RulesWatcher(RULES_FILE)
+    print ("Watching " + RULES_FILE + " for changes, Ctrl-C to exit")
+    try:
+        while True:
+            time.sleep(poll)
+            if not watcher.changed():
+                continue
+
+            start = time.perf_counter()
+            try:
+                ff_rules.apply_rules(ff_rules.load_rules(RULES_FILE))
+            except (ValueError, TypeError, OSError) as e:
+                print ("Rules not applied: " + str(e))
+                continue
+            load_settings()
+            score_players( player_table )
+            # Game log quality starts depend on the scoring too
+            if GAME_LOG_DIR:
+                assign_quality_starts( player_table )
+            player_table, total_marg_val = cached_value_players( player_table )
+            print_calculations( total_marg_val )
+
+            if OUT_FILE:
+                with open(OUT_FILE, "w") as f:
+                    print_player_table (player_table, f)
+            else:
+                print_player_table (player_table)
+            print ("Rescored %d players in %.1f ms" % (len(player_table),
+                   (time.perf_counter() - start) * 1000))
+    except KeyboardInterrupt:
+        pass
+
+def print_calculations( total_marg_val ):
+    if (DRAFT_TYPE == "auction") and (VERBOSITY >= 1):
+        print ('\n===== CALCULATIONS ======')
+        print ("Total Marginal Value   : " + "%.3f" % total_marg_val)
+        print ("Marg. Points Per Dollar: " + "%.3f" % (total_marg_val / DISCR_MONEY))
+        print ("Keeper Money Spent     : " + "$%d" % KEEPER_SPENDINGS)
+        print ("Keeper Value           : " + "$%d" % KEEPER_VALUE)
+        print ("Keeper Value Inflation : " + "%.3f" % KEEPER_INFLATION)
+
+def load_player_table( in_file ):
+    # Reads a tab delimited player table written by print_player_table (auction or snake
+    # layout, with Purchase Price and Owner possibly filled in during the draft) back into
+    # a list of Player objects
+    columns = {"Player Name"              : "name",
+               "Team"                     : "team",
+               "Position"                 : "pos",
+               "Category"                 : "cat",
+               "Projected Fantasy Points" : "fpts",
+               "Custom Fantasy Points"    : "cus_fpts",
+               "Marginal Value"           : "marg_val",
+               "Auction Value"            : "auct_val",
+               "Budget Percentage"        : "budget",
+               "Static Inflation"         : "s_infl",
+               "Dynamic Inflation"        : "d_infl",
+               "Depth Chart"              : "depth",
+               "Games Played Last Season" : "games",
+               "Quality Start (Max:100)"  : "qual_st",
+               "Quality Start Percentage" : "qs_per",
+               "Injury"                   : "injury",
+               "Status"                   : "status",
+               "Notes"                    : "notes",
+               "Purchase Price"           : "price",
+               "Realized Value"           : "real_val",
+               "Owner"                    : "owner"}
+    numbers = {"cus_fpts" : float,
+               "marg_val" : float,
+               "auct_val" : int,
+               "budget"   : float,
+               "s_infl"   : float,
+               "games"    : int,
+               "qual_st"  : float}
+
+    player_table = []
+    header       = []
+    for line in in_file:
+        row = line.rstrip('\r\n').split('\t')
+        if not header:
+            header = [columns.get(col, "") for col in row]
+            continue
+        if not row[0]:
+            continue
+
+        player = Player("", "", "", "", "", 0.0, 0.0, 0, 0.0, 0.0, "", "", 0, 0.0, "",
+                        "", "", "", "", "", "")
+        for (attr, data) in zip(header, row):
+            if not attr:
+                continue
+            if attr in numbers:
+                data = data.replace('$', '').replace('%', '').replace(',', '')
+                data = numbers[attr](float(data)) if data else numbers[attr](0)
+            setattr(player, attr, data)
+        player_table.append(player)
+
+    return player_table
+
+def table_draft_type( in_file ):
+    # "auction" or "snake" layout of a tab delimited player table, from its header line
+    header = in_file.readline().rstrip('\r\n').split('\t')
+    return "auction" if ("Auction Value" in header) else "snake"
+
+def console_header():
+    # Header lines of the console player table
+    if (DRAFT_TYPE == "auction"):
+        #TODO
+#        print ("Po=Position, Ca=Category, FP=Fantasy Points, Custom=Customized Fantasy Points "
+        return ['-' * 130,
+                '-' * 130,
+                '  # | ' + "Player Name".center(30) + ' | ' + "Team " + ' | '
+                + "Po" + ' | ' + "Ca" + ' | ' + " FP  " + ' | ' + "Custom" +
+                ' | ' + "Margin" + ' | ' + " AV " + ' | ' + "Budg%" + ' | ' +
+                "Inf" + ' | ' + "DC " + ' | ' + " GP " + ' | ' + " QS  " +
+                ' | ' + " QS%" + ' | ',
+                '-' * 130]
+    else: # Snake draft
+        return ['-' * 110,
+                '  # | ' + "Player Name".center(30) + ' | ' + "Team " + ' | '
+                + "P." + ' | ' + "C." + ' | ' + "FPts." + ' | ' + "Cust. " +
+                ' | ' + "Marg. " + ' | ' + "DC " + ' | ' + "Gms." + ' | ' +
+                " Q.S." + ' | ' + " QS%" + ' | ',
+                '-' * 110]
+
+def console_row( i, player ):
+    # One line of the console player table for the player ranked i
+    if (DRAFT_TYPE == "auction"):
+        return ("%3d" % i                        + ' | ' +
+                player.name.ljust(30)            + ' | ' +
+                player.team.ljust(5)             + ' | ' +
+                player.pos                       + ' | ' +
+                player.cat.ljust(2)              + ' | ' +
+                player.fpts.rjust(5)             + ' | ' +
+                "%6.2f"   % player.cus_fpts      + ' | ' +
+                "%6.2f"   % player.marg_val      + ' | ' +
+                "$%d"     % int(player.auct_val) + ' | ' +
+                "%5.1f%%" % player.budget        + ' | ' +
+                "$%d"     % int(player.s_infl)   + ' | ' +
+                player.depth.rjust(3)            + ' | ' +
+                "%4d"     % player.games         + ' | ' +
+                "%5.2f"   % player.qual_st       + ' | ' +
+                player.qs_per.rjust(4)           + ' | ' )
+    else: # Snake draft
+        return ("%3d" % i                      + ' | ' +
+                player.name.ljust(30)          + ' | ' +
+                player.team.ljust(5)           + ' | ' +
+                player.pos                     + ' | ' +
+                player.cat.ljust(2)            + ' | ' +
+                player.fpts.rjust(5)           + ' | ' +
+                "%6.2f" % player.cus_fpts      + ' | ' +
+                "%6.2f" % player.marg_val      + ' | ' +
+                player.depth.rjust(3)          + ' | ' +
+                "%4d"   % player.games         + ' | ' +
+                "%5.2f" % player.qual_st       + ' | ' +
+                player.qs_per.rjust(4)         + ' | ' )
+
 def print_player_table( player_table, out_file = False ):
+    lines = []
     i = 1
     for player in player_table:
         if (out_file):
@@ -652,69 +1175,25 @@ def print_player_table( player_table, out_file = False ):
 
 
         if (VERBOSITY >= 1):
-            if (DRAFT_TYPE == "auction"):
-                if (i == 1):
-                    print ('-' * 130)
-                    #TODO
-#                    print ("Po=Position, Ca=Category, FP=Fantasy Points, Custom=Customized Fantasy Points "
-                    print ('-' * 130)
-                    print ('  # | ' + "Player Name".center(30) + ' | ' + "Team " + ' | '
-                            + "Po" + ' | ' + "Ca" + ' | ' + " FP  " + ' | ' + "Custom" +
-                            ' | ' + "Margin" + ' | ' + " AV " + ' | ' + "Budg%" + ' | ' +
-                            "Inf" + ' | ' + "DC " + ' | ' + " GP " + ' | ' + " QS  " +
-                            ' | ' + " QS%" + ' | ')
-                    print ('-' * 130)
-
-                print ("%3d" % i                        + ' | ' +
-                       player.name.ljust(30)            + ' | ' +
-                       player.team.ljust(5)             + ' | ' +
-                       player.pos                       + ' | ' +
-                       player.cat.ljust(2)              + ' | ' +
-                       player.fpts.rjust(5)             + ' | ' +
-                       "%6.2f"   % player.cus_fpts      + ' | ' +
-                       "%6.2f"   % player.marg_val      + ' | ' +
-                       "$%d"     % int(player.auct_val) + ' | ' +
-                       "%5.1f%%" % player.budget        + ' | ' +
-                       "$%d"     % int(player.s_infl)   + ' | ' +
-                       player.depth.rjust(3)            + ' | ' +
-                       "%4d"     % player.games         + ' | ' +
-                       "%5.2f"   % player.qual_st       + ' | ' +
-                       player.qs_per.rjust(4)           + ' | ' )
-
-            else: # Snake draft
-                if (i == 1):
-                    print ('-' * 110)
-                    print ('  # | ' + "Player Name".center(30) + ' | ' + "Team " + ' | '
-                            + "P." + ' | ' + "C." + ' | ' + "FPts." + ' | ' + "Cust. " +
-                            ' | ' + "Marg. " + ' | ' + "DC " + ' | ' + "Gms." + ' | ' +
-                            " Q.S." + ' | ' + " QS%" + ' | ')
-                    print ('-' * 110)
-
-                print ("%3d" % i                      + ' | ' +
-                       player.name.ljust(30)          + ' | ' +
-                       player.team.ljust(5)           + ' | ' +
-                       player.pos                     + ' | ' +
-                       player.cat.ljust(2)            + ' | ' +
-                       player.fpts.rjust(5)           + ' | ' +
-                       "%6.2f" % player.cus_fpts      + ' | ' +
-                       "%6.2f" % player.marg_val      + ' | ' +
-                       player.depth.rjust(3)          + ' | ' +
-                       "%4d"   % player.games         + ' | ' +
-                       "%5.2f" % player.qual_st       + ' | ' +
-                       player.qs_per.rjust(4)         + ' | ' )
+            if (i == 1):
+                lines.extend(console_header())
+            lines.append(console_row(i, player))
 
         i += 1
 
+    # One write for the whole table instead of a print per row
+    if lines:
+        print ('\n'.join(lines))
+
 
 # MAIN ======================================================================================
 def main(argv):
 
     all_player_table = []
-    tmp_table        = []
     total_marg_val   = 0.0
 
     try:
-        opts, args = getopt.getopt(argv,"hv:o:t:")
+        opts, args = getopt.getopt(argv,"hv:o:t:m:r:wu:g:c:")
     except getopt.GetoptError:
         print (HELP_MSG)
         sys.exit(2)
@@ -739,6 +1218,42 @@ def main(argv):
             else:
                 print (HELP_MSG)
                 sys.exit(2)
+        elif (opt == '-m'):
+            global TIER_METHOD
+            if ((arg == 'fixed') or (arg == 'cluster')):
+                TIER_METHOD = arg
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-r'):
+            global RULES_FILE
+            RULES_FILE = arg
+        elif (opt == '-w'):
+            global WATCH_RULES
+            WATCH_RULES = True
+        elif (opt == '-u'):
+            source_addresses(arg.rstrip('/'), arg.rstrip('/'))
+        elif (opt == '-g'):
+            global GAME_LOG_DIR
+            GAME_LOG_DIR = arg
+        elif (opt == '-c'):
+            global VALUATION_CACHE
+            VALUATION_CACHE = ff_cache.config_cache(arg)
+
+    if WATCH_RULES and not RULES_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    # Rules file settings replace config.py settings
+    if RULES_FILE:
+        try:
+            ff_rules.apply_rules(ff_rules.load_rules(RULES_FILE))
+        except ValueError as e:
+            print (e)
+            sys.exit(2)
+        load_settings()
+        if (VERBOSITY >= 2):
+            print ("Rules applied from", RULES_FILE)
 
     if not OUT_FILE:
         print ("No output file selected, skipping file write")
@@ -765,220 +1280,18 @@ def main(argv):
             f = open(OUT_FILE, "w")
 
 
-    # QBs ===================================================================================
-    if (VERBOSITY >= 0):
-        print ('\n========== QBs ==========')
-
-    player_table = parse_projections("qb")
-
-    # Apply stats for each player
-    if (VERBOSITY >= 2):
-        print ("Building QB position table...")
-    for player in player_table:
-        name      = player[0].replace("\\'","")
-        team      = player[1]
-        pass_att  = player[2].replace(',','')
-        pass_cmp  = player[3].replace(',','')
-        pass_yds  = player[4].replace(',','')
-        pass_tds  = player[5].replace(',','')
-        pass_ints = player[6].replace(',','')
-        rush_att  = player[7].replace(',','')
-        rush_yds  = player[8].replace(',','')
-        rush_tds  = player[9].replace(',','')
-        fmbls     = player[10].replace(',','')
-        fpts      = player[11].replace(',','')
-        cus_fpts  = ((PASS_CMP_PTS * float(pass_cmp )) +
-                     (PASS_YRD_PTS * float(pass_yds )) +
-                     (PASS_TD_PTS  * float(pass_tds )) +
-                     (INT_PTS      * float(pass_ints)) +
-                     (RUSH_ATT_PTS * float(rush_att )) +
-                     (RUSH_YRD_PTS * float(rush_yds )) +
-                     (RUSH_TD_PTS  * float(rush_tds )) +
-                     (FUMB_PTS     * float(fmbls    )))
-
-        tmp_table.append(Player(name, team, "QB", "", fpts, cus_fpts, 0.0, 0.0,
-                                0.0, 0.0, "", "", 0, 0.0, "", "", "", "", "", "", ""))
-
-    # Apply position table as temporary table sorted on custom fantasy points
-    if (VERBOSITY >= 2):
-        print ("Sorting table by custom fantasy points...")
-    qb_table = sorted(tmp_table, key=lambda player: player.cus_fpts, reverse=True)
-
-    # Apply algorithm for player tiers for position
-    if (VERBOSITY >= 2):
-        print ("Creating player tiers...")
-    qb_tier_val = player_tiers ("QB", qb_table)
-
-    # Apply marginal value calculation
-    if (VERBOSITY >= 2):
-        print ("Assigning marginal value...")
-    total_marg_val = assign_marginal_value (qb_table, qb_tier_val, total_marg_val)
-
-    if (VERBOSITY >= 2):
-        print ("Printing player table...")
-        print_player_table (qb_table)
-
-    # Clear temporary table, add position to all-players list
-    tmp_table = []
-    all_player_table.extend(qb_table)
-
-    # RBs ===================================================================================
-    if (VERBOSITY >= 0):
-        print ('\n========== RBs ==========')
-
-    player_table = parse_projections("rb")
-
-    # Apply stats for each player
-    if (VERBOSITY >= 2):
-        print ("Building RB position table...")
-    for player in player_table:
-        name     = player[0].replace("\\'","")
-        team     = player[1]
-        rush_att = player[2].replace(',','')
-        rush_yds = player[3].replace(',','')
-        rush_tds = player[4].replace(',','')
-        rec_rec  = player[5].replace(',','')
-        rec_yds  = player[6].replace(',','')
-        rec_tds  = player[7].replace(',','')
-        fmbls    = player[8].replace(',','')
-        fpts     = player[9].replace(',','')
-        cus_fpts = ((RUSH_ATT_PTS * float(rush_att)) +
-                    (RUSH_YRD_PTS * float(rush_yds)) +
-                    (RUSH_TD_PTS  * float(rush_tds)) +
-                    (RECEP_PTS    * float(rec_rec )) +
-                    (REC_YRD_PTS  * float(rec_yds )) +
-                    (REC_TD_PTS   * float(rec_tds )) +
-                    (FUMB_PTS     * float(fmbls   )))
-
-        tmp_table.append(Player(name, team, "RB", "", fpts, cus_fpts, 0.0, 0.0,
-                                0.0, 0.0, "", "", 0, 0.0, "", "", "", "", "", "", ""))
-
-    # Apply position table as temporary table sorted on custom fantasy points
-    if (VERBOSITY >= 2):
-        print ("Sorting table by custom fantasy points...")
-    rb_table = sorted(tmp_table, key=lambda player: player.cus_fpts, reverse=True)
-
-    # Apply algorithm for player tiers for position
-    if (VERBOSITY >= 2):
-        print ("Creating player tiers...")
-    rb_tier_val = player_tiers ("RB", rb_table)
-
-    # Apply marginal value calculation
-    if (VERBOSITY >= 2):
-        print ("Assigning marginal value...")
-    total_marg_val = assign_marginal_value (rb_table, rb_tier_val, total_marg_val)
-
-    if (VERBOSITY >= 2):
-        print ("Printing player table...")
-        print_player_table (rb_table)
-
-    # Clear temporary table, add position to all-players list, close URL
-    tmp_table = []
-    all_player_table.extend(rb_table)
-
-    # WRs ===================================================================================
-    if (VERBOSITY >= 0):
-        print ('\n========== WRs ==========')
-
-    player_table = parse_projections("wr")
-
-    # Apply stats for each player
-    if (VERBOSITY >= 2):
-        print ("Building WR position table...")
-    for player in player_table:
-        name     = player[0].replace("\\'","")
-        team     = player[1]
-        rush_att = player[2].replace(',','')
-        rush_yds = player[3].replace(',','')
-        rush_tds = player[4].replace(',','')
-        rec_rec  = player[5].replace(',','')
-        rec_yds  = player[6].replace(',','')
-        rec_tds  = player[7].replace(',','')
-        fmbls    = player[8].replace(',','')
-        fpts     = player[9].replace(',','')
-        cus_fpts = ((RUSH_ATT_PTS * float(rush_att)) +
-                    (RUSH_YRD_PTS * float(rush_yds)) +
-                    (RUSH_TD_PTS  * float(rush_tds)) +
-                    (RECEP_PTS    * float(rec_rec )) +
-                    (REC_YRD_PTS  * float(rec_yds )) +
-                    (REC_TD_PTS   * float(rec_tds )) +
-                    (FUMB_PTS     * float(fmbls   )))
-
-        tmp_table.append(Player(name, team, "WR", "", fpts, cus_fpts, 0.0, 0.0,
-                                0.0, 0.0, "", "", 0, 0.0, "", "", "", "", "", "", ""))
-
-    # Apply position table as temporary table sorted on custom fantasy points
-    if (VERBOSITY >= 2):
-        print ("Sorting table...")
-    wr_table = sorted(tmp_table, key=lambda player: player.cus_fpts, reverse=True)
-
-    # Apply algorithm for player tiers for position
-    if (VERBOSITY >= 2):
-        print ("Creating player tiers...")
-    wr_tier_val = player_tiers ("WR", wr_table)
-
-    # Apply marginal value calculation
-    if (VERBOSITY >= 2):
-        print ("Assigning marginal value...")
-    total_marg_val = assign_marginal_value (wr_table, wr_tier_val, total_marg_val)
-
-    if (VERBOSITY >= 2):
-        print ("Printing player table...")
-        print_player_table (wr_table)
-
-    # Clear temporary table, add position to all-players list, close URL
-    tmp_table = []
-    all_player_table.extend(wr_table)
-
-    # TEs ===================================================================================
-    if (VERBOSITY >= 0):
-        print ('\n========== TEs ==========')
-
-    player_table = parse_projections("te")
-
-    # Apply stats for each player
-    if (VERBOSITY >= 2):
-        print ("Building TE position table...")
-    for player in player_table:
-        name     = player[0].replace("\\'","")
-        team     = player[1]
-        rec_rec  = player[2].replace(',','')
-        rec_yds  = player[3].replace(',','')
-        rec_tds  = player[4].replace(',','')
-        fmbls    = player[5].replace(',','')
-        fpts     = player[6].replace(',','')
-        cus_fpts = ((RECEP_PTS    * float(rec_rec)) +
-                    (REC_YRD_PTS  * float(rec_yds)) +
-                    (REC_TD_PTS   * float(rec_tds)) +
-                    (FUMB_PTS     * float(fmbls  )))
-
-        tmp_table.append(Player(name, team, "TE", "", fpts, cus_fpts, 0.0, 0.0,
-                                0.0, 0.0, "", "", 0, 0.0, "", "", "", "", "", "", ""))
-
-    # Apply position table as temporary table sorted on custom fantasy points
-    if (VERBOSITY >= 2):
-        print ("Sorting table...")
-    te_table = sorted(tmp_table, key=lambda player: player.cus_fpts, reverse=True)
-
-    # Apply algorithm for player tiers for position
-    if (VERBOSITY >= 2):
-        print ("Creating player tiers...")
-    te_tier_val = player_tiers ("TE", te_table)
-
-    # Apply marginal value calculation
-    if (VERBOSITY >= 2):
-        print ("Assigning marginal value...")
-    total_marg_val = assign_marginal_value (te_table, te_tier_val, total_marg_val)
+    # PROJECTIONS ===========================================================================
+    for position in POSITIONS:
+        if (VERBOSITY >= 0):
+            print ('\n========== ' + position + 's ==========')
 
-    if (VERBOSITY >= 2):
-        print ("Printing player table...")
-        print_player_table (te_table)
+        player_table = parse_projections(position.lower())
 
-    # Clear temporary table, add position to all-players list, close URL
-    tmp_table = []
-    all_player_table.extend(te_table)
+        # Apply stats for each player
+        if (VERBOSITY >= 2):
+            print ("Building " + position + " position table...")
+        all_player_table.extend(build_position_table(position, player_table))
 
-    # AUCTION VALUES ========================================================================
     # Apply quality starts information
     assign_quality_starts( all_player_table )
 
@@ -988,27 +1301,9 @@ def main(argv):
     # Apply injury information
     assign_injuries( all_player_table )
 
-    if (DRAFT_TYPE == "auction"):
-        marg_pts_per_dollar = total_marg_val / DISCR_MONEY
-        if (VERBOSITY >= 1):
-            print ('\n===== CALCULATIONS ======')
-            print ("Total Marginal Value   : " + "%.3f" % total_marg_val)
-            print ("Marg. Points Per Dollar: " + "%.3f" % marg_pts_per_dollar)
-            print ("Keeper Value Inflation : " + "%.3f" % KEEPER_INFLATION)
-
-        if (VERBOSITY >= 2):
-            print ("Applying auction value, budget percentage, and static inflation...")
-        for player in all_player_table:
-            # Calculate remaining values
-            player.auct_val = math.ceil((player.marg_val / marg_pts_per_dollar) + 1)
-            player.budget   = ( player.auct_val / AUCTION_MONEY ) * 100
-            player.s_infl   = player.auct_val * KEEPER_INFLATION
-
-    if (VERBOSITY >= 2):
-        print ("Sorting all players by marginal value, then custom fantasy points...")
-    tmp_table = all_player_table
-    all_player_table = sorted(tmp_table, key=lambda player : (player.marg_val,
-                              player.cus_fpts), reverse=True)
+    # AUCTION VALUES ========================================================================
+    all_player_table, total_marg_val = cached_value_players( all_player_table )
+    print_calculations( total_marg_val )
 
     # Print all player table
     if OUT_FILE:
@@ -1031,6 +1326,9 @@ def main(argv):
         print ("File created: " + OUT_FILE)
         print ("Import into Excel using tab delimiters")
 
+    if WATCH_RULES:
+        watch_rules( all_player_table )
+
 
 # MAIN ======================================================================================
 if __name__ == "__main__":
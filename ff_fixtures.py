@@ -0,0 +1,277 @@
+# HEADER ====================================================================================
+# File   : ff_fixtures.py
+# Version: 0.1
+# Summary:
+# Local stand-in for the scraped sites, to test and benchmark fetching with no network.
+# Recorded pages are served from a fixtures directory at the same paths as the live
+# sites, so ff_draft_organizer.py -u http://127.0.0.1:8015 runs the whole pipeline
+# against it (ff_news.py and ff_server.py take -u too). Responses can be made worse on
+# purpose: latency with jitter, bandwidth throttling, a rate of server errors and dropped
+# connections, and a rate of slow-loris responses that send the headers and then trickle
+# the body out a byte at a time. Pages have ETag and Last-Modified headers, answer
+# conditional requests with 304 and are gzipped for clients that accept it, so editing
+# a fixture file looks like a page update to a poller.
+# -r records the live pages into the fixtures directory first. A small fixture set (every
+# page ff_draft_organizer.py and ff_weekly.py fetch, for a 232 player pool) is kept in
+# fixtures/, so the default directory serves a full run as it is.
+# Needs Python 3.7 or later (asyncio.run).
+#
+# Fixture files:
+# http://www.fantasypros.com/nfl/depth-charts.php
+#     -> fixtures/nfl/depth-charts.php
+# http://www.fantasypros.com/nfl/players/quality-starts.php?position=QB
+#     -> fixtures/nfl/players/quality-starts.php@position=QB
+# http://www.fantasypros.com/nfl/projections/qb.php?week=1
+#     -> fixtures/nfl/projections/qb.php@week=1
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import asyncio
+import email.utils
+import gzip
+import os
+import random
+import sys
+import getopt
+import urllib.parse
+import urllib.request
+import ff_draft_organizer as ffdo
+import ff_weekly
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+THROTTLE_TICK    = 0.05     # Seconds between chunks of a throttled response
+SLOW_INTERVAL    = 1.0      # Seconds between bytes of a slow-loris response
+ERRORS           = ["500 Internal Server Error", "503 Service Unavailable", None]
+
+# Program Settings
+VERBOSITY        = 1
+FIXTURE_DIR      = 'fixtures'
+HOST             = '127.0.0.1'
+PORT             = 8015
+LATENCY          = 0.0      # Milliseconds before every response
+JITTER           = 0.0      # Extra random milliseconds, up to this much
+BANDWIDTH        = 0        # Bytes per second per response, 0 = unlimited
+ERROR_RATE       = 0.0
+SLOW_RATE        = 0.0
+RECORD           = False
+HELP_MSG  = (
+"Usage: python ff_fixtures.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = settings (default), 2 = every request]\n"
+"-d <dir>     [fixtures directory (default fixtures)]\n"
+"-p <port>    [port to serve on (default 8015)]\n"
+"-l <ms>      [latency added to every response]\n"
+"-j <ms>      [random extra latency, up to this much]\n"
+"-b <bytes>   [bandwidth limit per response in bytes per second]\n"
+"-e <rate>    [fraction of requests answered with 500, 503 or a dropped connection]\n"
+"-s <rate>    [fraction of responses sent slow-loris style, one byte per second]\n"
+"-r           [record the live source pages into the fixtures directory, then serve]\n"
+)
+
+
+# FUNCTIONS =================================================================================
+def fixture_path( target ):
+    # Fixture file for a request target, None if it would leave the fixtures directory
+    parts = urllib.parse.urlsplit(target)
+    name  = urllib.parse.unquote(parts.path).lstrip('/')
+    if parts.query:
+        name += '@' + parts.query
+    name = os.path.normpath(name)
+    if (name == '.') or name.startswith('..') or os.path.isabs(name):
+        return None
+    return os.path.join(FIXTURE_DIR, name)
+
+def source_pages():
+    # Every page ff_draft_organizer.py and ff_weekly.py fetch, at the addresses configured
+    # in config.py
+    pages = [ffdo.PROJECTIONS_ADDR + position.lower() + ".php" for position in POSITIONS]
+    pages.extend([ffdo.QUAL_START_ADDR + position for position in POSITIONS])
+    pages.extend([ffdo.DEPTH_CHART_ADDR, ffdo.INJURY_ADDR])
+    weekly = ff_weekly.page_addresses(ff_weekly.WEEKS)
+    pages.extend([addr for (week, position, addr) in weekly])
+    return pages
+
+def record_pages():
+    for addr in source_pages():
+        parts = urllib.parse.urlsplit(addr)
+        path  = fixture_path(parts.path + ('?' + parts.query if parts.query else ''))
+        url   = urllib.request.urlopen(addr, timeout=ffdo.FETCH_TIMEOUT)
+        data  = b''.join(ffdo.read_lines(url))
+        url.close()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        if (VERBOSITY >= 1):
+            print ("Recorded " + addr + " -> " + path + " (%d bytes)" % len(data))
+
+def response_head( status, headers ):
+    lines = ["HTTP/1.1 " + status] + [key + ": " + value for (key, value) in headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode("latin-1")
+
+async def read_request( reader ):
+    # Returns (method, target, headers) of a simple HTTP/1.1 request
+    request = await reader.readline()
+    parts   = request.decode("latin-1").split()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if (line in [b'\r\n', b'\n', b'']):
+            break
+        (key, sep, value) = line.decode("latin-1").partition(':')
+        headers[key.strip().lower()] = value.strip()
+    if (len(parts) < 2):
+        return None, None, headers
+    return parts[0], parts[1], headers
+
+async def send_body( writer, body ):
+    if not BANDWIDTH:
+        writer.write(body)
+        await writer.drain()
+        return
+    chunk = max(1, int(BANDWIDTH * THROTTLE_TICK))
+    for start in range(0, len(body), chunk):
+        writer.write(body[start : start + chunk])
+        await writer.drain()
+        await asyncio.sleep(THROTTLE_TICK)
+
+async def send_slow_body( writer, body ):
+    # Slow-loris: the response never stalls long enough for a socket timeout, only a
+    # limit on the total read time (ff_draft_organizer.read_lines) ends it
+    for start in range(len(body)):
+        writer.write(body[start : start + 1])
+        await writer.drain()
+        await asyncio.sleep(SLOW_INTERVAL)
+
+async def handle_client( reader, writer ):
+    try:
+        method, target, headers = await read_request(reader)
+        if (LATENCY or JITTER):
+            await asyncio.sleep((LATENCY + random.uniform(0, JITTER)) / 1000)
+
+        path = fixture_path(target) if (method == "GET") else None
+        if (random.random() < ERROR_RATE):
+            status = random.choice(ERRORS)
+            if status is None:
+                # Dropped connection, no response at all
+                if (VERBOSITY >= 2):
+                    print ("DROP " + str(target))
+                return
+            writer.write(response_head(status, [("Content-Length", "0"),
+                                                ("Connection", "close")]))
+        elif (path is None) or not os.path.isfile(path):
+            status = "404 Not Found"
+            writer.write(response_head(status, [("Content-Length", "0"),
+                                                ("Connection", "close")]))
+        else:
+            info     = os.stat(path)
+            etag     = '"%x-%x"' % (info.st_mtime_ns, info.st_size)
+            modified = email.utils.formatdate(info.st_mtime, usegmt=True)
+            if ("if-none-match" in headers):
+                fresh = (headers["if-none-match"] == etag)
+            else:
+                fresh = (headers.get("if-modified-since") == modified)
+
+            if fresh:
+                status = "304 Not Modified"
+                writer.write(response_head(status, [("ETag", etag),
+                                                    ("Last-Modified", modified),
+                                                    ("Connection", "close")]))
+            else:
+                with open(path, "rb") as f:
+                    body = f.read()
+                fields = [("Content-Type", "text/html"), ("ETag", etag),
+                          ("Last-Modified", modified), ("Connection", "close")]
+                if ("gzip" in headers.get("accept-encoding", "")):
+                    body = gzip.compress(body)
+                    fields.append(("Content-Encoding", "gzip"))
+                fields.append(("Content-Length", "%d" % len(body)))
+
+                status = "200 OK"
+                writer.write(response_head(status, fields))
+                if (random.random() < SLOW_RATE):
+                    status += " (slow)"
+                    await send_slow_body(writer, body)
+                else:
+                    await send_body(writer, body)
+        await writer.drain()
+        if (VERBOSITY >= 2):
+            print (status + " " + str(target))
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve( host, port ):
+    server = await asyncio.start_server(handle_client, host, port)
+    if (VERBOSITY >= 1):
+        print ("Serving " + FIXTURE_DIR + " at http://%s:%d" % (host, port))
+        print ("Latency %.0f ms + up to %.0f ms, bandwidth %s, error rate %.2f, "
+               "slow rate %.2f" % (LATENCY, JITTER,
+                                   ("%d B/s" % BANDWIDTH) if BANDWIDTH else "unlimited",
+                                   ERROR_RATE, SLOW_RATE))
+    async with server:
+        await server.serve_forever()
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global FIXTURE_DIR
+    global PORT
+    global LATENCY
+    global JITTER
+    global BANDWIDTH
+    global ERROR_RATE
+    global SLOW_RATE
+    global RECORD
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:d:p:l:j:b:e:s:r")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-d'):
+            FIXTURE_DIR = arg
+        elif (opt == '-p'):
+            PORT = int(arg)
+        elif (opt == '-l'):
+            LATENCY = float(arg)
+        elif (opt == '-j'):
+            JITTER = float(arg)
+        elif (opt == '-b'):
+            BANDWIDTH = int(arg)
+        elif (opt == '-e'):
+            ERROR_RATE = float(arg)
+        elif (opt == '-s'):
+            SLOW_RATE = float(arg)
+        elif (opt == '-r'):
+            RECORD = True
+
+    if RECORD:
+        record_pages()
+
+    try:
+        asyncio.run(serve(HOST, PORT))
+    except KeyboardInterrupt:
+        pass
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,133 @@
+# HEADER ====================================================================================
+# File   : ff_gamelogs.py
+# Version: 0.1
+# Summary:
+# Quality starts from local weekly game logs, judged by this league's scoring instead of
+# the site's. Every game in the logs is scored with the custom scoring weights compiled by
+# ff_draft_organizer.py and counted as a good or great start against the thresholds per
+# position in config.py. Returns the same [name, games, quality start, quality %] rows as
+# ff_draft_organizer.parse_quality_starts.
+# Logs are read into one column per stat for each position, and game points are summed a
+# whole column at a time, so several seasons of logs take a fraction of a second. Only the
+# latest season is counted, to match the games played last season column.
+#
+# Game log files (every .tsv file in the game log directory, e.g. one per season named
+# 2013.tsv): name, team, pos, week and stat columns named as in STAT_COLUMNS, one line per
+# game played, and an optional season column that takes the place of the file name.
+# Missing stats are 0. A file without a name or pos column is an error; short rows and
+# rows with a stat that is not a number are skipped.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import os
+import config
+
+
+# FUNCTIONS =================================================================================
+def start_thresholds():
+    # (good, great) custom points per position from config.py
+    return {"QB" : (config.qb_good_start, config.qb_great_start),
+            "RB" : (config.rb_good_start, config.rb_great_start),
+            "WR" : (config.wr_good_start, config.wr_great_start),
+            "TE" : (config.te_good_start, config.te_great_start)}
+
+def log_files( path ):
+    if os.path.isfile(path):
+        return [path]
+    return [os.path.join(path, name) for name in sorted(os.listdir(path))
+            if name.endswith(".tsv")]
+
+def read_log_file( log_file, stats ):
+    # (column index by name, rows) of one log file, with the stats columns converted to
+    # numbers. Rows that are short or have a stat that is not a number are left out and
+    # returned as [line number, ...].
+    with open(log_file) as f:
+        header = f.readline().rstrip('\n').split('\t')
+        index  = dict([(column, i) for (i, column) in enumerate(header)])
+        for column in ["name", "pos"]:
+            if column not in index:
+                raise ValueError(log_file + ": no " + column + " column in the header")
+        numbers = [index[stat] for stat in stats if stat in index]
+        cells   = []
+        skipped = []
+        for (number, line) in enumerate(f, 2):
+            if not line.strip():
+                continue
+            row = line.rstrip('\n').split('\t')
+            if (len(row) < len(header)):
+                skipped.append(number)
+                continue
+            try:
+                for i in numbers:
+                    row[i] = float(row[i].replace(',', '') or 0)
+            except ValueError:
+                skipped.append(number)
+                continue
+            cells.append(row)
+    return index, cells, skipped
+
+def read_game_logs( path, stat_columns ):
+    # ({position : (player names, [one column per stat in stat_columns order])}, a row per
+    # game of the latest season in the logs, and the skipped rows as (file, line number)).
+    # A row's season is its season column, or else the name of its log file (2013.tsv).
+    stats   = set([stat for position in stat_columns for stat in stat_columns[position]])
+    logs    = []
+    skipped = []
+    for log_file in log_files(path):
+        index, cells, bad = read_log_file(log_file, stats)
+        skipped.extend([(log_file, number) for number in bad])
+        season = os.path.splitext(os.path.basename(log_file))[0]
+        if "season" in index:
+            logs.extend([(row[index["season"]], index, row) for row in cells])
+        else:
+            logs.extend([(season, index, row) for row in cells])
+    latest = max([season for (season, index, row) in logs] or [None])
+
+    rows = {}
+    for position in stat_columns:
+        games = [(index, row) for (season, index, row) in logs
+                 if (season == latest) and (row[index["pos"]].upper() == position)]
+        if not games:
+            continue
+        names   = [row[index["name"]] for (index, row) in games]
+        columns = []
+        for stat in stat_columns[position]:
+            columns.append([row[index[stat]] if stat in index else 0.0
+                            for (index, row) in games])
+        rows[position] = (names, columns)
+    return rows, skipped
+
+def game_points( columns, weights ):
+    # Custom points of every game, adding one weighted stat column at a time
+    points = [0.0] * (len(columns[0]) if columns else 0)
+    for (weight, column) in zip(weights, columns):
+        if weight:
+            points = [total + weight * stat for (total, stat) in zip(points, column)]
+    return points
+
+def quality_starts( logs, weights, thresholds, good_weight, great_weight ):
+    # [name, games, quality start stat, % games quality] per player in the logs
+    qs_table = []
+    for position in logs:
+        names, columns = logs[position]
+        good, great    = thresholds[position]
+        points = game_points(columns, weights[position])
+        # 0 bad, 1 good, 2 great
+        grades = [(pts >= great) + (pts >= good) for pts in points]
+
+        counts = {}
+        for (name, grade) in zip(names, grades):
+            count = counts.get(name)
+            if count is None:
+                count = counts[name] = [0, 0, 0]
+            count[grade] += 1
+
+        for name in counts:
+            (bad, good_games, great_games) = counts[name]
+            games = bad + good_games + great_games
+            qs_table.append([name, games, (good_games * good_weight +
+                                           great_games * great_weight),
+                             "%.0f%%" % (100.0 * (good_games + great_games) / games)])
+    return qs_table
@@ -0,0 +1,111 @@
+# HEADER ====================================================================================
+# File   : ff_keepers.py
+# Version: 0.1
+# Summary:
+# Keeper selection for auction keeper leagues. Each team's candidate keepers and keeper
+# prices come from config.py. The auction values calculated by ff_draft_organizer.py
+# decide which candidates each team keeps: a small dynamic program per team maximizes
+# auction value over keeper price, with at most keepers_per_team keepers and $1 left for
+# every open roster slot. Candidate names must match one player exactly or be part of only
+# one player's name, and a player can be a candidate of one team only. The kept players
+# give the keeper spending, keeper value and keeper inflation from
+# http://espn.go.com/fantasy/football/story/_/page/NFLDK2K13_inflation_calculation/
+# how-calculate-inflation-fantasy-football-auction-keeper-league
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import config
+
+
+# FUNCTIONS =================================================================================
+def find_candidate( player_table, name ):
+    # Player named name, or the only player whose name contains it. None if no player or
+    # more than one player matches.
+    name    = name.replace("'", "")
+    matches = []
+    for player in player_table:
+        if (name == player.name):
+            return player
+        if (name in player.name):
+            matches.append(player)
+    if (len(matches) == 1):
+        return matches[0]
+    return None
+
+def team_keepers( candidates, max_keepers, money, slots ):
+    # candidates is a list of (player, price, value). best[n][c] holds the largest surplus
+    # (value - price) and the chosen candidates for n keepers costing exactly c.
+    best    = [[None] * (money + 1) for n in range(max_keepers + 1)]
+    best[0][0] = (0.0, [])
+    for candidate in candidates:
+        (player, price, value) = candidate
+        for n in range(max_keepers, 0, -1):
+            for c in range(money, price - 1, -1):
+                prev = best[n - 1][c - price]
+                if prev is None:
+                    continue
+                # Every roster slot left after the keepers still needs the minimum bid
+                if (c > money - (slots - n)):
+                    continue
+                surplus = prev[0] + value - price
+                if (best[n][c] is None) or (surplus > best[n][c][0]):
+                    best[n][c] = (surplus, prev[1] + [candidate])
+
+    kept = (0.0, [])
+    for row in best:
+        for entry in row:
+            if (entry is not None) and (entry[0] > kept[0]):
+                kept = entry
+
+    return kept[1]
+
+def select_keepers( player_table, candidates = None, max_keepers = None ):
+    # Returns the kept (player, price, value) for each team, the candidate names that did
+    # not match exactly one player in the player table, and (name, team, earlier team) for
+    # each player already listed as another team's candidate. A player stays a candidate
+    # of the first team that lists it only. Defaults are read from config.py when called.
+    if candidates is None:
+        candidates = config.keeper_candidates
+    if max_keepers is None:
+        max_keepers = config.keepers_per_team
+
+    keepers    = {}
+    missing    = []
+    duplicates = []
+    listed     = {}
+    for team in candidates:
+        team_candidates = []
+        for (name, price) in candidates[team]:
+            player = find_candidate(player_table, name)
+            if player is None:
+                missing.append(name)
+                continue
+            if (player.name in listed):
+                duplicates.append((player.name, team, listed[player.name]))
+                continue
+            listed[player.name] = team
+            team_candidates.append((player, int(price), float(player.auct_val)))
+
+        keepers[team] = team_keepers(team_candidates, max_keepers, config.auction_money,
+                                     config.roster_slots)
+
+    return keepers, missing, duplicates
+
+def keeper_totals( keepers ):
+    # Total keeper money spent and total auction value absorbed by keepers
+    spendings = 0
+    value     = 0.0
+    for team in keepers:
+        for (player, price, player_value) in keepers[team]:
+            spendings += price
+            value     += player_value
+
+    return spendings, value
+
+def keeper_inflation( spendings, value, total_money ):
+    # Money left for the auction over value left in the player pool
+    if (total_money - value) <= 0:
+        return 1.0
+    return (total_money - spendings) / (total_money - value)
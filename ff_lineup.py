@@ -0,0 +1,428 @@
+# HEADER ====================================================================================
+# File   : ff_lineup.py
+# Version: 0.1
+# Summary:
+# Budget constrained starting lineup optimizer for auction drafts. Reads the tab delimited
+# player table created by ff_draft_organizer.py (with Purchase Price and Owner filled in as
+# players are sold) and, for a nominated player, finds the starting lineup that maximizes
+# projected custom fantasy points with the money and roster slots still open, and the
+# maximum bid for the nominated player that still leaves that lineup optimal.
+# Each position keeps its own knapsack table between nominations. A sale only rebuilds
+# the table for the sold player's position.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import math
+import sys
+import getopt
+import config
+import ff_draft_organizer as ffdo
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+STARTING_SLOTS   = {"QB" : config.starting_qbs,
+                    "RB" : config.starting_rbs,
+                    "WR" : config.starting_wrs,
+                    "TE" : config.starting_tes}
+NO_LINEUP        = float("-inf")
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+HELP_MSG  = (
+"Usage: python ff_lineup.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = lineup display (default), 2 = debug]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+)
+
+
+# FUNCTIONS =================================================================================
+def lineup_slots():
+    # Whole starting slots per position. Fractional parts of the starting_* settings are
+    # the flex split, so they add up to the flex slots shared by those positions.
+    needs     = {}
+    flex_pos  = []
+    flex_frac = 0.0
+    for pos in POSITIONS:
+        needs[pos] = int(math.floor(STARTING_SLOTS[pos]))
+        frac       = STARTING_SLOTS[pos] - needs[pos]
+        if (frac > 0.0):
+            flex_pos.append(pos)
+            flex_frac += frac
+
+    return needs, int(round(flex_frac)), flex_pos
+
+def player_cost( player ):
+    # Expected price of a player, never less than the minimum bid
+    return max(1, int(player.auct_val))
+
+def player_price( player ):
+    price = player.price.replace('$', '').strip()
+    if price:
+        return int(float(price))
+    return 0
+
+def prune_pool( players, max_count ):
+    # A player is never needed if max_count other players cost no more and project at
+    # least as many points, so only the non-dominated players go into the knapsack
+    ordered = sorted(players, key=lambda player: (player_cost(player), -player.cus_fpts))
+    kept    = []
+    for player in ordered:
+        better = 0
+        for other in kept:
+            if (other.cus_fpts >= player.cus_fpts):
+                better += 1
+                if (better >= max_count):
+                    break
+        if (better < max_count):
+            kept.append(player)
+
+    return kept
+
+def position_knapsack( players, max_count, max_cost ):
+    # layers[i][n][c] is the most points from exactly n of the first i players costing c
+    # or less in total (NO_LINEUP when not possible)
+    best    = [[NO_LINEUP] * (max_cost + 1) for n in range(max_count + 1)]
+    best[0] = [0.0] * (max_cost + 1)
+    layers  = [best]
+    for player in players:
+        cost = player_cost(player)
+        pts  = player.cus_fpts
+        new  = [row[:] for row in best]
+        if (cost <= max_cost):
+            for n in range(1, max_count + 1):
+                prev = best[n - 1]
+                row  = new[n]
+                for c in range(cost, max_cost + 1):
+                    val = prev[c - cost] + pts
+                    if (val > row[c]):
+                        row[c] = val
+        layers.append(new)
+        best = new
+
+    return layers
+
+def knapsack_picks( players, layers, count, cost ):
+    # Walk the knapsack layers backwards to recover which players were chosen
+    picks = []
+    for i in range(len(players), 0, -1):
+        if (count == 0):
+            break
+        if (layers[i][count][cost] != layers[i - 1][count][cost]):
+            picks.append(players[i - 1])
+            count -= 1
+            cost  -= player_cost(players[i - 1])
+
+    return picks
+
+def flex_rows( best, need, flex, eligible ):
+    # Knapsack rows for a position indexed by the number of flex slots it fills
+    rows = []
+    for u in range(flex + 1):
+        if (u > 0) and not eligible:
+            rows.append(None)
+        elif (need + u < len(best)):
+            rows.append(best[need + u])
+        else:
+            rows.append(None)
+
+    return rows
+
+def merge_rows( a, b, flex, max_cost ):
+    # Max-plus convolution of two positions over money and flex slots used. Keeps the
+    # split of money and flex slots so the lineup can be rebuilt.
+    merged = [None] * (flex + 1)
+    split  = [None] * (flex + 1)
+    for u in range(flex + 1):
+        row = [NO_LINEUP] * (max_cost + 1)
+        arg = [None] * (max_cost + 1)
+        for ua in range(u + 1):
+            row_a = a[ua]
+            row_b = b[u - ua]
+            if (row_a is None) or (row_b is None):
+                continue
+            for ca in range(max_cost + 1):
+                val_a = row_a[ca]
+                if (val_a == NO_LINEUP):
+                    continue
+                for cb in range(max_cost + 1 - ca):
+                    val = val_a + row_b[cb]
+                    if (val > row[ca + cb]):
+                        row[ca + cb] = val
+                        arg[ca + cb] = (ua, ca)
+        merged[u] = row
+        split[u]  = arg
+
+    return merged, split
+
+def best_total( a, b, flex, budget ):
+    # Best combination of two row sets using exactly flex flex slots and at most budget
+    best = (NO_LINEUP, None, None)
+    for ua in range(flex + 1):
+        row_a = a[ua]
+        row_b = b[flex - ua]
+        if (row_a is None) or (row_b is None):
+            continue
+        for ca in range(budget + 1):
+            val = row_a[ca] + row_b[budget - ca]
+            if (val > best[0]):
+                best = (val, ua, ca)
+
+    return best
+
+
+# CLASSES ===================================================================================
+# Lineup optimizer with knapsack tables cached between nominations
+class LineupOptimizer:
+    def __init__(self, player_table, owner = config.my_team):
+        self.owner      = owner
+        self.money      = config.auction_money
+        self.open_slots = config.roster_slots
+        self.needs, self.flex, self.flex_pos = lineup_slots()
+        self.roster     = []
+        self.starters   = []
+        self.pool       = {}
+        self.tables     = {}
+        self.merged     = {}
+
+        for pos in POSITIONS:
+            self.pool[pos] = []
+        for player in player_table:
+            if (player.owner == self.owner):
+                self.add_to_roster(player, player_price(player))
+            elif not player.owner and (player.pos in self.pool):
+                self.pool[player.pos].append(player)
+
+    def max_count( self, pos ):
+        if (pos in self.flex_pos):
+            return self.needs[pos] + self.flex
+        return self.needs[pos]
+
+    def starter_slots( self ):
+        return sum(self.needs.values()) + self.flex
+
+    def starter_budget( self ):
+        # Money for starters after keeping the minimum bid for every open bench slot
+        return self.money - (self.open_slots - self.starter_slots())
+
+    def add_to_roster( self, player, price ):
+        self.roster.append(player)
+        self.money      -= price
+        self.open_slots -= 1
+        if (self.needs.get(player.pos, 0) > 0):
+            self.needs[player.pos] -= 1
+            self.starters.append(player)
+        elif (player.pos in self.flex_pos) and (self.flex > 0):
+            self.flex -= 1
+            self.starters.append(player)
+        self.merged = {}
+
+    def sold( self, player, price, owner ):
+        # Remove a sold player from the pool, rebuilding only that position's table
+        player.price = "$%d" % price
+        player.owner = owner
+        if (player in self.pool.get(player.pos, [])):
+            self.pool[player.pos].remove(player)
+            self.tables.pop(player.pos, None)
+        if (owner == self.owner):
+            self.add_to_roster(player, price)
+        self.merged = {}
+
+    def table( self, pos, exclude = None ):
+        # Knapsack table (pruned players, layers) for a position. The full pool table is
+        # cached with the budget it covers, and rebuilt once the starter budget grows past
+        # it (a $0 pick frees a bench dollar); excluding a dominated player reuses it.
+        max_cost = max(self.starter_budget(), 0)
+        if (pos not in self.tables) or (self.tables[pos][2] < max_cost):
+            players = prune_pool(self.pool[pos], self.max_count(pos))
+            self.tables[pos] = (players, position_knapsack(players, self.max_count(pos),
+                                                           max_cost), max_cost)
+        players, layers = self.tables[pos][:2]
+        if (exclude is None) or (exclude not in players):
+            return players, layers
+
+        pool    = [player for player in self.pool[pos] if (player is not exclude)]
+        players = prune_pool(pool, self.max_count(pos))
+        return players, position_knapsack(players, self.max_count(pos), max_cost)
+
+    def others( self, pos ):
+        # Merged table of every position except pos, cached until the pool changes
+        if (pos in self.merged):
+            return self.merged[pos]
+
+        max_cost = max(self.starter_budget(), 0)
+        parts    = []
+        rows     = None
+        for other in POSITIONS:
+            if (other == pos):
+                continue
+            players, layers = self.table(other)
+            part = flex_rows(layers[-1], self.needs[other], self.flex,
+                             other in self.flex_pos)
+            if rows is None:
+                rows  = part
+                split = None
+            else:
+                rows, split = merge_rows(rows, part, self.flex, max_cost)
+            parts.append((other, players, layers, split))
+
+        self.merged[pos] = (rows, parts)
+        return self.merged[pos]
+
+    def rebuild( self, pos, players, layers, need, others, flex, budget ):
+        # Rebuild the player picks behind the best lineup for a budget
+        rows, parts = others
+        part = flex_rows(layers[-1], need, flex, pos in self.flex_pos)
+        val, u, c = best_total(rows, part, flex, budget)
+        if (val == NO_LINEUP):
+            return val, []
+
+        picks = knapsack_picks(players, layers, need + (flex - u), budget - c)
+        for (other, o_players, o_layers, split) in reversed(parts):
+            if split is None:
+                o_u, o_c = u, c
+                u, c     = 0, 0
+            else:
+                o_u, o_c = u, c
+                u, c     = split[o_u][o_c]
+                o_u, o_c = o_u - u, o_c - c
+            picks.extend(knapsack_picks(o_players, o_layers,
+                                        self.needs[other] + o_u, o_c))
+
+        return val, picks
+
+    def lineup( self ):
+        # Best starting lineup from the current roster and remaining pool
+        pos             = POSITIONS[0]
+        players, layers = self.table(pos)
+        val, picks = self.rebuild(pos, players, layers, self.needs[pos], self.others(pos),
+                                  self.flex, self.starter_budget())
+        return val, picks
+
+    def max_bid( self, nominee ):
+        # Returns (max bid, optimal roster if won at that bid). A bid of zero means the
+        # nominee does not improve the lineup at any price.
+        pos    = nominee.pos
+        budget = self.starter_budget()
+        if (self.open_slots <= 0) or (pos not in self.pool):
+            return 0, []
+
+        players, layers = self.table(pos, nominee)
+        others          = self.others(pos)
+        need            = self.needs[pos]
+        without, picks  = self.rebuild(pos, players, layers, need, others, self.flex,
+                                       budget)
+
+        # Nominee fills a starting slot, otherwise it is only worth the minimum bid
+        if (need > 0):
+            need -= 1
+            flex  = self.flex
+        elif (pos in self.flex_pos) and (self.flex > 0):
+            flex  = self.flex - 1
+        elif (self.open_slots > self.starter_slots()):
+            return 1, self.roster + picks + [nominee]
+        else:
+            return 0, self.roster + picks
+
+        rows, parts = others
+        part        = flex_rows(layers[-1], need, flex, pos in self.flex_pos)
+        bid         = 0
+        for price in range(budget, 0, -1):
+            val = best_total(rows, part, flex, budget - price)[0]
+            if (nominee.cus_fpts + val >= without):
+                bid = price
+                break
+
+        if (bid == 0):
+            return 0, self.roster + picks
+
+        val, won = self.rebuild(pos, players, layers, need, others, flex, budget - bid)
+        return bid, self.roster + won + [nominee]
+
+def find_player( player_table, name ):
+    name = name.lower()
+    for player in player_table:
+        if (name in player.name.lower()) and not player.owner:
+            return player
+    return None
+
+def print_roster( bid, roster ):
+    print ('-' * 70)
+    print ("Max bid: $%d" % bid)
+    print ('-' * 70)
+    for player in sorted(roster, key=lambda player : player.cus_fpts, reverse=True):
+        print (player.name.ljust(30)        + ' | ' +
+               player.pos                   + ' | ' +
+               "%6.2f" % player.cus_fpts    + ' | ' +
+               "$%d"   % player_cost(player) + ' | ' +
+               player.owner)
+    print ('-' * 70)
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+
+    if not IN_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    with open(IN_FILE) as f:
+        player_table = ffdo.load_player_table(f)
+    optimizer = LineupOptimizer(player_table)
+
+    # Query each nomination, then record the sale so the next query reuses the tables
+    while True:
+        name = input("Nominated player (blank to quit): ")
+        if not name:
+            break
+        nominee = find_player(player_table, name)
+        if nominee is None:
+            print ("No undrafted player matching " + name)
+            continue
+
+        bid, roster = optimizer.max_bid(nominee)
+        if (VERBOSITY >= 1):
+            print_roster(bid, roster)
+        else:
+            print ("Max bid: $%d" % bid)
+
+        owner = input("Sold to (blank if not sold): ")
+        if owner:
+            # Asked again until the price is a whole number of dollars
+            price = None
+            while price is None:
+                try:
+                    price = int(input("Price: ").replace('$', ''))
+                except ValueError:
+                    print ("Price must be a whole number of dollars, e.g. $25")
+            optimizer.sold(nominee, price, owner)
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
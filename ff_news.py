@@ -0,0 +1,249 @@
+# HEADER ====================================================================================
+# File   : ff_news.py
+# Version: 0.1
+# Summary:
+# Injury and depth chart watcher for draft day. Re-polls the depth charts and injury pages
+# at a set interval with conditional requests (ETag / Last-Modified), so an unchanged page
+# costs a 304 and no parsing. Pages that did change are parsed with the same row functions
+# as ff_draft_organizer.py and diffed per player against the previous poll. Only the
+# players whose depth, injury or status changed are updated in the live table; the
+# projection and valuation pipeline is never re-run.
+# Used stand-alone on an output file, or in the background of ff_server.py (-n option).
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import gzip
+import hashlib
+import http.client
+import io
+import sys
+import getopt
+import time
+import urllib.error
+import urllib.request
+import ff_draft_organizer as ffdo
+
+
+# GLOBALS ===================================================================================
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+OUT_FILE         = ''
+POLL_INTERVAL    = 300
+HELP_MSG  = (
+"Usage: python ff_news.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = changes (default), 2 = every poll]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+"-o <file>    [output file, rewritten after each poll with changes]\n"
+"-n <seconds> [poll interval (default 300)]\n"
+"-u <url>     [base URL for the polled pages, e.g. a local ff_fixtures.py server]\n"
+)
+
+
+# CLASSES ===================================================================================
+# One polled page with its cache validators
+class PageSource:
+    def __init__(self, addr, rows):
+        self.addr     = addr
+        self.rows     = rows      # Page source string -> parsed rows
+        self.etag     = None
+        self.modified = None
+        self.digest   = None
+        self.pending  = None      # Validators of fetched rows not applied yet
+
+    def fetch( self ):
+        # Returns the parsed rows, or None when the page has not changed since the last
+        # applied fetch. The new validators are only kept once commit() is called, so rows
+        # that never got applied are fetched again next time.
+        self.pending = None
+        request = urllib.request.Request(self.addr)
+        request.add_header("Accept-Encoding", "gzip")
+        if self.etag:
+            request.add_header("If-None-Match", self.etag)
+        if self.modified:
+            request.add_header("If-Modified-Since", self.modified)
+        try:
+            url = urllib.request.urlopen(request, timeout=ffdo.FETCH_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if (e.code == 304):
+                return None
+            raise
+
+        etag     = url.headers.get("ETag")
+        modified = url.headers.get("Last-Modified")
+        data = b''.join(ffdo.read_lines(url))
+        if (url.headers.get("Content-Encoding") == "gzip"):
+            data = gzip.decompress(data)
+        url.close()
+
+        # Servers without validators send the whole page every time; skip parsing
+        # when it is byte for byte the same
+        digest = hashlib.sha1(data).digest()
+        if (digest == self.digest):
+            return None
+        # Same source string as ff_draft_organizer.py builds from url.readlines()
+        rows = self.rows(str(io.BytesIO(data).readlines()))
+        self.pending = (etag, modified, digest)
+        return rows
+
+    def commit( self ):
+        # Keeps the validators of the last fetch, after its rows were applied
+        if self.pending is not None:
+            (self.etag, self.modified, self.digest) = self.pending
+            self.pending = None
+
+# Polls the sources and applies per-player changes to the player table
+class NewsPoller:
+    def __init__(self, player_table):
+        self.players = player_table
+        self.by_name = dict([(player.name, player) for player in player_table])
+        self.matches = {}
+        # Each source sets these player fields from the values after the name in its rows
+        self.sources = [(PageSource(ffdo.DEPTH_CHART_ADDR, ffdo.depth_chart_rows),
+                         ["depth"]),
+                        (PageSource(ffdo.INJURY_ADDR, ffdo.injury_rows),
+                         ["injury", "status"])]
+        # Values from the previous poll by player name, starting from the table itself
+        self.current = []
+        for (source, fields) in self.sources:
+            values = {}
+            for player in player_table:
+                value = tuple([getattr(player, field) for field in fields])
+                if any(value):
+                    values[player.name] = value
+            self.current.append(values)
+
+    def match( self, name ):
+        # Same matching as the assign_* functions, cached since names repeat every poll
+        if name not in self.matches:
+            self.matches[name] = None
+            for player in self.players:
+                if (name.replace("'", "") in player.name):
+                    self.matches[name] = player
+                    break
+        return self.matches[name]
+
+    def fetch( self ):
+        # Network only, the table is not touched. Returns the rows per source (None if
+        # unchanged or failed) and the errors. Each source is fetched on its own, so one
+        # failing never loses the other's update.
+        fetched = []
+        errors  = []
+        for (source, fields) in self.sources:
+            try:
+                fetched.append(source.fetch())
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                fetched.append(None)
+                errors.append(source.addr + ": " + str(e))
+        return fetched, errors
+
+    def apply( self, fetched ):
+        # Returns the changes as (player, field, old value, new value)
+        changes = []
+        for i, rows in enumerate(fetched):
+            if rows is None:
+                continue
+            fields = self.sources[i][1]
+            values = {}
+            for row in rows:
+                player = self.match(row[0])
+                if player is not None:
+                    values[player.name] = tuple(row[1:])
+
+            old   = self.current[i]
+            empty = ("",) * len(fields)
+            for name in set(old) | set(values):
+                if (old.get(name, empty) == values.get(name, empty)):
+                    continue
+                player = self.by_name[name]
+                for (field, before, after) in zip(fields, old.get(name, empty),
+                                                  values.get(name, empty)):
+                    if (before != after):
+                        setattr(player, field, after)
+                        changes.append((player, field, before, after))
+            self.current[i] = values
+            self.sources[i][0].commit()
+        return changes
+
+    def poll( self ):
+        # Returns the changes and the errors of the sources that failed
+        fetched, errors = self.fetch()
+        return self.apply(fetched), errors
+
+
+# FUNCTIONS =================================================================================
+def print_changes( changes ):
+    for (player, field, before, after) in changes:
+        print (player.name.ljust(30) + player.pos.ljust(4) + field.ljust(8) +
+               (before or "-") + " -> " + (after or "-"))
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global OUT_FILE
+    global POLL_INTERVAL
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:o:n:u:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-o'):
+            OUT_FILE = arg
+        elif (opt == '-n'):
+            POLL_INTERVAL = float(arg)
+        elif (opt == '-u'):
+            ffdo.source_addresses(arg.rstrip('/'), arg.rstrip('/'))
+
+    if not IN_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    # The output file keeps the layout of the input file, auction or snake
+    with open(IN_FILE) as f:
+        ffdo.DRAFT_TYPE = ffdo.table_draft_type(f)
+        f.seek(0)
+        player_table = ffdo.load_player_table(f)
+    poller = NewsPoller(player_table)
+
+    try:
+        while True:
+            start = time.perf_counter()
+            changes, errors = poller.poll()
+            for error in errors:
+                print ("Poll failed: " + error)
+
+            if (VERBOSITY >= 1):
+                print_changes(changes)
+            if (VERBOSITY >= 2):
+                print ("Polled in %.1f ms, %d changes" %
+                       ((time.perf_counter() - start) * 1000, len(changes)))
+            if changes and OUT_FILE:
+                with open(OUT_FILE, "w") as f:
+                    ffdo.print_player_table(player_table, f)
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,126 @@
+# HEADER ====================================================================================
+# File   : ff_nominate.py
+# Version: 0.1
+# Summary:
+# Auction nomination advisor. From the live draft state (ff_draft_log.py) each opponent's
+# money and open slots give its max bid ($1 kept back for every other open slot), and a
+# team is assumed out of the market at a position once it has the expected drafted
+# players there (expected_drafted_* in config.py, rounded up). For every undrafted
+# player the expected price is his dynamic inflation value capped by the second highest
+# max bid among the opponents still in his market, and the expected buyer is the highest.
+# A nomination is scored by the hit to opponents' purchasing power: the discretionary
+# money the buyer spends, plus how far the highest max bid I could be up against drops.
+# Players I still need for my starting lineup are never suggested.
+# The market per position is summarized once per call (top two bidders), so every player
+# in the pool is scored in constant time and a ranking takes about a millisecond.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import math
+import config
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+
+
+# CLASSES ===================================================================================
+# Ranks undrafted players to nominate from a ff_draft_log.DraftState
+class NominationAdvisor:
+    def __init__(self, state, team = None, slots = None):
+        # Settings are read here rather than at import, after any rules file was applied
+        self.state  = state
+        self.team   = team or config.my_team
+        self.slots  = slots or config.roster_slots
+        # Players per team at each position before a team stops bidding there
+        self.limits = {"QB" : int(math.ceil(config.expected_drafted_qbs)),
+                       "RB" : int(math.ceil(config.expected_drafted_rbs)),
+                       "WR" : int(math.ceil(config.expected_drafted_wrs)),
+                       "TE" : int(math.ceil(config.expected_drafted_tes))}
+        # Starters per team at each position, flex included
+        self.needs  = {"QB" : int(math.ceil(config.starting_qbs)),
+                       "RB" : int(math.ceil(config.starting_rbs)),
+                       "WR" : int(math.ceil(config.starting_wrs)),
+                       "TE" : int(math.ceil(config.starting_tes))}
+
+    def team_status( self, team ):
+        # (max bid, players per position)
+        counts = dict([(pos, 0) for pos in POSITIONS])
+        for (name, price) in self.state.rosters[team]:
+            pos = self.state.players[name].pos
+            if pos in counts:
+                counts[pos] += 1
+        open_slots = self.slots - len(self.state.rosters[team])
+        max_bid    = self.state.budgets[team] - open_slots + 1 if (open_slots > 0) else 0
+        return max_bid, counts
+
+    def market( self ):
+        # Top two opponent max bids per position as [(max bid, team)], and the top two
+        # over all positions
+        markets = dict([(pos, [(0, ''), (0, '')]) for pos in POSITIONS])
+        overall = [(0, ''), (0, '')]
+        for team in self.state.budgets:
+            if (team == self.team):
+                continue
+            max_bid, counts = self.team_status(team)
+            if (max_bid <= 0):
+                continue
+            overall = sorted(overall + [(max_bid, team)], reverse=True)[:2]
+            for pos in POSITIONS:
+                if (counts[pos] < self.limits[pos]):
+                    bids = markets[pos] + [(max_bid, team)]
+                    markets[pos] = sorted(bids, reverse=True)[:2]
+        return markets, overall
+
+    def targets( self, inflation ):
+        # Best undrafted players I can afford at each position with open starting spots
+        targets = set()
+        if self.team not in self.state.rosters:
+            return targets
+        max_bid, counts = self.team_status(self.team)
+        for pos in POSITIONS:
+            need = self.needs[pos] - counts[pos]
+            if (need <= 0):
+                continue
+            pool = sorted([player for player in self.state.players.values()
+                           if (player.pos == pos) and not player.owner and
+                           (int(player.auct_val * inflation) <= max_bid)],
+                          key=lambda player: player.auct_val, reverse=True)
+            targets.update([player.name for player in pool[:need]])
+        return targets
+
+    def rank( self, count = 10 ):
+        # [(player, expected price, expected buyer, hit)] best nominations first
+        inflation        = self.state.inflation()
+        markets, overall = self.market()
+        targets          = self.targets(inflation)
+        (top_bid, top_team), (next_bid, next_team) = overall
+
+        ranked = []
+        for player in self.state.players.values():
+            if player.owner or (player.name in targets) or (player.pos not in markets):
+                continue
+            (bid, buyer), (second, other) = markets[player.pos]
+            if not buyer:
+                continue
+            price = max(1, min(int(player.auct_val * inflation), second))
+            # Discretionary money spent, and the drop in the top max bid when the team
+            # holding it buys
+            hit = price - 1
+            if (buyer == top_team):
+                hit += top_bid - max(top_bid - price + 1, next_bid)
+            ranked.append((player, price, buyer, hit))
+
+        ranked.sort(key=lambda entry: (entry[3], entry[1]), reverse=True)
+        return ranked[:count]
+
+
+# FUNCTIONS =================================================================================
+def print_nominations( ranked ):
+    print ("Nominate".ljust(30) + "Pos".ljust(5) + "Price".rjust(6) + "  " +
+           "Buyer".ljust(10) + "Hit".rjust(5))
+    for (player, price, buyer, hit) in ranked:
+        print (player.name.ljust(30) + player.pos.ljust(5) + ("$%d" % price).rjust(6) +
+               "  " + buyer.ljust(10) + ("$%d" % hit).rjust(5))
@@ -0,0 +1,214 @@
+# HEADER ====================================================================================
+# File   : ff_player_store.py
+# Version: 0.1
+# Summary:
+# Read-only columnar player store for process pool workers. The scored player table is
+# written once to a memory mapped file. Numeric columns are packed arrays. Text columns
+# are byte offsets plus one UTF-8 blob. A small schema header describes the columns.
+# Workers map the file when the pool starts and read columns in place, so tasks only
+# carry row ranges or parameters and every worker shares the same pages in memory.
+#
+# File layout:
+# b"FFPS" | header length (uint32) | JSON schema | column data (8 byte aligned)
+#
+# Example:
+#   write_store(player_table, "players.ffps")
+#   results = parallel_map(my_task, tasks, "players.ffps")
+#   # my_task reads worker_store().column("cus_fpts") without pickling the table
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import json
+import mmap
+import struct
+import sys
+import getopt
+import multiprocessing
+import ff_draft_organizer as ffdo
+
+
+# GLOBALS ===================================================================================
+STORE_MAGIC      = b"FFPS"
+STORE_VERSION    = 1
+# Player attributes with their array type codes, "s" for text
+STORE_COLUMNS    = [("name",     "s"), ("team",     "s"), ("pos",      "s"),
+                    ("cat",      "s"), ("fpts",     "s"), ("cus_fpts", "d"),
+                    ("marg_val", "d"), ("auct_val", "q"), ("budget",   "d"),
+                    ("s_infl",   "d"), ("d_infl",   "s"), ("depth",    "s"),
+                    ("games",    "q"), ("qual_st",  "d"), ("qs_per",   "s"),
+                    ("injury",   "s"), ("status",   "s"), ("notes",    "s"),
+                    ("price",    "s"), ("real_val", "s"), ("owner",    "s")]
+# Store attached by each pool worker
+WORKER_STORE     = None
+
+# Program Settings
+IN_FILE          = ''
+OUT_FILE         = ''
+HELP_MSG  = (
+"Usage: python ff_player_store.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+"-o <file>    [output player store file]\n"
+)
+
+
+# CLASSES ===================================================================================
+# Memory mapped read-only view of a player store file
+class PlayerStore:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map  = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = memoryview(self.map)
+        if (self.data[:4].tobytes() != STORE_MAGIC):
+            raise ValueError(path + " is not a player store")
+
+        length       = struct.unpack_from("<I", self.map, 4)[0]
+        schema       = json.loads(self.data[8:8 + length].tobytes().decode("utf-8"))
+        self.rows    = schema["rows"]
+        self.columns = {}
+        self.views   = []
+        for (name, kind, offset, size) in schema["columns"]:
+            if (kind == "s"):
+                # Text column: rows + 1 offsets followed by the UTF-8 blob
+                offsets = self.view(offset, (self.rows + 1) * 8, "q")
+                blob    = self.data[offset + (self.rows + 1) * 8 : offset + size]
+                self.views.append(blob)
+                self.columns[name] = (kind, offsets, blob)
+            else:
+                self.columns[name] = (kind, self.view(offset, size, kind), None)
+
+    def view( self, offset, size, kind ):
+        view = self.data[offset : offset + size].cast(kind)
+        self.views.append(view)
+        return view
+
+    def column( self, name ):
+        # Numeric columns are zero-copy memoryviews. Text columns are decoded to a list.
+        (kind, values, blob) = self.columns[name]
+        if (kind != "s"):
+            return values
+        return [self.text(name, i) for i in range(self.rows)]
+
+    def text( self, name, i ):
+        (kind, offsets, blob) = self.columns[name]
+        return blob[offsets[i] : offsets[i + 1]].tobytes().decode("utf-8")
+
+    def player( self, i ):
+        values = []
+        for (name, kind) in STORE_COLUMNS:
+            if (kind == "s"):
+                values.append(self.text(name, i))
+            else:
+                values.append(self.columns[name][1][i])
+        return ffdo.Player(*values)
+
+    def close( self ):
+        # Views must be released before the map can close
+        for view in self.views:
+            view.release()
+        self.views   = []
+        self.columns = {}
+        self.data.release()
+        self.map.close()
+        self.file.close()
+
+
+# FUNCTIONS =================================================================================
+def pack_column( player_table, name, kind ):
+    values = [getattr(player, name) for player in player_table]
+    if (kind != "s"):
+        if (kind == "q"):
+            values = [int(value) for value in values]
+        return struct.pack("<%d%s" % (len(values), kind), *values)
+
+    blob    = [str(value).encode("utf-8") for value in values]
+    offsets = [0]
+    for text in blob:
+        offsets.append(offsets[-1] + len(text))
+    return struct.pack("<%dq" % len(offsets), *offsets) + b''.join(blob)
+
+def store_header( packed, rows, start ):
+    # JSON schema with each column's offset when column data begins at start
+    columns = []
+    offset  = start
+    for (name, kind, data) in packed:
+        columns.append([name, kind, offset, len(data)])
+        offset += len(data) + (-len(data) % 8)
+    return json.dumps({"version" : STORE_VERSION, "rows" : rows,
+                       "columns" : columns}).encode("utf-8")
+
+def write_store( player_table, path ):
+    packed = [(name, kind, pack_column(player_table, name, kind))
+              for (name, kind) in STORE_COLUMNS]
+    rows   = len(player_table)
+
+    # Offsets depend on the header length, so size the header with the widest possible
+    # offsets and pad it so column data starts 8 byte aligned
+    length = len(store_header(packed, rows, 1 << 40))
+    length = length + (-(8 + length) % 8)
+    header = store_header(packed, rows, 8 + length)
+    header = header + b' ' * (length - len(header))
+
+    with open(path, "wb") as f:
+        f.write(STORE_MAGIC + struct.pack("<I", length) + header)
+        for (name, kind, data) in packed:
+            f.write(data + b'\0' * (-len(data) % 8))
+
+def attach_worker( path ):
+    # Pool initializer: each worker maps the store once
+    global WORKER_STORE
+    WORKER_STORE = PlayerStore(path)
+
+def worker_store():
+    return WORKER_STORE
+
+def parallel_map( func, tasks, path, processes = None ):
+    # Map func over tasks in a process pool whose workers share the player store
+    pool = multiprocessing.Pool(processes, attach_worker, (path,))
+    try:
+        return pool.map(func, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+def row_chunks( rows, chunks ):
+    # Split rows into (start, stop) ranges to hand to workers
+    size = max(1, -(-rows // chunks))
+    return [(start, min(start + size, rows)) for start in range(0, rows, size)]
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global IN_FILE
+    global OUT_FILE
+
+    try:
+        opts, args = getopt.getopt(argv,"hi:o:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-o'):
+            OUT_FILE = arg
+
+    if not IN_FILE or not OUT_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    with open(IN_FILE) as f:
+        player_table = ffdo.load_player_table(f)
+    write_store(player_table, OUT_FILE)
+    print ("Player store created: " + OUT_FILE + " (%d players)" % len(player_table))
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,130 @@
+# HEADER ====================================================================================
+# File   : ff_rules.py
+# Version: 0.1
+# Summary:
+# League rules file support. A JSON rules file overrides the league, scoring, marginal
+# scoring, quality start and keeper settings of config.py. Any setting left out of the
+# file keeps its config.py value. After applying rules, ff_draft_organizer.load_settings()
+# recompiles the program settings, including the per-position scoring weight vectors.
+# RulesWatcher polls the file so a running ff_draft_organizer.py -w can rescore already
+# parsed stats when it changes.
+#
+# Example rules file:
+# {
+#     "scoring" : { "reception" : 0.5, "passing_touchdown" : 6.0 },
+#     "league"  : { "auction_money" : 200 },
+#     "keepers" : { "keepers_per_team" : 2,
+#                   "keeper_candidates" : { "Me" : [["Eddie Lacy", 43]] } }
+# }
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import json
+import os
+import config
+
+
+# GLOBALS ===================================================================================
+# Settings a rules file may change, by section
+RULE_SECTIONS = {"league"   : ["teams", "auction_money", "roster_slots", "my_team",
+                               "draft_position"],
+                 "scoring"  : ["pass_completion", "passing_yard", "passing_touchdown",
+                               "interception", "rushing_attempt", "rushing_yard",
+                               "rushing_touchdown", "reception", "receiving_yard",
+                               "receiving_touchdown", "fumble"],
+                 "marginal" : ["expected_drafted_qbs", "expected_drafted_rbs",
+                               "expected_drafted_wrs", "expected_drafted_tes",
+                               "starting_qbs", "starting_rbs", "starting_wrs",
+                               "starting_tes", "top_reserve_ratio",
+                               "elite_starter_ratio"],
+                 "quality"  : ["qb_good_start", "qb_great_start", "rb_good_start",
+                               "rb_great_start", "wr_good_start", "wr_great_start",
+                               "te_good_start", "te_great_start", "good_start_weight",
+                               "great_start_weight"],
+                 "keepers"  : ["keepers_per_team", "keeper_candidates"]}
+# config.py values, restored for settings a changed rules file no longer overrides
+DEFAULTS = {}
+for section in RULE_SECTIONS:
+    for key in RULE_SECTIONS[section]:
+        DEFAULTS[key] = getattr(config, key)
+
+
+# CLASSES ===================================================================================
+# Polls a rules file for changes
+class RulesWatcher:
+    def __init__(self, path):
+        self.path  = path
+        self.stamp = self.file_stamp()
+
+    def file_stamp( self ):
+        try:
+            info = os.stat(self.path)
+        except OSError:
+            return None
+        return (info.st_mtime, info.st_size)
+
+    def changed( self ):
+        stamp = self.file_stamp()
+        if (stamp != self.stamp):
+            self.stamp = stamp
+            return stamp is not None
+        return False
+
+
+# FUNCTIONS =================================================================================
+def load_rules( path ):
+    # Reads and checks a rules file. Raises ValueError for unknown or malformed settings.
+    with open(path) as f:
+        rules = json.load(f)
+    return check_rules(rules, path)
+
+def check_rules( rules, path ):
+    # Checks rules loaded from path and returns them with keepers as (name, price) lists
+    if not isinstance(rules, dict):
+        raise ValueError(path + ": rules must be a JSON object")
+
+    for section in rules:
+        if section not in RULE_SECTIONS:
+            raise ValueError(path + ": unknown section " + section)
+        if not isinstance(rules[section], dict):
+            raise ValueError(path + ": section " + section + " must be a JSON object")
+        for key in rules[section]:
+            if key not in RULE_SECTIONS[section]:
+                raise ValueError(path + ": unknown setting " + section + "." + key)
+            value = rules[section][key]
+            if (key == "keeper_candidates"):
+                if not isinstance(value, dict):
+                    raise ValueError(path + ": keeper_candidates must map team to keepers")
+                rules[section][key] = dict([(team, check_keepers(value[team], team, path))
+                                            for team in value])
+            elif (key == "my_team"):
+                if not isinstance(value, str):
+                    raise ValueError(path + ": my_team must be a string")
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(path + ": " + section + "." + key + " must be a number")
+
+    return rules
+
+def check_keepers( keepers, team, path ):
+    # Keepers of team as (name, price) tuples, from a list of [name, price] pairs
+    checked = []
+    if isinstance(keepers, list):
+        for keeper in keepers:
+            if not (isinstance(keeper, list) and (len(keeper) == 2) and
+                    isinstance(keeper[0], str) and not isinstance(keeper[1], bool) and
+                    isinstance(keeper[1], (int, float))):
+                break
+            checked.append((keeper[0], int(keeper[1])))
+        else:
+            return checked
+    raise ValueError(path + ": keepers of " + team + " must be [name, price] pairs")
+
+def apply_rules( rules ):
+    # Set config to config.py values overridden by the rules
+    for key in DEFAULTS:
+        setattr(config, key, DEFAULTS[key])
+    for section in rules:
+        for key in rules[section]:
+            setattr(config, key, rules[section][key])
@@ -0,0 +1,568 @@
+# HEADER ====================================================================================
+# File   : ff_server.py
+# Version: 0.1
+# Summary:
+# Draft room server for league mates watching the draft. Serves the valued player table
+# from the tab delimited file created by ff_draft_organizer.py and pushes every draft
+# event to all connected browsers with Server-Sent Events. Events are recorded through
+# the draft log (ff_draft_log.py), so a restarted server picks up where it stopped.
+# After each event only the changed players, the new dynamic inflation and the changed
+# best available lists are sent. Browsers recompute inflated values themselves.
+# With -n the injury and depth chart pages are polled in the background (ff_news.py)
+# and players whose status changed are pushed the same way.
+#
+# Routes:
+# GET  /        [draft board page]
+# GET  /events  [event stream, full table first, then diffs]
+# POST /draft   [JSON draft event: nominate, sale, pick, undo or redo, with the draft
+#               token in an X-Draft-Token header]
+#
+# The server listens on localhost unless -a gives another address. Watching the board
+# needs no token, posting draft events does: give one with -k, or a random one is made
+# and printed at start.
+#
+# Requires Python 3.7 or later (asyncio).
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import asyncio
+import hmac
+import http.client
+import json
+import os
+import random
+import secrets
+import sys
+import getopt
+import tempfile
+import time
+import ff_draft_organizer as ffdo
+import ff_draft_log
+import ff_news
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+BEST_COUNT       = 10       # Players per position in the best available lists
+QUEUE_LIMIT      = 256      # Pending messages before a slow client is dropped
+MAX_BODY         = 65536    # Largest request body accepted, in bytes
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+LOG_FILE         = 'draft.log'
+HOST             = '127.0.0.1'
+PORT             = 8014
+SIM_CLIENTS      = 0
+SIM_EVENTS       = 50
+POLL_INTERVAL    = 0
+DRAFT_TOKEN      = ''
+HELP_MSG  = (
+"Usage: python ff_server.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = connections (default), 2 = debug]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+"-l <file>    [draft log file, restored if it exists (default draft.log)]\n"
+"-m <method>  [tier method the table was created with, fixed (default) or cluster]\n"
+"-r <file>    [rules file the table was created with, JSON league/scoring settings]\n"
+"-a <address> [address to listen on, 0.0.0.0 for every interface (default 127.0.0.1)]\n"
+"-p <port>    [port to serve on (default 8014)]\n"
+"-k <token>   [draft token required to post events (default random, printed)]\n"
+"-s <clients> [simulate clients against a temporary draft log and report latency]\n"
+"-n <seconds> [poll injuries and depth charts at this interval (default off)]\n"
+"-u <url>     [base URL for the polled pages, e.g. a local ff_fixtures.py server]\n"
+)
+BOARD_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Draft Room</title>
+<style>
+body { font-family: monospace; }
+td, th { padding: 0 6px; text-align: right; }
+td:first-child { text-align: left; }
+tr.drafted { color: #999; }
+td.flag { color: #c00; }
+</style></head>
+<body>
+<h3>Dynamic Inflation: <span id="inflation"></span></h3>
+<div id="best"></div>
+<table><thead><tr><th>Player</th><th>Pos</th><th>Cat</th><th>Custom</th><th>Margin</th>
+<th>AV</th><th>Infl.</th><th>Price</th><th>Owner</th><th>DC</th><th>Status</th></tr>
+</thead>
+<tbody id="players"></tbody></table>
+<script>
+var players = {}, inflation = 1.0;
+function cell(tr, text) {
+  var td = document.createElement("td");
+  td.textContent = text;
+  tr.appendChild(td);
+  return td;
+}
+function render_row(p) {
+  var tr = document.getElementById("row-" + p.name);
+  if (!tr) {
+    tr = document.createElement("tr");
+    tr.id = "row-" + p.name;
+    document.getElementById("players").appendChild(tr);
+  }
+  tr.className = p.owner ? "drafted" : "";
+  tr.textContent = "";
+  [p.name, p.pos, p.cat, p.cus_fpts.toFixed(2), p.marg_val.toFixed(2), "$" + p.auct_val,
+   p.owner ? "" : "$" + Math.floor(p.auct_val * inflation), p.price, p.owner,
+   p.depth].forEach(function(text) { cell(tr, text); });
+  var flag = cell(tr, p.status);
+  flag.className = "flag";
+  flag.title = p.injury;
+}
+function render_best(best) {
+  var div = document.getElementById("best");
+  div.textContent = "";
+  for (var pos in best) {
+    var b = document.createElement("b");
+    b.textContent = pos;
+    div.appendChild(b);
+    div.appendChild(document.createTextNode(": " + best[pos].join(", ")));
+    div.appendChild(document.createElement("br"));
+  }
+}
+function update(msg, full) {
+  var changed = msg.players;
+  if (msg.inflation !== inflation) {
+    inflation = msg.inflation;
+    document.getElementById("inflation").textContent = inflation.toFixed(3);
+    changed = full ? changed : changed.concat(Object.keys(players).map(function(n) {
+      return players[n]; }));
+  }
+  msg.players.forEach(function(p) { players[p.name] = p; });
+  changed.forEach(function(p) { render_row(players[p.name]); });
+  if (msg.best) { render_best(msg.best); }
+}
+var source = new EventSource("/events");
+source.addEventListener("table", function(e) {
+  document.getElementById("players").textContent = "";
+  players = {};
+  inflation = null;
+  update(JSON.parse(e.data), true);
+});
+source.addEventListener("diff", function(e) { update(JSON.parse(e.data), false); });
+</script></body></html>
+"""
+
+
+# CLASSES ===================================================================================
+# Shared draft state and the connected clients
+class DraftRoom:
+    def __init__(self, draft):
+        self.draft     = draft
+        self.state     = draft.state
+        self.clients   = set()
+        self.sent      = {}
+        self.best      = {}
+        self.inflation = None
+
+        self.ranked    = {}
+        self.rank()
+        self.table()
+
+    def rank( self ):
+        # Position lists sorted on the marginal values the draft state re-tiered after
+        # the last event; best available skips drafted players
+        for pos in POSITIONS:
+            self.ranked[pos] = sorted([player for player in self.state.players.values()
+                                       if (player.pos == pos)],
+                                      key=lambda player : (player.marg_val,
+                                                           player.cus_fpts),
+                                      reverse=True)
+
+    def best_available( self ):
+        best = {}
+        for pos in POSITIONS:
+            best[pos] = []
+            for player in self.ranked[pos]:
+                if not player.owner:
+                    best[pos].append(player.name)
+                    if (len(best[pos]) >= BEST_COUNT):
+                        break
+        return best
+
+    def table( self ):
+        # Full table message for newly connected clients; resets the diff baseline
+        players = sorted(self.state.players.values(),
+                         key=lambda player : (player.marg_val, player.cus_fpts),
+                         reverse=True)
+        self.sent      = dict([(player.name, row_key(player)) for player in players])
+        self.best      = self.best_available()
+        self.inflation = self.state.inflation()
+        return {"seq"       : self.state.seq,
+                "nominee"   : self.state.nominee,
+                "inflation" : self.inflation,
+                "players"   : [player_row(player) for player in players],
+                "best"      : self.best}
+
+    def diff( self ):
+        # Only players whose owner, price, depth or injury changed since the last message
+        changed = []
+        for name in self.sent:
+            player = self.state.players[name]
+            if (self.sent[name] != row_key(player)):
+                self.sent[name] = row_key(player)
+                changed.append(player_row(player))
+
+        msg = {"seq"       : self.state.seq,
+               "nominee"   : self.state.nominee,
+               "inflation" : self.state.inflation(),
+               "players"   : changed}
+        best = self.best_available()
+        if (best != self.best):
+            self.best   = best
+            msg["best"] = best
+        self.inflation = msg["inflation"]
+        return msg
+
+    def handle_event( self, event ):
+        if not isinstance(event, dict):
+            raise ValueError("draft event must be a JSON object")
+        kind = event.get("type")
+        name = event.get("player", "")
+        if (kind in ["nominate", "sale", "pick"]) and (name not in self.state.players):
+            raise ValueError("unknown player " + name)
+        if (kind in ["sale", "pick"]) and (name in self.state.drafted):
+            raise ValueError(name + " already drafted")
+
+        if (kind == "nominate"):
+            self.draft.nominate(name)
+        elif (kind == "sale"):
+            self.draft.sale(name, event["owner"], int(event["price"]))
+        elif (kind == "pick"):
+            self.draft.pick(name, event["owner"])
+        elif (kind == "undo"):
+            if not self.draft.undo():
+                raise ValueError("nothing to undo")
+        elif (kind == "redo"):
+            if not self.draft.redo():
+                raise ValueError("nothing to redo")
+        else:
+            raise ValueError("unknown event type")
+
+        # The event re-tiered the undrafted players, their rows carry the new values
+        if (kind != "nominate"):
+            self.rank()
+        self.broadcast("diff", self.diff())
+
+    def broadcast( self, kind, msg ):
+        # Serialize once and queue the same bytes for every client
+        data = sse_message(kind, msg)
+        for queue in list(self.clients):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                # The client is too far behind, it resyncs with the full table on reconnect
+                self.clients.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+
+# FUNCTIONS =================================================================================
+def row_key( player ):
+    # Player fields that can change while the server runs, re-tiering included
+    return (player.owner, player.price, player.depth, player.injury, player.status,
+            player.cat, player.marg_val, player.auct_val)
+
+def player_row( player ):
+    return {"name"     : player.name,
+            "team"     : player.team,
+            "pos"      : player.pos,
+            "cat"      : player.cat,
+            "cus_fpts" : player.cus_fpts,
+            "marg_val" : player.marg_val,
+            "auct_val" : player.auct_val,
+            "owner"    : player.owner,
+            "price"    : player.price,
+            "depth"    : player.depth,
+            "injury"   : player.injury,
+            "status"   : player.status}
+
+def sse_message( kind, msg ):
+    return ("event: " + kind + "\ndata: " + json.dumps(msg, separators=(',', ':')) +
+            "\n\n").encode("utf-8")
+
+def http_response( writer, status, content_type, body ):
+    writer.write(("HTTP/1.1 " + status + "\r\n" +
+                  "Content-Type: " + content_type + "\r\n" +
+                  "Content-Length: %d\r\n" % len(body) +
+                  "Connection: close\r\n\r\n").encode("utf-8") + body)
+
+async def read_request( reader ):
+    # Returns (method, path, headers, body) of a simple HTTP/1.1 request, header names
+    # in lower case. Raises ValueError for a missing, invalid or too large body length.
+    request = await reader.readline()
+    parts   = request.decode("latin-1").split()
+    if (len(parts) < 2):
+        return None, None, {}, b''
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if (line in [b'\r\n', b'\n', b'']):
+            break
+        (key, sep, value) = line.decode("latin-1").partition(':')
+        headers[key.strip().lower()] = value.strip()
+    length = headers.get("content-length", "0")
+    if not length.isdigit() or (int(length) > MAX_BODY):
+        raise ValueError("bad Content-Length, at most %d bytes" % MAX_BODY)
+    length = int(length)
+    body   = await reader.readexactly(length) if length else b''
+    return parts[0], parts[1], headers, body
+
+async def stream_events( room, writer ):
+    queue = asyncio.Queue(QUEUE_LIMIT)
+    writer.write(("HTTP/1.1 200 OK\r\n" +
+                  "Content-Type: text/event-stream\r\n" +
+                  "Cache-Control: no-cache\r\n" +
+                  "Connection: keep-alive\r\n\r\n").encode("utf-8"))
+    writer.write(sse_message("table", room.table()))
+    room.clients.add(queue)
+    if (VERBOSITY >= 1):
+        print ("Client connected, %d watching" % len(room.clients))
+    try:
+        data = await queue.get()
+        while data is not None:
+            writer.write(data)
+            # Batch anything else already queued before waiting on the socket
+            while (data is not None) and not queue.empty():
+                data = queue.get_nowait()
+                if data is not None:
+                    writer.write(data)
+            await writer.drain()
+            if data is not None:
+                data = await queue.get()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        room.clients.discard(queue)
+        if (VERBOSITY >= 1):
+            print ("Client disconnected, %d watching" % len(room.clients))
+
+async def handle_client( room, reader, writer ):
+    try:
+        try:
+            method, path, headers, body = await read_request(reader)
+        except ValueError as err:
+            http_response(writer, "400 Bad Request", "application/json",
+                          json.dumps({"error" : str(err)}).encode("utf-8"))
+            await writer.drain()
+            return
+        if (method == "GET") and (path == "/"):
+            http_response(writer, "200 OK", "text/html; charset=utf-8",
+                          BOARD_PAGE.encode("utf-8"))
+        elif (method == "GET") and (path == "/events"):
+            await stream_events(room, writer)
+        elif (method == "POST") and (path == "/draft") and \
+             not hmac.compare_digest(headers.get("x-draft-token", ""), DRAFT_TOKEN):
+            http_response(writer, "403 Forbidden", "application/json",
+                          json.dumps({"error" : "bad draft token"}).encode("utf-8"))
+        elif (method == "POST") and (path == "/draft"):
+            try:
+                room.handle_event(json.loads(body.decode("utf-8")))
+                http_response(writer, "200 OK", "application/json",
+                              json.dumps({"seq" : room.state.seq}).encode("utf-8"))
+            except (ValueError, KeyError, TypeError) as err:
+                http_response(writer, "400 Bad Request", "application/json",
+                              json.dumps({"error" : str(err)}).encode("utf-8"))
+        else:
+            http_response(writer, "404 Not Found", "text/plain", b'Not Found')
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def poll_news( room, interval ):
+    # Fetch in a worker thread so clients are never blocked on the network, then apply
+    # the changes on the event loop like any other draft event
+    poller = ff_news.NewsPoller(list(room.state.players.values()))
+    loop   = asyncio.get_event_loop()
+    while True:
+        try:
+            fetched, errors = await loop.run_in_executor(None, poller.fetch)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            if (VERBOSITY >= 1):
+                print ("News poll failed: " + str(e))
+        else:
+            if (VERBOSITY >= 1):
+                for error in errors:
+                    print ("News poll failed: " + error)
+            changes = poller.apply(fetched)
+            if changes:
+                if (VERBOSITY >= 1):
+                    ff_news.print_changes(changes)
+                room.broadcast("diff", room.diff())
+        await asyncio.sleep(interval)
+
+async def serve( room, host, port ):
+    server = await asyncio.start_server(lambda reader, writer :
+                                        handle_client(room, reader, writer), host, port)
+    if (VERBOSITY >= 0):
+        print ("Draft room at http://%s:%d/" % (host, port))
+    if POLL_INTERVAL:
+        asyncio.ensure_future(poll_news(room, POLL_INTERVAL))
+    async with server:
+        await server.serve_forever()
+
+async def post_event( host, port, event ):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(event).encode("utf-8")
+    writer.write(("POST /draft HTTP/1.1\r\nHost: %s\r\n" % host +
+                  "Content-Type: application/json\r\n" +
+                  "X-Draft-Token: %s\r\n" % DRAFT_TOKEN +
+                  "Content-Length: %d\r\n\r\n" % len(body)).encode("utf-8") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+async def simulated_client( host, port, received ):
+    # Reads the event stream and records when each event sequence number arrives
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(("GET /events HTTP/1.1\r\nHost: %s\r\n\r\n" % host).encode("utf-8"))
+    await writer.drain()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.startswith(b'data: '):
+                msg = json.loads(line[6:].decode("utf-8"))
+                received.append((msg["seq"], time.perf_counter()))
+    except asyncio.CancelledError:
+        writer.close()
+
+async def simulate( room, host, clients, events ):
+    # Simulated league mates watching while random sales are posted
+    server = await asyncio.start_server(lambda reader, writer :
+                                        handle_client(room, reader, writer), host, 0)
+    port     = server.sockets[0].getsockname()[1]
+    received = [[] for i in range(clients)]
+    tasks    = [asyncio.ensure_future(simulated_client(host, port, received[i]))
+                for i in range(clients)]
+    while (len(room.clients) < clients):
+        await asyncio.sleep(0.01)
+
+    teams     = sorted(room.state.budgets.keys())
+    available = [name for name in room.state.players if (name not in room.state.drafted)]
+    latency   = []
+    for i in range(events):
+        name = available.pop(random.randrange(len(available)))
+        sent = time.perf_counter()
+        await post_event(host, port, {"type" : "sale", "player" : name,
+                                      "owner" : random.choice(teams),
+                                      "price" : random.randint(1, 20)})
+        seq = room.state.seq
+        while not all([any([entry[0] == seq for entry in client[-2:]])
+                       for client in received]):
+            await asyncio.sleep(0.0005)
+        for client in received:
+            arrived = [entry[1] for entry in client if (entry[0] == seq)][0]
+            latency.append((arrived - sent) * 1000)
+
+    for task in tasks:
+        task.cancel()
+    server.close()
+
+    latency.sort()
+    print ("Clients           : %d" % clients)
+    print ("Events            : %d" % events)
+    print ("Median latency ms : %.2f" % latency[len(latency) // 2])
+    print ("95th latency ms   : %.2f" % latency[int(len(latency) * 0.95)])
+    print ("Max latency ms    : %.2f" % latency[-1])
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global LOG_FILE
+    global PORT
+    global SIM_CLIENTS
+    global POLL_INTERVAL
+    global HOST
+    global DRAFT_TOKEN
+
+    rules_file  = ''
+    tier_method = "fixed"
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:l:m:r:a:p:k:s:n:u:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-l'):
+            LOG_FILE = arg
+        elif (opt == '-m'):
+            if ((arg == 'fixed') or (arg == 'cluster')):
+                tier_method = arg
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-r'):
+            rules_file = arg
+        elif (opt == '-a'):
+            HOST = arg
+        elif (opt == '-p'):
+            PORT = int(arg)
+        elif (opt == '-k'):
+            DRAFT_TOKEN = arg
+        elif (opt == '-s'):
+            SIM_CLIENTS = int(arg)
+        elif (opt == '-n'):
+            POLL_INTERVAL = float(arg)
+        elif (opt == '-u'):
+            ffdo.source_addresses(arg.rstrip('/'), arg.rstrip('/'))
+
+    if not IN_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    try:
+        ff_draft_log.use_settings(rules_file, tier_method)
+    except (ValueError, OSError) as e:
+        print ("Rules not applied: " + str(e))
+        sys.exit(2)
+    player_table = ff_draft_log.load_table(IN_FILE)
+
+    if not DRAFT_TOKEN:
+        DRAFT_TOKEN = secrets.token_hex(8)
+        if not SIM_CLIENTS:
+            print ("Draft token: " + DRAFT_TOKEN)
+
+    if SIM_CLIENTS:
+        # Simulations never touch the real draft log
+        VERBOSITY = 0
+        log_dir   = tempfile.mkdtemp()
+        draft     = ff_draft_log.DraftLog(os.path.join(log_dir, "sim.log"), player_table)
+        asyncio.run(simulate(DraftRoom(draft), "127.0.0.1", SIM_CLIENTS, SIM_EVENTS))
+    else:
+        draft = ff_draft_log.DraftLog(LOG_FILE, player_table)
+        try:
+            asyncio.run(serve(DraftRoom(draft), HOST, PORT))
+        except KeyboardInterrupt:
+            pass
+
+    draft.close()
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,298 @@
+# HEADER ====================================================================================
+# File   : ff_snake.py
+# Version: 0.1
+# Summary:
+# Snake draft assistant. Reads the tab delimited player table created by
+# ff_draft_organizer.py and a local average draft position (ADP) file. Each pick is
+# modeled as normally distributed around its ADP, which gives the probability that a
+# player is still available at each of your upcoming picks. Picks are recommended by the
+# expected marginal value of this pick plus the best player likely to survive to your next
+# pick.
+# The ADP file is tab or comma delimited with a header row containing a player name column
+# (Player Name, Player or Name), an ADP column (ADP or AVG) and optionally a standard
+# deviation column (Std Dev or StdDev).
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import math
+import sys
+import getopt
+import config
+import ff_draft_organizer as ffdo
+
+
+# GLOBALS ===================================================================================
+TOTAL_TEAMS      = config.teams
+ROSTER_SLOTS     = config.roster_slots
+DRAFT_POSITION   = config.draft_position
+# ADP spread when the file has no standard deviation (fraction of ADP, with a minimum)
+ADP_STDEV_RATIO  = 0.2
+ADP_STDEV_MIN    = 1.5
+# Players missing from the ADP file are treated as going undrafted
+UNDRAFTED_ADP    = TOTAL_TEAMS * ROSTER_SLOTS + 1
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+ADP_FILE         = ''
+SHOW_PLAYERS     = 25
+HELP_MSG  = (
+"Usage: python ff_snake.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = recommendation display (default), 2 = debug]\n"
+"-i <file>    [input file, tab separated player table from ff_draft_organizer.py]\n"
+"-a <file>    [ADP file, tab or comma separated]\n"
+"-p <pick>    [your pick in the first round (default from config.py)]\n"
+)
+
+
+# FUNCTIONS =================================================================================
+def parse_adp( adp_file ):
+    # Returns a list of [name, adp, stdev] with stdev 0.0 when not given. Raises
+    # ValueError when the header has no name or ADP column.
+    name_cols  = ["Player Name", "Player", "Name"]
+    adp_cols   = ["ADP", "AVG"]
+    stdev_cols = ["Std Dev", "StdDev"]
+
+    adp_table = []
+    header    = []
+    for line in adp_file:
+        line = line.rstrip('\r\n')
+        if not line:
+            continue
+        delim = '\t' if ('\t' in line) else ','
+        row   = [col.strip().strip('"') for col in line.split(delim)]
+        if not header:
+            header = row
+            name_i  = [header.index(col) for col in name_cols  if col in header]
+            adp_i   = [header.index(col) for col in adp_cols   if col in header]
+            stdev_i = [header.index(col) for col in stdev_cols if col in header]
+            if not name_i or not adp_i:
+                raise ValueError("ADP file needs a name column (" + ", ".join(name_cols) +
+                                 ") and an ADP column (" + ", ".join(adp_cols) + ")")
+            name_i = name_i[0]
+            adp_i  = adp_i[0]
+            continue
+
+        if (len(row) <= max(name_i, adp_i)):
+            continue
+        name  = row[name_i].replace("'", "")
+        adp   = float(row[adp_i])
+        stdev = float(row[stdev_i[0]]) if (stdev_i and row[stdev_i[0]]) else 0.0
+        adp_table.append([name, adp, stdev])
+
+    return adp_table
+
+def assign_adp( player_table, adp_table ):
+    # Returns parallel lists of ADP and standard deviation for the player table
+    adp   = [float(UNDRAFTED_ADP)] * len(player_table)
+    stdev = [0.0] * len(player_table)
+    index = {}
+    for i, player in enumerate(player_table):
+        index[player.name.replace("'", "")] = i
+
+    for (name, player_adp, player_stdev) in adp_table:
+        i = index.get(name)
+        if i is None:
+            # ADP sources may append team or position to the name
+            for player_name in index:
+                if (player_name in name):
+                    i = index[player_name]
+                    break
+        if i is None:
+            if (VERBOSITY >= 2):
+                print ("WARNING: " + name + " from ADP table not found in player table!")
+            continue
+        adp[i]   = player_adp
+        stdev[i] = player_stdev
+
+    for i in range(len(stdev)):
+        if (stdev[i] <= 0.0):
+            stdev[i] = max(ADP_STDEV_MIN, adp[i] * ADP_STDEV_RATIO)
+
+    return adp, stdev
+
+def my_picks( draft_position, teams = TOTAL_TEAMS, rounds = ROSTER_SLOTS ):
+    # Overall pick numbers for a snake draft slot
+    picks = []
+    for rnd in range(1, rounds + 1):
+        if (rnd % 2):
+            picks.append((rnd - 1) * teams + draft_position)
+        else:
+            picks.append(rnd * teams - draft_position + 1)
+
+    return picks
+
+def survival( adp, stdev, current, pick ):
+    # Probability each player lasts until pick given they are available after current:
+    # P(X > pick - 0.5 | X > current + 0.5) with X ~ N(adp, stdev)
+    if (pick <= current + 1):
+        return [1.0] * len(adp)
+
+    root2 = math.sqrt(2.0)
+    after = [0.5 * math.erfc((pick - 0.5 - m) / (s * root2)) for m, s in zip(adp, stdev)]
+    now   = [0.5 * math.erfc((current + 0.5 - m) / (s * root2)) for m, s in zip(adp, stdev)]
+    return [(a / n) if (n > 0.0) else 0.0 for a, n in zip(after, now)]
+
+def survival_table( adp, stdev, current, picks ):
+    # Survival probabilities for every player (rows) at each upcoming pick (columns)
+    columns = [survival(adp, stdev, current, pick) for pick in picks]
+    if not columns:
+        return [[] for i in range(len(adp))]
+    return [list(row) for row in zip(*columns)]
+
+def expected_next_value( values, surv ):
+    # Expected best value at the next pick if each player is independently available
+    # with probability surv, and the same expectation with each player removed (taken
+    # now). values must be sorted descending. Uses the suffix recursion
+    # F[k] = p[k]*v[k] + (1 - p[k])*F[k+1], so both are O(n).
+    n      = len(values)
+    suffix = [0.0] * (n + 1)
+    for k in range(n - 1, -1, -1):
+        suffix[k] = surv[k] * values[k] + (1.0 - surv[k]) * suffix[k + 1]
+
+    without = [0.0] * n
+    head    = 0.0 # expected value contributed by players ahead of k
+    reach   = 1.0 # probability nobody ahead of k is available
+    for k in range(n):
+        without[k] = head + reach * suffix[k + 1]
+        head      += reach * surv[k] * values[k]
+        reach     *= (1.0 - surv[k])
+
+    return suffix[0], without
+
+def recommend( player_table, adp, stdev, current, picks ):
+    # Rank available players by marginal value now plus the expected marginal value of
+    # the best player left at the next pick. Returns (score, survival at each of picks,
+    # player) sorted by score.
+    order  = sorted(range(len(player_table)),
+                    key=lambda i: player_table[i].marg_val, reverse=True)
+    values = [player_table[i].marg_val for i in order]
+    m      = [adp[i] for i in order]
+    s      = [stdev[i] for i in order]
+    surv   = survival_table(m, s, current, picks)
+    if picks:
+        expected, without = expected_next_value(values, [row[0] for row in surv])
+    else:
+        # Last pick, nothing left to wait for
+        without = [0.0] * len(values)
+
+    ranked = [(values[k] + without[k], surv[k], player_table[order[k]])
+              for k in range(len(order))]
+    return sorted(ranked, key=lambda entry: entry[0], reverse=True)
+
+def print_recommendations( ranked, adp_of, current, picks ):
+    print ('-' * (74 + 8 * len(picks)))
+    print ("Pick %d, survival shown for your next picks" % current)
+    print ('-' * (74 + 8 * len(picks)))
+    print ('  # | ' + "Player Name".center(30) + ' | ' + "Team " + ' | ' + "Po" + ' | ' +
+           "Marg. " + ' | ' + " ADP " + ' | ' +
+           ''.join(["%5d" % pick + ' | ' for pick in picks]) + "Score ")
+    print ('-' * (74 + 8 * len(picks)))
+    i = 1
+    for (score, surv, player) in ranked[:SHOW_PLAYERS]:
+        print ("%3d" % i                     + ' | ' +
+               player.name.ljust(30)         + ' | ' +
+               player.team.ljust(5)          + ' | ' +
+               player.pos                    + ' | ' +
+               "%6.2f"  % player.marg_val    + ' | ' +
+               "%5.1f"  % adp_of[player]     + ' | ' +
+               ''.join(["%4.0f%%" % (p * 100) + ' | ' for p in surv]) +
+               "%6.2f"  % score)
+        i += 1
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global ADP_FILE
+
+    draft_position = DRAFT_POSITION
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:a:p:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-a'):
+            ADP_FILE = arg
+        elif (opt == '-p'):
+            if arg.isdigit() and (1 <= int(arg) <= TOTAL_TEAMS):
+                draft_position = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+
+    if not IN_FILE or not ADP_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    with open(IN_FILE) as f:
+        player_table = ffdo.load_player_table(f)
+    try:
+        with open(ADP_FILE) as f:
+            adp_table = parse_adp(f)
+    except ValueError as e:
+        print (ADP_FILE + ": " + str(e))
+        sys.exit(2)
+
+    # ADP is matched once; each pick only slices the available players
+    adp, stdev = assign_adp(player_table, adp_table)
+    adp_of     = dict(zip(player_table, adp))
+    stdev_of   = dict(zip(player_table, stdev))
+
+    available = [player for player in player_table if not player.owner]
+    current   = len(player_table) - len(available) + 1
+    picks     = my_picks(draft_position)
+
+    # Every pick comes off the board; recommendations are shown before your picks
+    while available:
+        upcoming = [pick for pick in picks if (pick >= current)]
+        if not upcoming:
+            break
+
+        if (current == upcoming[0]):
+            ranked = recommend(available, [adp_of[player] for player in available],
+                               [stdev_of[player] for player in available], current,
+                               upcoming[1:4])
+            if (VERBOSITY >= 1):
+                print_recommendations(ranked, adp_of, current, upcoming[1:4])
+            else:
+                print ("Recommended: " + ranked[0][2].name)
+
+        name = input("Pick %d, player taken (blank to quit): " % current)
+        if not name:
+            break
+        taken = None
+        for player in available:
+            if (name.lower() in player.name.lower()):
+                taken = player
+                break
+        if taken is None:
+            print ("No available player matching " + name)
+            continue
+
+        taken.owner = config.my_team if (current in picks) else "Pick %d" % current
+        available.remove(taken)
+        current += 1
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,324 @@
+# HEADER ====================================================================================
+# File   : ff_trades.py
+# Version: 0.1
+# Summary:
+# In-season trade analyzer. Reads the tab delimited player table created by
+# ff_draft_organizer.py with the Owner column filled in, and scores every 1-for-1 and
+# 2-for-1 trade between two rosters by the change in each team's best starting lineup
+# (starting_* settings in config.py, fractional parts being the flex split) in custom
+# fantasy points.
+# Each roster is kept as sorted point columns per position, so a lineup is summed from
+# the top of each column plus the best leftovers for the flex slots, and a trade only
+# re-sorts the columns it touches. Before a trade is scored, an upper bound on each side's
+# gain prunes it: a received player adds at most his points over the weakest lineup slot
+# he could take, and a team never gains more than the points it receives less what its
+# best traded player alone was worth to its lineup. Team pairs are spread over a process
+# pool sharing the table as a player store (ff_player_store.py).
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import itertools
+import os
+import sys
+import getopt
+import tempfile
+import time
+import ff_draft_organizer as ffdo
+import ff_lineup
+import ff_player_store
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+# Teams built from the player store, once per pool worker
+WORKER_TEAMS     = None
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+TEAM             = ''
+TOP_TRADES       = 20
+PROCESSES        = None
+HELP_MSG  = (
+"Usage: python ff_trades.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = trades (default), 2 = team lineups]\n"
+"-i <file>    [input file, tab separated player table with the Owner column filled in]\n"
+"-t <team>    [only trades for this owner, ranked by that team's gain]\n"
+"-n <count>   [trades to list (default 20)]\n"
+"-p <count>   [worker processes (default one per CPU, 1 = no pool)]\n"
+)
+
+
+# CLASSES ===================================================================================
+# One roster with its best lineup, the lineup slot thresholds and what each player is
+# worth to the lineup
+class Team:
+    def __init__(self, name, roster, slots):
+        self.name    = name
+        self.roster  = roster     # [(player name, position, custom points)]
+        self.slots   = slots      # ff_lineup.lineup_slots()
+        self.columns = position_columns(roster)
+        self.points  = lineup_points(self.columns, slots)
+        self.floors  = lineup_floors(self.columns, slots)
+        self.losses  = dict([(player[0], self.points - self.traded_points([player], []))
+                             for player in roster])
+
+    def gain_bound( self, player ):
+        # Most a received player can add: his points over the weakest slot he could take
+        return max(0.0, player[2] - self.floors[player[1]])
+
+    def traded_points( self, gives, gets ):
+        # Best lineup points after a trade, only the columns it touches are copied
+        columns = dict(self.columns)
+        touched = set([player[1] for player in gives + gets])
+        for pos in touched:
+            columns[pos] = list(columns[pos])
+        for (name, pos, points) in gives:
+            columns[pos].remove(points)
+        for (name, pos, points) in gets:
+            columns[pos].append(points)
+        for pos in touched:
+            columns[pos].sort(reverse=True)
+        return lineup_points(columns, self.slots)
+
+
+# FUNCTIONS =================================================================================
+def team_rosters( names, positions, points, owners ):
+    # Player columns to {owner : [(name, position, custom points)]}, undrafted left out.
+    # A negative projection is never worth starting, so it counts as an open slot.
+    rosters = {}
+    for i in range(len(names)):
+        if owners[i] and (positions[i] in POSITIONS):
+            rosters.setdefault(owners[i], []).append((names[i], positions[i],
+                                                      max(0.0, points[i])))
+    return rosters
+
+def position_columns( roster ):
+    columns = dict([(pos, []) for pos in POSITIONS])
+    for (name, pos, points) in roster:
+        columns[pos].append(points)
+    for pos in POSITIONS:
+        columns[pos].sort(reverse=True)
+    return columns
+
+def lineup_points( columns, slots ):
+    # Starters from the top of each column, flex from the best of what is left
+    needs, flex, flex_pos = slots
+    total = 0.0
+    rest  = []
+    for pos in POSITIONS:
+        column = columns[pos]
+        total += sum(column[:needs[pos]])
+        if pos in flex_pos:
+            rest.extend(column[needs[pos] : needs[pos] + flex])
+    rest.sort(reverse=True)
+    return total + sum(rest[:flex])
+
+def lineup_floors( columns, slots ):
+    # Points of the weakest lineup player a new player at each position could displace,
+    # 0 for an open slot and infinite where the position cannot start
+    needs, flex, flex_pos = slots
+    rest = []
+    for pos in flex_pos:
+        rest.extend(columns[pos][needs[pos] : needs[pos] + flex])
+    rest.sort(reverse=True)
+    flex_floor = rest[flex - 1] if (len(rest) >= flex) else 0.0
+
+    floors = {}
+    for pos in POSITIONS:
+        column = columns[pos]
+        floor  = float("inf")
+        if (needs[pos] > 0):
+            floor = column[needs[pos] - 1] if (len(column) >= needs[pos]) else 0.0
+        if (pos in flex_pos) and (flex > 0):
+            floor = min(floor, flex_floor)
+        floors[pos] = floor
+    return floors
+
+def build_teams( rosters, slots ):
+    return dict([(name, Team(name, roster, slots)) for (name, roster) in rosters.items()])
+
+def worker_teams():
+    # Teams from the pool worker's player store, built on the first task
+    global WORKER_TEAMS
+    if WORKER_TEAMS is None:
+        store   = ff_player_store.worker_store()
+        rosters = team_rosters(store.column("name"), store.column("pos"),
+                               list(store.column("cus_fpts")), store.column("owner"))
+        WORKER_TEAMS = build_teams(rosters, ff_lineup.lineup_slots())
+    return WORKER_TEAMS
+
+def trade_gains( team_a, gives_a, team_b, gives_b ):
+    # (gain a, gain b), or None once either side cannot gain
+    gain_a = team_a.traded_points(gives_a, gives_b) - team_a.points
+    if (gain_a <= 0.0):
+        return None
+    gain_b = team_b.traded_points(gives_b, gives_a) - team_b.points
+    if (gain_b <= 0.0):
+        return None
+    return gain_a, gain_b
+
+def pair_trades( team_a, team_b ):
+    # Trades where both teams gain: every 1-for-1 and every 2-for-1 with team_a giving two.
+    # Returns [(gain a, gain b, team a, a gives, team b, b gives)].
+    trades = []
+    # A player either side would want at all, bound per player
+    wants_a = [(player, team_a.gain_bound(player)) for player in team_b.roster]
+    wants_b = [(player, team_b.gain_bound(player)) for player in team_a.roster]
+    wanted_a = [(player, bound) for (player, bound) in wants_a if (bound > 0.0)]
+
+    if (team_a.name < team_b.name):
+        for (a, bound_b) in wants_b:
+            if (bound_b <= 0.0):
+                continue
+            for (b, bound_a) in wanted_a:
+                # Losing a costs team_a at least losses[a], b adds at most his points
+                if (min(bound_a, b[2] - team_a.losses[a[0]]) <= 0.0):
+                    continue
+                if (min(bound_b, a[2] - team_b.losses[b[0]]) <= 0.0):
+                    continue
+                gains = trade_gains(team_a, [a], team_b, [b])
+                if gains is not None:
+                    trades.append((gains[0], gains[1], team_a.name, [a[0]],
+                                   team_b.name, [b[0]]))
+
+    for ((a1, bound_1), (a2, bound_2)) in itertools.combinations(wants_b, 2):
+        bound_b = bound_1 + bound_2
+        if (bound_b <= 0.0):
+            continue
+        # Losing both costs team_a at least what either alone was worth
+        loss_a = max(team_a.losses[a1[0]], team_a.losses[a2[0]])
+        for (b, bound_a) in wanted_a:
+            if (min(bound_a, b[2] - loss_a) <= 0.0):
+                continue
+            if (min(bound_b, a1[2] + a2[2] - team_b.losses[b[0]]) <= 0.0):
+                continue
+            gains = trade_gains(team_a, [a1, a2], team_b, [b])
+            if gains is not None:
+                trades.append((gains[0], gains[1], team_a.name, [a1[0], a2[0]],
+                               team_b.name, [b[0]]))
+    return trades
+
+def trade_key( trade, team = '' ):
+    # For one team its own gain, else the smaller of the two gains
+    (gain_a, gain_b, name_a, gives_a, name_b, gives_b) = trade
+    if (team == name_a):
+        return (gain_a, gain_b)
+    if (team == name_b):
+        return (gain_b, gain_a)
+    return (min(gain_a, gain_b), gain_a + gain_b)
+
+def scan_pair( task ):
+    # Pool task: the best trades of one ordered team pair
+    (name_a, name_b, team, top) = task
+    teams  = worker_teams()
+    trades = pair_trades(teams[name_a], teams[name_b])
+    trades.sort(key=lambda trade: trade_key(trade, team), reverse=True)
+    return trades[:top]
+
+def team_pairs( owners, team = '' ):
+    # Ordered pairs, as 2-for-1 trades are scanned with the first team giving two
+    names = sorted(set([owner for owner in owners if owner]))
+    return [(a, b) for a in names for b in names
+            if (a != b) and ((not team) or (team in (a, b)))]
+
+def scan_trades( player_table, team = '', top = 20, processes = None ):
+    # Best trades over all team pairs, with the number of pairs scanned
+    pairs = team_pairs([player.owner for player in player_table], team)
+    tasks = [(a, b, team, top) for (a, b) in pairs]
+
+    handle, path = tempfile.mkstemp(suffix=".ffps")
+    os.close(handle)
+    try:
+        ff_player_store.write_store(player_table, path)
+        if (processes == 1):
+            global WORKER_TEAMS
+            WORKER_TEAMS = None
+            ff_player_store.attach_worker(path)
+            try:
+                results = [scan_pair(task) for task in tasks]
+            finally:
+                ff_player_store.worker_store().close()
+        else:
+            results = ff_player_store.parallel_map(scan_pair, tasks, path, processes)
+    finally:
+        os.remove(path)
+
+    trades = [trade for result in results for trade in result]
+    trades.sort(key=lambda trade: trade_key(trade, team), reverse=True)
+    return trades[:top], len(pairs)
+
+def print_teams( player_table ):
+    rosters = team_rosters([player.name for player in player_table],
+                           [player.pos for player in player_table],
+                           [player.cus_fpts for player in player_table],
+                           [player.owner for player in player_table])
+    teams   = build_teams(rosters, ff_lineup.lineup_slots())
+    for name in sorted(teams):
+        print (name.ljust(20) + "%8.1f" % teams[name].points + " lineup points, " +
+               "%d players" % len(teams[name].roster))
+
+def print_trades( trades ):
+    for (gain_a, gain_b, name_a, gives_a, name_b, gives_b) in trades:
+        print (("%+7.1f" % gain_a) + ("%+7.1f" % gain_b) + "   " + name_a + " gives " +
+               ", ".join(gives_a) + "  <->  " + name_b + " gives " + ", ".join(gives_b))
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global TEAM
+    global TOP_TRADES
+    global PROCESSES
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:t:n:p:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-t'):
+            TEAM = arg
+        elif (opt == '-n'):
+            TOP_TRADES = max(1, int(arg))
+        elif (opt == '-p'):
+            PROCESSES = max(1, int(arg))
+
+    if not IN_FILE:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    with open(IN_FILE) as f:
+        player_table = ffdo.load_player_table(f)
+    if TEAM and not any([player.owner == TEAM for player in player_table]):
+        print ("No players owned by " + TEAM)
+        sys.exit(2)
+
+    if (VERBOSITY >= 2):
+        print_teams(player_table)
+    start = time.perf_counter()
+    trades, pairs = scan_trades(player_table, TEAM, TOP_TRADES, PROCESSES)
+    if (VERBOSITY >= 1):
+        print_trades(trades)
+    print ("%d team pairs scanned in %.2f s" % (pairs, time.perf_counter() - start))
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,316 @@
+# HEADER ====================================================================================
+# File   : ff_waivers.py
+# Version: 0.1
+# Summary:
+# In-season waiver wire. Keeps a persistent index of every player's projected custom
+# points and owner, started from the tab delimited player table after the draft (Owner
+# filled in). Free agents are ranked per position by the same marginal value as the
+# draft table: points over each tier cut-off of player_tiers (roster, top reserve,
+# starter, elite starter) at the expected drafted depths of config.py, the roster cut-off
+# being the replacement level. Each pickup also shows the gain over my_team's weakest
+# starter it could replace, with the starting slots of ff_lineup.py (flex included).
+# Each position keeps its points, and its free agents, as sorted lists. A roster move or
+# a new projection only moves one entry within its lists. The tier cut-offs are read
+# straight from the sorted points, and the best free agents are the top of their list.
+# Nothing is re-scraped or re-valued, so an update and a new ranking take milliseconds.
+# Projections come from ff_weekly.py output files: weekly points (summed over the weeks
+# in the file) or a rest-of-season table. A file replaces every player's points, players
+# missing from it drop to 0, so weekly and season points are never ranked together.
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import bisect
+import json
+import os
+import sys
+import getopt
+import time
+import config
+import ff_draft_organizer as ffdo
+import ff_lineup
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+
+# Program Settings
+VERBOSITY        = 1
+IN_FILE          = ''
+INDEX_FILE       = 'waivers.json'
+PICKUPS          = 10
+HELP_MSG  = (
+"Usage: python ff_waivers.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = pickups display (default), 2 = timing]\n"
+"-i <file>    [input file, player table with Owner filled in, (re)starts the index]\n"
+"-x <file>    [waiver index file, loaded if it exists (default waivers.json)]\n"
+"-n <count>   [pickups shown per position (default 10)]\n"
+)
+COMMANDS_MSG = (
+"Commands:\n"
+"w <position>                 [ranked pickups, all positions if none given]\n"
+"a <player>, <owner>          [player added to a roster]\n"
+"d <player>                   [player dropped to free agency]\n"
+"p <file>                     [new projections, ff_weekly.py weekly or ros output,\n"
+"                              players not in the file drop to 0 points]\n"
+"q                            [quit, the index is already saved]\n"
+)
+
+
+# CLASSES ===================================================================================
+# Players with points and owners, kept sorted per position
+class WaiverIndex:
+    def __init__(self, players):
+        self.players = players    # Name -> [position, team, points, owner]
+        self.ranked  = dict([(pos, []) for pos in POSITIONS])    # Points, ascending
+        self.free    = dict([(pos, []) for pos in POSITIONS])    # (points, name) ascending
+        for name in players:
+            pos, team, points, owner = players[name]
+            if pos in self.ranked:
+                self.ranked[pos].append(points)
+                if not owner:
+                    self.free[pos].append((points, name))
+        for pos in POSITIONS:
+            self.ranked[pos].sort()
+            self.free[pos].sort()
+
+    def insert( self, name ):
+        pos, team, points, owner = self.players[name]
+        if pos not in self.ranked:
+            return
+        bisect.insort(self.ranked[pos], points)
+        if not owner:
+            bisect.insort(self.free[pos], (points, name))
+
+    def remove( self, name ):
+        pos, team, points, owner = self.players[name]
+        if pos not in self.ranked:
+            return
+        ranked = self.ranked[pos]
+        del ranked[bisect.bisect_left(ranked, points)]
+        if not owner:
+            free = self.free[pos]
+            del free[bisect.bisect_left(free, (points, name))]
+
+    def update( self, name, pos = None, team = None, points = None, owner = None ):
+        # Changes one player (added if new), only its entries move in the sorted lists
+        if name in self.players:
+            self.remove(name)
+        else:
+            self.players[name] = [pos, team or "", 0.0, ""]
+        player = self.players[name]
+        if points is not None:
+            player[2] = points
+        if owner is not None:
+            player[3] = owner
+        self.insert(name)
+
+    def cut_offs( self, pos ):
+        # Points at the roster, top reserve, starter and elite starter cut-offs
+        ranked = self.ranked[pos]
+        if not ranked:
+            return []
+        return [ranked[max(len(ranked) - 1 - i, 0)] for i in ffdo.tier_indices(pos)]
+
+    def weakest_starter( self, pos, team ):
+        # Points of the starter a pickup at pos would replace: the lowest of team's
+        # starters in the slots pos can fill (its own, then the flex slots that the best
+        # of the rest take), 0 if one of those slots is open
+        needs, flex, flex_pos = ff_lineup.lineup_slots()
+        owned = dict([(other, []) for other in POSITIONS])
+        for player in self.players.values():
+            if (player[3] == team) and (player[0] in owned):
+                owned[player[0]].append(player[2])
+        for other in POSITIONS:
+            owned[other].sort(reverse=True)
+
+        starters = owned[pos][:needs[pos]]
+        if (len(starters) < needs[pos]):
+            return 0.0
+        if (pos in flex_pos) and flex:
+            rest = sorted([points for other in flex_pos
+                           for points in owned[other][needs[other]:]], reverse=True)
+            if (len(rest) < flex):
+                return 0.0
+            starters.extend(rest[:flex])
+        return min(starters) if starters else 0.0
+
+    def pickups( self, pos, count, team = None ):
+        # [(name, points, marginal value, gain over team's weakest starter)], best first.
+        # team is config.my_team unless given.
+        if team is None:
+            team = config.my_team
+        cuts    = self.cut_offs(pos)
+        weakest = self.weakest_starter(pos, team)
+        result  = []
+        for (points, name) in reversed(self.free[pos][-count:]):
+            marg_val = sum([points - cut for cut in cuts if (points >= cut)])
+            result.append((name, points, marg_val, points - weakest))
+        return result
+
+
+# FUNCTIONS =================================================================================
+def table_players( player_table ):
+    return dict([(player.name, [player.pos, player.team, player.cus_fpts, player.owner])
+                 for player in player_table])
+
+def load_index( path ):
+    with open(path) as f:
+        return WaiverIndex(json.load(f))
+
+def save_index( index, path ):
+    # Written to a temporary file and renamed, so a crash never leaves half an index
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(index.players, f)
+    os.replace(tmp_path, path)
+
+def read_projections( path ):
+    # {name : (position, team, custom points)} from a ff_weekly.py output file. Weekly
+    # files are summed per player over the weeks they hold.
+    with open(path) as f:
+        header = f.readline().rstrip('\n').split('\t')
+        if (header[0] != "Week"):
+            f.seek(0)
+            return dict([(player.name, (player.pos, player.team, player.cus_fpts))
+                         for player in ffdo.load_player_table(f)])
+        points = {}
+        for line in f:
+            row = line.rstrip('\n').split('\t')
+            if (len(row) < 6):
+                continue
+            (week, name, team, pos, fpts, cus_fpts) = row[:6]
+            total = points.get(name, (pos, team, 0.0))[2]
+            points[name] = (pos, team, total + float(cus_fpts))
+    return points
+
+def apply_projections( index, projections ):
+    # Replaces the points of every player, 0 for players not in projections so the whole
+    # index is on the file's scale. Updates only the players whose points changed,
+    # returns how many did.
+    changed = 0
+    for name in projections:
+        (pos, team, points) = projections[name]
+        player = index.players.get(name)
+        if (player is None) or (player[2] != points):
+            index.update(name, pos, team, points)
+            changed += 1
+    for name in index.players:
+        if (name not in projections) and (index.players[name][2] != 0.0):
+            index.update(name, points=0.0)
+            changed += 1
+    return changed
+
+def find_player( index, name ):
+    name = name.strip().lower()
+    for player_name in index.players:
+        if (name in player_name.lower()):
+            return player_name
+    return None
+
+def print_pickups( index, positions, count ):
+    for pos in positions:
+        cuts = index.cut_offs(pos)
+        print ('\n' + pos + " pickups, replacement level %.1f" % (cuts[0] if cuts else 0.0))
+        print ("Player".ljust(30) + "Points".rjust(8) + "Margin".rjust(8) + "Gain".rjust(8))
+        for (name, points, marg_val, gain) in index.pickups(pos, count):
+            print (name.ljust(30) + ("%.1f" % points).rjust(8) +
+                   ("%.1f" % marg_val).rjust(8) + ("%+.1f" % gain).rjust(8))
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global IN_FILE
+    global INDEX_FILE
+    global PICKUPS
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:i:x:n:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-i'):
+            IN_FILE = arg
+        elif (opt == '-x'):
+            INDEX_FILE = arg
+        elif (opt == '-n'):
+            PICKUPS = max(1, int(arg))
+
+    if IN_FILE:
+        with open(IN_FILE) as f:
+            index = WaiverIndex(table_players(ffdo.load_player_table(f)))
+        save_index(index, INDEX_FILE)
+    elif os.path.exists(INDEX_FILE):
+        index = load_index(INDEX_FILE)
+    else:
+        print (HELP_MSG)
+        sys.exit(2)
+
+    if (VERBOSITY >= 1):
+        print (COMMANDS_MSG)
+        print_pickups(index, POSITIONS, PICKUPS)
+
+    while True:
+        try:
+            line = input("Waivers> ").strip()
+        except EOFError:
+            break
+        if not line:
+            continue
+        cmd   = line[0].lower()
+        args  = [arg.strip() for arg in line[1:].split(',')]
+        start = time.perf_counter()
+
+        if (cmd == 'q'):
+            break
+        elif (cmd == 'w'):
+            pos = args[0].upper()
+            print_pickups(index, [pos] if (pos in POSITIONS) else POSITIONS, PICKUPS)
+        elif (cmd == 'p') and args[0]:
+            try:
+                projections = read_projections(args[0])
+            except (OSError, ValueError) as e:
+                print ("Projections not applied: " + str(e))
+                continue
+            changed = apply_projections(index, projections)
+            save_index(index, INDEX_FILE)
+            print ("%d players with new projections" % changed)
+        elif (cmd in "ad") and args[0]:
+            name = find_player(index, args[0])
+            if name is None:
+                print ("No player matching " + args[0])
+                continue
+            if (cmd == 'a') and (len(args) == 2):
+                index.update(name, owner=args[1])
+            elif (cmd == 'd'):
+                index.update(name, owner="")
+            else:
+                print (COMMANDS_MSG)
+                continue
+            save_index(index, INDEX_FILE)
+            if (VERBOSITY >= 1):
+                print_pickups(index, [index.players[name][0]], PICKUPS)
+        else:
+            print (COMMANDS_MSG)
+
+        if (VERBOSITY >= 2):
+            print ("Done in %.1f ms" % ((time.perf_counter() - start) * 1000))
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
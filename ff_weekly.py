@@ -0,0 +1,222 @@
+# HEADER ====================================================================================
+# File   : ff_weekly.py
+# Version: 0.1
+# Summary:
+# In-season weekly and rest-of-season projections. Weekly projection pages for every
+# week and position are fetched, parsed and scored as one pipeline of generators: worker
+# threads fetch a few pages ahead while earlier pages are parsed and scored, and each
+# scored row is written out or added to a running total as soon as it exists. At most
+# the pages in flight and one parsed page are held in memory, however many weeks are
+# requested. No full intermediate table is built.
+# Weekly mode writes one line per player and week. Rest-of-season mode sums each
+# player's points over the weeks and values the totals like the preseason table
+# (tiers, marginal value and auction value, without keepers).
+#
+# (C) Copyright 2014, All Rights Reserved
+
+
+# IMPORTS ===================================================================================
+import collections
+import concurrent.futures
+import sys
+import getopt
+import time
+import urllib.request
+import ff_draft_organizer as ffdo
+import ff_rules
+
+
+# GLOBALS ===================================================================================
+POSITIONS        = ["QB", "RB", "WR", "TE"]
+SEASON_WEEKS     = 17
+
+# Program Settings
+VERBOSITY        = 1
+MODE             = "weekly"
+WEEKS            = range(1, SEASON_WEEKS + 1)
+OUT_FILE         = ''
+RULES_FILE       = ''
+FETCH_WORKERS    = 8
+HELP_MSG  = (
+"Usage: python ff_weekly.py <-opt setting>\n"
+"-option      [description]\n"
+"-h           [help file, prints out this message]\n"
+"-v <0-2>     [verbosity, 0 = minimal, 1 = summary (default), 2 = every page]\n"
+"-m <mode>    [weekly (default) points per week, or ros for rest-of-season values]\n"
+"-w <weeks>   [weeks to project, e.g. 5 or 5-17 (default 1-17)]\n"
+"-o <file>    [output file, tab separated, if not specified then printed]\n"
+"-r <file>    [rules file, JSON league/scoring settings that override config.py]\n"
+"-j <count>   [pages fetched at the same time (default 8)]\n"
+"-u <url>     [base URL for the projection pages, e.g. a local ff_fixtures.py server]\n"
+)
+
+
+# FUNCTIONS =================================================================================
+def page_addresses( weeks ):
+    for week in weeks:
+        for position in POSITIONS:
+            yield (week, position,
+                   ffdo.PROJECTIONS_ADDR + position.lower() + ".php?week=%d" % week)
+
+def fetch_page( addr ):
+    url = urllib.request.urlopen(addr, timeout=ffdo.FETCH_TIMEOUT)
+    try:
+        return str(ffdo.read_lines(url))
+    finally:
+        url.close()
+
+def fetch_pages( pages, workers ):
+    # Page sources in order, with up to workers pages being fetched ahead
+    with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+        pending = collections.deque()
+        for (week, position, addr) in pages:
+            pending.append((week, position, pool.submit(fetch_page, addr)))
+            if (len(pending) >= workers):
+                (done_week, done_position, future) = pending.popleft()
+                yield (done_week, done_position, future.result())
+        while pending:
+            (done_week, done_position, future) = pending.popleft()
+            yield (done_week, done_position, future.result())
+
+def parse_pages( pages ):
+    # Projection rows of each page, the page source is dropped once parsed
+    for (week, position, source) in pages:
+        parser = ffdo.Projections_HTMLParser()
+        parser.feed(source)
+        if (VERBOSITY >= 2):
+            print ("Week %d %s: %d players" % (week, position, len(parser.players)))
+        for player in parser.players:
+            yield (week, position, player)
+
+def score_rows( rows ):
+    # (week, position, name, team, site points, custom points)
+    for (week, position, player) in rows:
+        name, team, stats, fpts = ffdo.projection_stats(position, player)
+        yield (week, position, name, team, fpts, ffdo.score_stats(position, stats))
+
+def weekly_points( weeks, workers ):
+    return score_rows(parse_pages(fetch_pages(page_addresses(weeks), workers)))
+
+def write_weekly( scored, out_file ):
+    # Streams one line per player and week, returns the number of rows
+    out_file.write("Week"                     + '\t' +
+                   "Player Name"              + '\t' +
+                   "Team"                     + '\t' +
+                   "Position"                 + '\t' +
+                   "Projected Fantasy Points" + '\t' +
+                   "Custom Fantasy Points"    + '\n')
+    rows = 0
+    for (week, position, name, team, fpts, cus_fpts) in scored:
+        out_file.write("%d" % week + '\t' + name + '\t' + team + '\t' + position + '\t' +
+                       fpts + '\t' + "%.2f" % cus_fpts + '\n')
+        rows += 1
+    return rows
+
+def rest_of_season( scored ):
+    # Running totals per player: [team, site points, custom points]. Returns the players
+    # with their totals and the number of rows read.
+    totals = {}
+    rows   = 0
+    for (week, position, name, team, fpts, cus_fpts) in scored:
+        total = totals.setdefault((name, position), [team, 0.0, 0.0])
+        total[1] += float(fpts or 0)
+        total[2] += cus_fpts
+        rows += 1
+
+    player_table = []
+    for ((name, position), (team, fpts, cus_fpts)) in totals.items():
+        player_table.append(ffdo.Player(name, team, position, "", "%.1f" % fpts, cus_fpts,
+                                        0.0, 0.0, 0.0, 0.0, "", "", 0, 0.0, "", "", "",
+                                        "", "", "", ""))
+    return player_table, rows
+
+def parse_weeks( arg ):
+    (first, sep, last) = arg.partition('-')
+    first = int(first)
+    last  = int(last) if sep else first
+    if not (1 <= first <= last <= SEASON_WEEKS):
+        raise ValueError("weeks must be within 1-%d" % SEASON_WEEKS)
+    return range(first, last + 1)
+
+
+# MAIN ======================================================================================
+def main(argv):
+    global VERBOSITY
+    global MODE
+    global WEEKS
+    global OUT_FILE
+    global RULES_FILE
+    global FETCH_WORKERS
+
+    try:
+        opts, args = getopt.getopt(argv,"hv:m:w:o:r:j:u:")
+    except getopt.GetoptError:
+        print (HELP_MSG)
+        sys.exit(2)
+    for opt, arg in opts:
+        if (opt == '-h'):
+            print (HELP_MSG)
+            sys.exit()
+        elif (opt == '-v'):
+            if ((arg == '0') or (arg == '1') or (arg == '2')):
+                VERBOSITY = int(arg)
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-m'):
+            if ((arg == 'weekly') or (arg == 'ros')):
+                MODE = arg
+            else:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-w'):
+            try:
+                WEEKS = parse_weeks(arg)
+            except ValueError:
+                print (HELP_MSG)
+                sys.exit(2)
+        elif (opt == '-o'):
+            OUT_FILE = arg
+        elif (opt == '-r'):
+            RULES_FILE = arg
+        elif (opt == '-j'):
+            FETCH_WORKERS = max(1, int(arg))
+        elif (opt == '-u'):
+            ffdo.source_addresses(arg.rstrip('/'), arg.rstrip('/'))
+
+    try:
+        rules = ff_rules.load_rules(RULES_FILE) if RULES_FILE else {}
+    except ValueError as e:
+        print (e)
+        sys.exit(2)
+    # Keepers only apply to the draft
+    rules.setdefault("keepers", {})["keeper_candidates"] = {}
+    ff_rules.apply_rules(rules)
+    ffdo.load_settings()
+    ffdo.VERBOSITY = min(VERBOSITY, 1)
+
+    start  = time.perf_counter()
+    scored = weekly_points(WEEKS, FETCH_WORKERS)
+    out    = open(OUT_FILE, "w") if OUT_FILE else sys.stdout
+    try:
+        if (MODE == "weekly"):
+            rows = write_weekly(scored, out)
+        else:
+            player_table, rows = rest_of_season(scored)
+            player_table, total_marg_val = ffdo.cached_value_players(player_table)
+            ffdo.print_player_table(player_table, out if OUT_FILE else False)
+    finally:
+        if OUT_FILE:
+            out.close()
+
+    if (VERBOSITY >= 1):
+        print ("Weeks %d-%d: %d pages, %d rows in %.2f s" %
+               (WEEKS[0], WEEKS[-1], len(WEEKS) * len(POSITIONS), rows,
+                time.perf_counter() - start))
+        if OUT_FILE:
+            print ("File created: " + OUT_FILE)
+
+
+# MAIN ======================================================================================
+if __name__ == "__main__":
+   main(sys.argv[1:])
@@ -0,0 +1,34 @@
+<html><body>
+<table><tr style="header"><td>ARI</td></tr><tr><td>QB1 <a href="#">Elijah Whitfield</a><br>QB2 <a href="#">Elijah Mayfield</a><br>RB1 <a href="#">Jalen Vickers</a><br>RB2 <a href="#">Hector Abernathy</a><br>WR1 <a href="#">Hector Rutherford</a><br>WR2 <a href="#">Nolan Pettaway</a><br>WR3 <a href="#">Owen Upshaw</a><br>TE1 <a href="#">Marcus Fairbanks</a><br>TE2 <a href="#">Lamar Pettaway</a><br></td></tr></table>
+<table><tr style="header"><td>ATL</td></tr><tr><td>QB1 <a href="#">Zach Galloway</a><br>RB1 <a href="#">Zach Yarbrough</a><br>RB2 <a href="#">Lamar Thigpen</a><br>RB3 <a href="#">Caleb Jessup</a><br>RB4 <a href="#">Grant Ellery</a><br>RB5 <a href="#">Caleb Ogletree</a><br>RB6 <a href="#">Tyrell Vickers</a><br>WR1 <a href="#">Preston Abernathy</a><br></td></tr></table>
+<table><tr style="header"><td>BAL</td></tr><tr><td>RB1 <a href="#">Elijah Upshaw</a><br>RB2 <a href="#">Elijah Ellery</a><br>RB3 <a href="#">Preston Upshaw</a><br>RB4 <a href="#">Isaac Rutherford</a><br>WR1 <a href="#">Xavier Stallworth</a><br>WR2 <a href="#">Victor Norwood</a><br>WR3 <a href="#">Shane Fairbanks</a><br>TE1 <a href="#">Shane Galloway</a><br>TE2 <a href="#">Nolan Lockett</a><br></td></tr></table>
+<table><tr style="header"><td>BUF</td></tr><tr><td>QB1 <a href="#">Caleb Stallworth</a><br>QB2 <a href="#">Quincy Thigpen</a><br>RB1 <a href="#">Preston Crenshaw</a><br>RB2 <a href="#">Victor Ellery</a><br>RB3 <a href="#">Victor Kirkland</a><br>RB4 <a href="#">Preston Stallworth</a><br>RB5 <a href="#">Grant Mayfield</a><br>RB6 <a href="#">Nolan Fairbanks</a><br>WR1 <a href="#">Elijah Galloway</a><br></td></tr></table>
+<table><tr style="header"><td>CAR</td></tr><tr><td>QB1 <a href="#">Nolan Yarbrough</a><br>RB1 <a href="#">Dante Yarbrough</a><br>RB2 <a href="#">Elijah Fairbanks</a><br>RB3 <a href="#">Nolan Norwood</a><br>WR1 <a href="#">Jalen Ogletree</a><br>TE1 <a href="#">Felix Thigpen</a><br></td></tr></table>
+<table><tr style="header"><td>CHI</td></tr><tr><td>RB1 <a href="#">Victor Mayfield</a><br>RB2 <a href="#">Tyrell Rutherford</a><br>WR1 <a href="#">Felix Hollins</a><br>WR2 <a href="#">Dante Hollins</a><br>WR3 <a href="#">Marcus Thigpen</a><br></td></tr></table>
+<table><tr style="header"><td>CIN</td></tr><tr><td>QB1 <a href="#">Quincy Hollins</a><br>RB1 <a href="#">Lamar Whitfield</a><br>RB2 <a href="#">Aaron Quarles</a><br>RB3 <a href="#">Zach Whitfield</a><br>WR1 <a href="#">Aaron Norwood</a><br>WR2 <a href="#">Grant Crenshaw</a><br>WR3 <a href="#">Shane Rutherford</a><br>WR4 <a href="#">Nolan Kirkland</a><br>WR5 <a href="#">Owen Mayfield</a><br>WR6 <a href="#">Preston Ingram</a><br></td></tr></table>
+<table><tr style="header"><td>CLE</td></tr><tr><td>QB1 <a href="#">Marcus Mayfield</a><br>RB1 <a href="#">Hector Yarbrough</a><br>RB2 <a href="#">Wesley Abernathy</a><br>WR1 <a href="#">Felix Quarles</a><br>WR2 <a href="#">Elijah Rutherford</a><br></td></tr></table>
+<table><tr style="header"><td>DAL</td></tr><tr><td>QB1 <a href="#">Lamar Norwood</a><br>QB2 <a href="#">Dante Pettaway</a><br>RB1 <a href="#">Reggie Mayfield</a><br>WR1 <a href="#">Preston Galloway</a><br>WR2 <a href="#">Zach Quarles</a><br>TE1 <a href="#">Zach Upshaw</a><br>TE2 <a href="#">Isaac Vickers</a><br></td></tr></table>
+<table><tr style="header"><td>DEN</td></tr><tr><td>QB1 <a href="#">Quincy Abernathy</a><br>RB1 <a href="#">Owen Lockett</a><br></td></tr></table>
+<table><tr style="header"><td>DET</td></tr><tr><td>QB1 <a href="#">Owen Ogletree</a><br>RB1 <a href="#">Zach Pettaway</a><br>WR1 <a href="#">Grant Rutherford</a><br>WR2 <a href="#">Grant Lockett</a><br>TE1 <a href="#">Wesley Whitfield</a><br>TE2 <a href="#">Victor Pettaway</a><br></td></tr></table>
+<table><tr style="header"><td>GB</td></tr><tr><td>QB1 <a href="#">Reggie Jessup</a><br>QB2 <a href="#">Isaac Stallworth</a><br>QB3 <a href="#">Hector Galloway</a><br>QB4 <a href="#">Zach Bledsoe</a><br>RB1 <a href="#">Dante Stallworth</a><br>RB2 <a href="#">Blake Stallworth</a><br>RB3 <a href="#">Aaron Fairbanks</a><br>RB4 <a href="#">Shane Dunmore</a><br>WR1 <a href="#">Quincy Crenshaw</a><br>WR2 <a href="#">Dante Ellery</a><br>WR3 <a href="#">Reggie Quarles</a><br>TE1 <a href="#">Tyrell Pettaway</a><br></td></tr></table>
+<table><tr style="header"><td>HOU</td></tr><tr><td>QB1 <a href="#">Hector Upshaw</a><br>QB2 <a href="#">Lamar Mayfield</a><br>RB1 <a href="#">Tyrell Jessup</a><br>WR1 <a href="#">Zach Ellery</a><br>WR2 <a href="#">Nolan Abernathy</a><br></td></tr></table>
+<table><tr style="header"><td>IND</td></tr><tr><td>QB1 <a href="#">Jalen Jessup</a><br>QB2 <a href="#">Blake Abernathy</a><br>WR1 <a href="#">Wesley Lockett</a><br>WR2 <a href="#">Zach Thigpen</a><br>WR3 <a href="#">Marcus Whitfield</a><br>WR4 <a href="#">Caleb Mayfield</a><br>TE1 <a href="#">Preston Quarles</a><br></td></tr></table>
+<table><tr style="header"><td>JAC</td></tr><tr><td>QB1 <a href="#">Jalen Norwood</a><br>QB2 <a href="#">Keenan Yarbrough</a><br>RB1 <a href="#">Grant Bledsoe</a><br>RB2 <a href="#">Aaron Hollins</a><br>RB3 <a href="#">Nolan Rutherford</a><br></td></tr></table>
+<table><tr style="header"><td>KC</td></tr><tr><td>QB1 <a href="#">Felix Galloway</a><br>QB2 <a href="#">Caleb Ellery</a><br>RB1 <a href="#">Lamar Vickers</a><br>WR1 <a href="#">Elijah Kirkland</a><br>WR2 <a href="#">Felix Yarbrough</a><br>WR3 <a href="#">Jalen Quarles</a><br>WR4 <a href="#">Owen Bledsoe</a><br>TE1 <a href="#">Shane Norwood</a><br>TE2 <a href="#">Elijah Ogletree</a><br></td></tr></table>
+<table><tr style="header"><td>MIA</td></tr><tr><td>RB1 <a href="#">Dante Vickers</a><br>RB2 <a href="#">Keenan Abernathy</a><br>RB3 <a href="#">Shane Upshaw</a><br>RB4 <a href="#">Caleb Thigpen</a><br>RB5 <a href="#">Quincy Stallworth</a><br>WR1 <a href="#">Wesley Rutherford</a><br>WR2 <a href="#">Wesley Norwood</a><br>WR3 <a href="#">Preston Pettaway</a><br>TE1 <a href="#">Xavier Galloway</a><br>TE2 <a href="#">Dante Norwood</a><br></td></tr></table>
+<table><tr style="header"><td>MIN</td></tr><tr><td>QB1 <a href="#">Aaron Upshaw</a><br>RB1 <a href="#">Quincy Kirkland</a><br>RB2 <a href="#">Zach Rutherford</a><br>WR1 <a href="#">Zach Ogletree</a><br>WR2 <a href="#">Grant Yarbrough</a><br>WR3 <a href="#">Dante Ingram</a><br>WR4 <a href="#">Felix Ellery</a><br></td></tr></table>
+<table><tr style="header"><td>NE</td></tr><tr><td>RB1 <a href="#">Tyrell Hollins</a><br>RB2 <a href="#">Preston Yarbrough</a><br>RB3 <a href="#">Felix Ingram</a><br>TE1 <a href="#">Xavier Kirkland</a><br>TE2 <a href="#">Elijah Stallworth</a><br>TE3 <a href="#">Blake Rutherford</a><br></td></tr></table>
+<table><tr style="header"><td>NO</td></tr><tr><td>QB1 <a href="#">Grant Vickers</a><br>QB2 <a href="#">Elijah Yarbrough</a><br>RB1 <a href="#">Keenan Ellery</a><br>RB2 <a href="#">Reggie Bledsoe</a><br>RB3 <a href="#">Marcus Ingram</a><br>WR1 <a href="#">Blake Kirkland</a><br>WR2 <a href="#">Felix Norwood</a><br>TE1 <a href="#">Victor Ogletree</a><br></td></tr></table>
+<table><tr style="header"><td>NYG</td></tr><tr><td>QB1 <a href="#">Hector Kirkland</a><br>RB1 <a href="#">Aaron Jessup</a><br>RB2 <a href="#">Quincy Galloway</a><br>WR1 <a href="#">Keenan Quarles</a><br>WR2 <a href="#">Grant Upshaw</a><br>TE1 <a href="#">Wesley Vickers</a><br>TE2 <a href="#">Tyrell Yarbrough</a><br>TE3 <a href="#">Hector Vickers</a><br></td></tr></table>
+<table><tr style="header"><td>NYJ</td></tr><tr><td>RB1 <a href="#">Nolan Jessup</a><br>RB2 <a href="#">Dante Quarles</a><br>WR1 <a href="#">Grant Abernathy</a><br>WR2 <a href="#">Wesley Bledsoe</a><br>WR3 <a href="#">Nolan Stallworth</a><br></td></tr></table>
+<table><tr style="header"><td>OAK</td></tr><tr><td>QB1 <a href="#">Marcus Dunmore</a><br>QB2 <a href="#">Grant Jessup</a><br>RB1 <a href="#">Isaac Yarbrough</a><br>WR1 <a href="#">Felix Pettaway</a><br>WR2 <a href="#">Nolan Quarles</a><br>WR3 <a href="#">Blake Lockett</a><br></td></tr></table>
+<table><tr style="header"><td>PHI</td></tr><tr><td>RB1 <a href="#">Blake Pettaway</a><br>WR1 <a href="#">Dante Bledsoe</a><br>WR2 <a href="#">Blake Bledsoe</a><br>WR3 <a href="#">Shane Vickers</a><br>WR4 <a href="#">Blake Whitfield</a><br>WR5 <a href="#">Nolan Dunmore</a><br>TE1 <a href="#">Marcus Ogletree</a><br>TE2 <a href="#">Marcus Upshaw</a><br>TE3 <a href="#">Wesley Dunmore</a><br></td></tr></table>
+<table><tr style="header"><td>PIT</td></tr><tr><td>QB1 <a href="#">Blake Galloway</a><br>WR1 <a href="#">Lamar Lockett</a><br>WR2 <a href="#">Caleb Norwood</a><br>WR3 <a href="#">Felix Ogletree</a><br>WR4 <a href="#">Owen Vickers</a><br>TE1 <a href="#">Blake Ellery</a><br>TE2 <a href="#">Wesley Mayfield</a><br>TE3 <a href="#">Blake Crenshaw</a><br></td></tr></table>
+<table><tr style="header"><td>SD</td></tr><tr><td>QB1 <a href="#">Nolan Mayfield</a><br>RB1 <a href="#">Felix Vickers</a><br>RB2 <a href="#">Shane Ellery</a><br>RB3 <a href="#">Blake Fairbanks</a><br>RB4 <a href="#">Xavier Pettaway</a><br>WR1 <a href="#">Xavier Bledsoe</a><br>WR2 <a href="#">Aaron Galloway</a><br>TE1 <a href="#">Shane Quarles</a><br>TE2 <a href="#">Zach Kirkland</a><br></td></tr></table>
+<table><tr style="header"><td>SEA</td></tr><tr><td>QB1 <a href="#">Aaron Ingram</a><br>RB1 <a href="#">Nolan Whitfield</a><br>RB2 <a href="#">Owen Yarbrough</a><br>RB3 <a href="#">Hector Dunmore</a><br>WR1 <a href="#">Hector Norwood</a><br>WR2 <a href="#">Quincy Dunmore</a><br>WR3 <a href="#">Tyrell Thigpen</a><br>WR4 <a href="#">Keenan Fairbanks</a><br>WR5 <a href="#">Dante Rutherford</a><br></td></tr></table>
+<table><tr style="header"><td>SF</td></tr><tr><td>RB1 <a href="#">Quincy Norwood</a><br>RB2 <a href="#">Reggie Lockett</a><br>WR1 <a href="#">Xavier Ingram</a><br></td></tr></table>
+<table><tr style="header"><td>STL</td></tr><tr><td>QB1 <a href="#">Quincy Bledsoe</a><br>RB1 <a href="#">Jalen Stallworth</a><br>RB2 <a href="#">Preston Fairbanks</a><br>RB3 <a href="#">Keenan Lockett</a><br>WR1 <a href="#">Reggie Ogletree</a><br>WR2 <a href="#">Keenan Dunmore</a><br>WR3 <a href="#">Isaac Norwood</a><br>WR4 <a href="#">Quincy Mayfield</a><br>TE1 <a href="#">Hector Hollins</a><br></td></tr></table>
+<table><tr style="header"><td>TB</td></tr><tr><td>QB1 <a href="#">Preston Jessup</a><br>RB1 <a href="#">Wesley Jessup</a><br>RB2 <a href="#">Keenan Crenshaw</a><br>RB3 <a href="#">Reggie Ellery</a><br>WR1 <a href="#">Blake Upshaw</a><br>WR2 <a href="#">Victor Whitfield</a><br>WR3 <a href="#">Isaac Pettaway</a><br>WR4 <a href="#">Wesley Galloway</a><br>TE1 <a href="#">Victor Quarles</a><br>TE2 <a href="#">Xavier Whitfield</a><br>TE3 <a href="#">Marcus Rutherford</a><br></td></tr></table>
+<table><tr style="header"><td>TEN</td></tr><tr><td>RB1 <a href="#">Marcus Kirkland</a><br></td></tr></table>
+<table><tr style="header"><td>WAS</td></tr><tr><td>QB1 <a href="#">Isaac Thigpen</a><br>RB1 <a href="#">Dante Crenshaw</a><br>RB2 <a href="#">Xavier Ellery</a><br>RB3 <a href="#">Lamar Abernathy</a><br>RB4 <a href="#">Caleb Ingram</a><br>RB5 <a href="#">Felix Bledsoe</a><br>WR1 <a href="#">Reggie Stallworth</a><br>TE1 <a href="#">Wesley Quarles</a><br>TE2 <a href="#">Aaron Ellery</a><br></td></tr></table>
+</body></html>
@@ -0,0 +1,40 @@
+<html><body>
+<table id="experts"><tr><td>Consensus</td><td>FantasyPros</td><td>Fixture</td></tr></table>
+<table id="data"><thead><tr><th>Player</th></tr></thead><tbody>
+<tr><td><a href="#">Lamar Norwood</a> <small>DAL</small></td><td>625.3</td><td>394.0</td><td>4,564.8</td><td>28.5</td><td>13.9</td><td>48.0</td><td>215.9</td><td>1.8</td><td>3.9</td><td>293.4</td></tr>
+<tr><td><a href="#">Grant Vickers</a> <small>NO</small></td><td>627.8</td><td>395.5</td><td>4,582.8</td><td>28.6</td><td>14.0</td><td>43.6</td><td>196.0</td><td>1.6</td><td>3.6</td><td>292.2</td></tr>
+<tr><td><a href="#">Reggie Jessup</a> <small>GB</small></td><td>508.6</td><td>320.4</td><td>3,712.6</td><td>23.2</td><td>11.3</td><td>47.5</td><td>213.7</td><td>1.8</td><td>4.2</td><td>242.4</td></tr>
+<tr><td><a href="#">Quincy Hollins</a> <small>CIN</small></td><td>503.4</td><td>317.2</td><td>3,674.9</td><td>23.0</td><td>11.2</td><td>40.3</td><td>181.4</td><td>1.5</td><td>3.5</td><td>236.8</td></tr>
+<tr><td><a href="#">Quincy Bledsoe</a> <small>STL</small></td><td>576.0</td><td>362.8</td><td>4,204.4</td><td>26.3</td><td>12.8</td><td>51.9</td><td>233.5</td><td>1.9</td><td>4.1</td><td>274.5</td></tr>
+<tr><td><a href="#">Nolan Mayfield</a> <small>SD</small></td><td>518.6</td><td>326.7</td><td>3,785.4</td><td>23.7</td><td>11.5</td><td>41.9</td><td>188.6</td><td>1.6</td><td>3.7</td><td>243.8</td></tr>
+<tr><td><a href="#">Felix Galloway</a> <small>KC</small></td><td>459.1</td><td>289.2</td><td>3,351.3</td><td>20.9</td><td>10.2</td><td>46.5</td><td>209.1</td><td>1.7</td><td>3.2</td><td>222.5</td></tr>
+<tr><td><a href="#">Quincy Abernathy</a> <small>DEN</small></td><td>487.8</td><td>307.3</td><td>3,561.0</td><td>22.3</td><td>10.8</td><td>46.9</td><td>210.8</td><td>1.8</td><td>3.2</td><td>234.9</td></tr>
+<tr><td><a href="#">Elijah Yarbrough</a> <small>NO</small></td><td>461.0</td><td>290.5</td><td>3,365.6</td><td>21.0</td><td>10.2</td><td>43.3</td><td>194.7</td><td>1.6</td><td>2.9</td><td>221.7</td></tr>
+<tr><td><a href="#">Marcus Mayfield</a> <small>CLE</small></td><td>430.8</td><td>271.4</td><td>3,144.6</td><td>19.7</td><td>9.6</td><td>35.6</td><td>160.2</td><td>1.3</td><td>3.3</td><td>202.7</td></tr>
+<tr><td><a href="#">Marcus Dunmore</a> <small>OAK</small></td><td>406.9</td><td>256.4</td><td>2,970.7</td><td>18.6</td><td>9.0</td><td>39.5</td><td>177.5</td><td>1.5</td><td>3.3</td><td>195.0</td></tr>
+<tr><td><a href="#">Isaac Stallworth</a> <small>GB</small></td><td>443.1</td><td>279.2</td><td>3,234.9</td><td>20.2</td><td>9.8</td><td>34.7</td><td>156.3</td><td>1.3</td><td>2.6</td><td>208.9</td></tr>
+<tr><td><a href="#">Elijah Whitfield</a> <small>ARI</small></td><td>384.2</td><td>242.1</td><td>2,805.0</td><td>17.5</td><td>8.5</td><td>31.6</td><td>142.3</td><td>1.2</td><td>2.6</td><td>181.3</td></tr>
+<tr><td><a href="#">Jalen Norwood</a> <small>JAC</small></td><td>351.6</td><td>221.5</td><td>2,567.0</td><td>16.0</td><td>7.8</td><td>34.6</td><td>155.7</td><td>1.3</td><td>2.4</td><td>169.9</td></tr>
+<tr><td><a href="#">Hector Kirkland</a> <small>NYG</small></td><td>432.7</td><td>272.6</td><td>3,159.0</td><td>19.7</td><td>9.6</td><td>33.6</td><td>151.3</td><td>1.3</td><td>2.9</td><td>203.1</td></tr>
+<tr><td><a href="#">Hector Galloway</a> <small>GB</small></td><td>436.5</td><td>275.0</td><td>3,186.3</td><td>19.9</td><td>9.7</td><td>36.2</td><td>163.0</td><td>1.4</td><td>2.3</td><td>207.6</td></tr>
+<tr><td><a href="#">Keenan Yarbrough</a> <small>JAC</small></td><td>384.1</td><td>242.0</td><td>2,803.6</td><td>17.5</td><td>8.5</td><td>28.2</td><td>127.0</td><td>1.1</td><td>2.1</td><td>180.0</td></tr>
+<tr><td><a href="#">Preston Jessup</a> <small>TB</small></td><td>378.4</td><td>238.4</td><td>2,762.0</td><td>17.3</td><td>8.4</td><td>31.8</td><td>143.3</td><td>1.2</td><td>2.5</td><td>179.2</td></tr>
+<tr><td><a href="#">Caleb Stallworth</a> <small>BUF</small></td><td>358.3</td><td>225.8</td><td>2,615.8</td><td>16.3</td><td>8.0</td><td>29.3</td><td>131.8</td><td>1.1</td><td>2.4</td><td>169.1</td></tr>
+<tr><td><a href="#">Grant Jessup</a> <small>OAK</small></td><td>295.1</td><td>185.9</td><td>2,154.1</td><td>13.5</td><td>6.6</td><td>28.6</td><td>128.9</td><td>1.1</td><td>2.5</td><td>141.3</td></tr>
+<tr><td><a href="#">Hector Upshaw</a> <small>HOU</small></td><td>315.3</td><td>198.6</td><td>2,301.5</td><td>14.4</td><td>7.0</td><td>26.0</td><td>116.8</td><td>1.0</td><td>2.1</td><td>148.9</td></tr>
+<tr><td><a href="#">Blake Galloway</a> <small>PIT</small></td><td>306.4</td><td>193.0</td><td>2,236.7</td><td>14.0</td><td>6.8</td><td>25.0</td><td>112.7</td><td>0.9</td><td>1.7</td><td>145.2</td></tr>
+<tr><td><a href="#">Isaac Thigpen</a> <small>WAS</small></td><td>289.0</td><td>182.1</td><td>2,109.6</td><td>13.2</td><td>6.4</td><td>25.1</td><td>113.2</td><td>0.9</td><td>2.1</td><td>137.1</td></tr>
+<tr><td><a href="#">Aaron Ingram</a> <small>SEA</small></td><td>236.1</td><td>148.8</td><td>1,723.9</td><td>10.8</td><td>5.2</td><td>24.9</td><td>112.0</td><td>0.9</td><td>1.7</td><td>115.0</td></tr>
+<tr><td><a href="#">Owen Ogletree</a> <small>DET</small></td><td>241.8</td><td>152.3</td><td>1,765.2</td><td>11.0</td><td>5.4</td><td>21.7</td><td>97.6</td><td>0.8</td><td>1.9</td><td>114.9</td></tr>
+<tr><td><a href="#">Zach Bledsoe</a> <small>GB</small></td><td>270.7</td><td>170.5</td><td>1,976.1</td><td>12.4</td><td>6.0</td><td>22.8</td><td>102.4</td><td>0.9</td><td>1.8</td><td>128.2</td></tr>
+<tr><td><a href="#">Jalen Jessup</a> <small>IND</small></td><td>199.9</td><td>125.9</td><td>1,459.2</td><td>9.1</td><td>4.4</td><td>20.1</td><td>90.3</td><td>0.8</td><td>1.5</td><td>96.5</td></tr>
+<tr><td><a href="#">Elijah Mayfield</a> <small>ARI</small></td><td>234.5</td><td>147.7</td><td>1,711.8</td><td>10.7</td><td>5.2</td><td>15.7</td><td>70.8</td><td>0.6</td><td>1.3</td><td>108.9</td></tr>
+<tr><td><a href="#">Nolan Yarbrough</a> <small>CAR</small></td><td>203.2</td><td>128.0</td><td>1,483.7</td><td>9.3</td><td>4.5</td><td>17.3</td><td>77.8</td><td>0.6</td><td>1.2</td><td>96.6</td></tr>
+<tr><td><a href="#">Dante Pettaway</a> <small>DAL</small></td><td>156.6</td><td>98.6</td><td>1,143.0</td><td>7.1</td><td>3.5</td><td>13.7</td><td>61.5</td><td>0.5</td><td>1.1</td><td>74.4</td></tr>
+<tr><td><a href="#">Lamar Mayfield</a> <small>HOU</small></td><td>157.9</td><td>99.5</td><td>1,153.0</td><td>7.2</td><td>3.5</td><td>15.8</td><td>71.1</td><td>0.6</td><td>1.2</td><td>76.2</td></tr>
+<tr><td><a href="#">Zach Galloway</a> <small>ATL</small></td><td>139.8</td><td>88.1</td><td>1,020.4</td><td>6.4</td><td>3.1</td><td>12.2</td><td>55.0</td><td>0.5</td><td>1.0</td><td>66.3</td></tr>
+<tr><td><a href="#">Quincy Thigpen</a> <small>BUF</small></td><td>132.9</td><td>83.7</td><td>970.2</td><td>6.1</td><td>3.0</td><td>10.1</td><td>45.5</td><td>0.4</td><td>0.9</td><td>62.2</td></tr>
+<tr><td><a href="#">Caleb Ellery</a> <small>KC</small></td><td>133.7</td><td>84.2</td><td>975.8</td><td>6.1</td><td>3.0</td><td>10.8</td><td>48.7</td><td>0.4</td><td>0.7</td><td>63.3</td></tr>
+<tr><td><a href="#">Blake Abernathy</a> <small>IND</small></td><td>98.9</td><td>62.3</td><td>722.1</td><td>4.5</td><td>2.2</td><td>7.9</td><td>35.7</td><td>0.3</td><td>0.7</td><td>46.6</td></tr>
+<tr><td><a href="#">Aaron Upshaw</a> <small>MIN</small></td><td>81.7</td><td>51.5</td><td>596.8</td><td>3.7</td><td>1.8</td><td>8.5</td><td>38.4</td><td>0.3</td><td>0.5</td><td>39.8</td></tr>
+</tbody></table></body></html>
@@ -0,0 +1,84 @@
+<html><body>
+<table id="experts"><tr><td>Consensus</td><td>FantasyPros</td><td>Fixture</td></tr></table>
+<table id="data"><thead><tr><th>Player</th></tr></thead><tbody>
+<tr><td><a href="#">Aaron Jessup</a> <small>NYG</small></td><td>307.8</td><td>1,323.6</td><td>9.5</td><td>42.4</td><td>360.7</td><td>2.0</td><td>2.2</td><td>232.8</td></tr>
+<tr><td><a href="#">Marcus Kirkland</a> <small>TEN</small></td><td>272.7</td><td>1,172.4</td><td>8.4</td><td>44.5</td><td>378.0</td><td>2.1</td><td>2.0</td><td>213.9</td></tr>
+<tr><td><a href="#">Hector Yarbrough</a> <small>CLE</small></td><td>268.0</td><td>1,152.5</td><td>8.2</td><td>46.4</td><td>394.2</td><td>2.2</td><td>2.1</td><td>212.9</td></tr>
+<tr><td><a href="#">Jalen Vickers</a> <small>ARI</small></td><td>280.8</td><td>1,207.3</td><td>8.6</td><td>40.3</td><td>342.9</td><td>1.9</td><td>1.7</td><td>214.8</td></tr>
+<tr><td><a href="#">Dante Vickers</a> <small>MIA</small></td><td>322.7</td><td>1,387.6</td><td>9.9</td><td>46.8</td><td>397.7</td><td>2.2</td><td>1.8</td><td>247.6</td></tr>
+<tr><td><a href="#">Victor Mayfield</a> <small>CHI</small></td><td>267.2</td><td>1,149.2</td><td>8.2</td><td>48.5</td><td>412.5</td><td>2.3</td><td>1.7</td><td>215.8</td></tr>
+<tr><td><a href="#">Dante Stallworth</a> <small>GB</small></td><td>306.1</td><td>1,316.1</td><td>9.4</td><td>43.4</td><td>369.2</td><td>2.1</td><td>2.0</td><td>233.1</td></tr>
+<tr><td><a href="#">Grant Bledsoe</a> <small>JAC</small></td><td>318.5</td><td>1,369.7</td><td>9.8</td><td>41.5</td><td>352.4</td><td>2.0</td><td>2.1</td><td>238.4</td></tr>
+<tr><td><a href="#">Lamar Vickers</a> <small>KC</small></td><td>234.4</td><td>1,007.7</td><td>7.2</td><td>39.8</td><td>338.2</td><td>1.9</td><td>2.0</td><td>185.0</td></tr>
+<tr><td><a href="#">Zach Yarbrough</a> <small>ATL</small></td><td>305.3</td><td>1,312.8</td><td>9.4</td><td>39.6</td><td>336.4</td><td>1.9</td><td>1.9</td><td>228.5</td></tr>
+<tr><td><a href="#">Preston Crenshaw</a> <small>BUF</small></td><td>273.3</td><td>1,175.4</td><td>8.4</td><td>41.2</td><td>350.2</td><td>1.9</td><td>1.8</td><td>211.1</td></tr>
+<tr><td><a href="#">Isaac Yarbrough</a> <small>OAK</small></td><td>228.3</td><td>981.8</td><td>7.0</td><td>38.8</td><td>330.2</td><td>1.8</td><td>1.9</td><td>180.5</td></tr>
+<tr><td><a href="#">Lamar Thigpen</a> <small>ATL</small></td><td>276.0</td><td>1,186.9</td><td>8.5</td><td>42.0</td><td>357.4</td><td>2.0</td><td>1.9</td><td>213.4</td></tr>
+<tr><td><a href="#">Elijah Upshaw</a> <small>BAL</small></td><td>272.4</td><td>1,171.4</td><td>8.4</td><td>40.1</td><td>341.2</td><td>1.9</td><td>1.7</td><td>209.5</td></tr>
+<tr><td><a href="#">Dante Yarbrough</a> <small>CAR</small></td><td>239.4</td><td>1,029.6</td><td>7.4</td><td>39.4</td><td>334.6</td><td>1.9</td><td>1.5</td><td>188.6</td></tr>
+<tr><td><a href="#">Keenan Abernathy</a> <small>MIA</small></td><td>257.6</td><td>1,107.7</td><td>7.9</td><td>35.1</td><td>298.5</td><td>1.7</td><td>1.7</td><td>194.6</td></tr>
+<tr><td><a href="#">Dante Crenshaw</a> <small>WAS</small></td><td>226.8</td><td>975.1</td><td>7.0</td><td>32.2</td><td>273.6</td><td>1.5</td><td>1.6</td><td>172.7</td></tr>
+<tr><td><a href="#">Lamar Whitfield</a> <small>CIN</small></td><td>273.2</td><td>1,174.6</td><td>8.4</td><td>37.7</td><td>320.5</td><td>1.8</td><td>1.4</td><td>207.7</td></tr>
+<tr><td><a href="#">Nolan Whitfield</a> <small>SEA</small></td><td>243.1</td><td>1,045.2</td><td>7.5</td><td>38.5</td><td>327.3</td><td>1.8</td><td>1.8</td><td>189.4</td></tr>
+<tr><td><a href="#">Aaron Hollins</a> <small>JAC</small></td><td>239.7</td><td>1,030.6</td><td>7.4</td><td>37.6</td><td>319.9</td><td>1.8</td><td>1.6</td><td>186.7</td></tr>
+<tr><td><a href="#">Shane Upshaw</a> <small>MIA</small></td><td>239.0</td><td>1,027.6</td><td>7.3</td><td>36.7</td><td>311.9</td><td>1.7</td><td>1.5</td><td>185.4</td></tr>
+<tr><td><a href="#">Owen Yarbrough</a> <small>SEA</small></td><td>259.2</td><td>1,114.5</td><td>8.0</td><td>36.1</td><td>306.7</td><td>1.7</td><td>1.3</td><td>197.4</td></tr>
+<tr><td><a href="#">Quincy Kirkland</a> <small>MIN</small></td><td>243.6</td><td>1,047.6</td><td>7.5</td><td>34.0</td><td>288.8</td><td>1.6</td><td>1.5</td><td>185.1</td></tr>
+<tr><td><a href="#">Quincy Galloway</a> <small>NYG</small></td><td>231.4</td><td>994.9</td><td>7.1</td><td>35.0</td><td>297.8</td><td>1.7</td><td>1.3</td><td>179.2</td></tr>
+<tr><td><a href="#">Felix Vickers</a> <small>SD</small></td><td>249.4</td><td>1,072.6</td><td>7.7</td><td>36.4</td><td>309.8</td><td>1.7</td><td>1.3</td><td>191.9</td></tr>
+<tr><td><a href="#">Keenan Ellery</a> <small>NO</small></td><td>217.8</td><td>936.6</td><td>6.7</td><td>28.8</td><td>245.0</td><td>1.4</td><td>1.5</td><td>163.5</td></tr>
+<tr><td><a href="#">Victor Ellery</a> <small>BUF</small></td><td>221.0</td><td>950.2</td><td>6.8</td><td>35.4</td><td>301.3</td><td>1.7</td><td>1.4</td><td>173.0</td></tr>
+<tr><td><a href="#">Quincy Norwood</a> <small>SF</small></td><td>191.1</td><td>821.9</td><td>5.9</td><td>28.3</td><td>240.2</td><td>1.3</td><td>1.3</td><td>146.9</td></tr>
+<tr><td><a href="#">Nolan Jessup</a> <small>NYJ</small></td><td>187.3</td><td>805.3</td><td>5.8</td><td>36.0</td><td>305.7</td><td>1.7</td><td>1.3</td><td>153.3</td></tr>
+<tr><td><a href="#">Victor Kirkland</a> <small>BUF</small></td><td>208.1</td><td>894.9</td><td>6.4</td><td>30.3</td><td>257.4</td><td>1.4</td><td>1.3</td><td>159.5</td></tr>
+<tr><td><a href="#">Zach Rutherford</a> <small>MIN</small></td><td>211.8</td><td>910.7</td><td>6.5</td><td>27.1</td><td>230.3</td><td>1.3</td><td>1.3</td><td>158.2</td></tr>
+<tr><td><a href="#">Dante Quarles</a> <small>NYJ</small></td><td>217.0</td><td>932.9</td><td>6.7</td><td>27.2</td><td>231.3</td><td>1.3</td><td>1.2</td><td>161.8</td></tr>
+<tr><td><a href="#">Owen Lockett</a> <small>DEN</small></td><td>216.9</td><td>932.9</td><td>6.7</td><td>29.2</td><td>248.2</td><td>1.4</td><td>1.2</td><td>164.0</td></tr>
+<tr><td><a href="#">Jalen Stallworth</a> <small>STL</small></td><td>190.4</td><td>818.7</td><td>5.8</td><td>29.2</td><td>248.1</td><td>1.4</td><td>1.4</td><td>147.3</td></tr>
+<tr><td><a href="#">Preston Stallworth</a> <small>BUF</small></td><td>207.1</td><td>890.5</td><td>6.4</td><td>26.4</td><td>224.3</td><td>1.2</td><td>1.2</td><td>154.7</td></tr>
+<tr><td><a href="#">Shane Ellery</a> <small>SD</small></td><td>209.2</td><td>899.6</td><td>6.4</td><td>25.7</td><td>218.5</td><td>1.2</td><td>1.2</td><td>155.2</td></tr>
+<tr><td><a href="#">Tyrell Rutherford</a> <small>CHI</small></td><td>156.5</td><td>672.9</td><td>4.8</td><td>28.3</td><td>240.2</td><td>1.3</td><td>1.1</td><td>126.0</td></tr>
+<tr><td><a href="#">Elijah Ellery</a> <small>BAL</small></td><td>184.7</td><td>794.2</td><td>5.7</td><td>24.3</td><td>206.5</td><td>1.1</td><td>1.0</td><td>138.9</td></tr>
+<tr><td><a href="#">Caleb Jessup</a> <small>ATL</small></td><td>161.1</td><td>692.6</td><td>4.9</td><td>26.7</td><td>226.8</td><td>1.3</td><td>1.0</td><td>127.1</td></tr>
+<tr><td><a href="#">Wesley Jessup</a> <small>TB</small></td><td>174.7</td><td>751.3</td><td>5.4</td><td>26.7</td><td>226.6</td><td>1.3</td><td>1.0</td><td>135.6</td></tr>
+<tr><td><a href="#">Preston Fairbanks</a> <small>STL</small></td><td>162.6</td><td>699.0</td><td>5.0</td><td>26.1</td><td>221.5</td><td>1.2</td><td>1.2</td><td>127.0</td></tr>
+<tr><td><a href="#">Wesley Abernathy</a> <small>CLE</small></td><td>141.8</td><td>609.9</td><td>4.4</td><td>23.9</td><td>203.4</td><td>1.1</td><td>1.2</td><td>111.9</td></tr>
+<tr><td><a href="#">Reggie Bledsoe</a> <small>NO</small></td><td>173.5</td><td>745.8</td><td>5.3</td><td>20.9</td><td>177.5</td><td>1.0</td><td>1.1</td><td>128.0</td></tr>
+<tr><td><a href="#">Marcus Ingram</a> <small>NO</small></td><td>150.3</td><td>646.3</td><td>4.6</td><td>26.9</td><td>228.3</td><td>1.3</td><td>1.1</td><td>120.6</td></tr>
+<tr><td><a href="#">Grant Ellery</a> <small>ATL</small></td><td>155.3</td><td>667.8</td><td>4.8</td><td>25.3</td><td>214.7</td><td>1.2</td><td>1.2</td><td>121.7</td></tr>
+<tr><td><a href="#">Caleb Thigpen</a> <small>MIA</small></td><td>166.7</td><td>716.8</td><td>5.1</td><td>25.4</td><td>216.1</td><td>1.2</td><td>1.2</td><td>128.9</td></tr>
+<tr><td><a href="#">Blake Fairbanks</a> <small>SD</small></td><td>131.5</td><td>565.5</td><td>4.0</td><td>21.2</td><td>180.4</td><td>1.0</td><td>1.0</td><td>102.8</td></tr>
+<tr><td><a href="#">Elijah Fairbanks</a> <small>CAR</small></td><td>143.4</td><td>616.5</td><td>4.4</td><td>19.0</td><td>161.5</td><td>0.9</td><td>0.9</td><td>107.8</td></tr>
+<tr><td><a href="#">Xavier Ellery</a> <small>WAS</small></td><td>130.1</td><td>559.3</td><td>4.0</td><td>20.3</td><td>172.3</td><td>1.0</td><td>0.9</td><td>101.2</td></tr>
+<tr><td><a href="#">Aaron Quarles</a> <small>CIN</small></td><td>155.7</td><td>669.7</td><td>4.8</td><td>24.0</td><td>203.7</td><td>1.1</td><td>0.9</td><td>121.1</td></tr>
+<tr><td><a href="#">Tyrell Hollins</a> <small>NE</small></td><td>124.3</td><td>534.3</td><td>3.8</td><td>20.3</td><td>172.6</td><td>1.0</td><td>1.0</td><td>97.4</td></tr>
+<tr><td><a href="#">Blake Pettaway</a> <small>PHI</small></td><td>136.5</td><td>586.9</td><td>4.2</td><td>21.9</td><td>186.5</td><td>1.0</td><td>0.8</td><td>107.0</td></tr>
+<tr><td><a href="#">Quincy Stallworth</a> <small>MIA</small></td><td>112.7</td><td>484.4</td><td>3.5</td><td>17.6</td><td>149.6</td><td>0.8</td><td>0.8</td><td>87.5</td></tr>
+<tr><td><a href="#">Blake Stallworth</a> <small>GB</small></td><td>139.1</td><td>597.9</td><td>4.3</td><td>18.1</td><td>153.7</td><td>0.9</td><td>0.9</td><td>104.1</td></tr>
+<tr><td><a href="#">Keenan Lockett</a> <small>STL</small></td><td>109.0</td><td>468.9</td><td>3.3</td><td>20.0</td><td>170.0</td><td>0.9</td><td>0.9</td><td>87.8</td></tr>
+<tr><td><a href="#">Lamar Abernathy</a> <small>WAS</small></td><td>119.4</td><td>513.4</td><td>3.7</td><td>18.4</td><td>156.4</td><td>0.9</td><td>0.7</td><td>92.8</td></tr>
+<tr><td><a href="#">Hector Dunmore</a> <small>SEA</small></td><td>111.4</td><td>478.9</td><td>3.4</td><td>19.2</td><td>163.0</td><td>0.9</td><td>0.7</td><td>88.7</td></tr>
+<tr><td><a href="#">Reggie Mayfield</a> <small>DAL</small></td><td>123.9</td><td>532.7</td><td>3.8</td><td>15.9</td><td>135.2</td><td>0.8</td><td>0.9</td><td>92.4</td></tr>
+<tr><td><a href="#">Nolan Norwood</a> <small>CAR</small></td><td>113.4</td><td>487.8</td><td>3.5</td><td>17.6</td><td>149.9</td><td>0.8</td><td>0.7</td><td>88.2</td></tr>
+<tr><td><a href="#">Preston Upshaw</a> <small>BAL</small></td><td>101.3</td><td>435.5</td><td>3.1</td><td>17.1</td><td>145.1</td><td>0.8</td><td>0.7</td><td>80.1</td></tr>
+<tr><td><a href="#">Reggie Lockett</a> <small>SF</small></td><td>104.6</td><td>449.9</td><td>3.2</td><td>13.4</td><td>113.7</td><td>0.6</td><td>0.6</td><td>78.2</td></tr>
+<tr><td><a href="#">Aaron Fairbanks</a> <small>GB</small></td><td>96.6</td><td>415.6</td><td>3.0</td><td>13.5</td><td>114.6</td><td>0.6</td><td>0.8</td><td>73.1</td></tr>
+<tr><td><a href="#">Xavier Pettaway</a> <small>SD</small></td><td>90.5</td><td>388.9</td><td>2.8</td><td>13.4</td><td>113.7</td><td>0.6</td><td>0.6</td><td>69.5</td></tr>
+<tr><td><a href="#">Isaac Rutherford</a> <small>BAL</small></td><td>82.9</td><td>356.5</td><td>2.5</td><td>12.7</td><td>108.0</td><td>0.6</td><td>0.6</td><td>64.0</td></tr>
+<tr><td><a href="#">Zach Whitfield</a> <small>CIN</small></td><td>98.7</td><td>424.2</td><td>3.0</td><td>12.5</td><td>106.4</td><td>0.6</td><td>0.7</td><td>73.4</td></tr>
+<tr><td><a href="#">Keenan Crenshaw</a> <small>TB</small></td><td>76.9</td><td>330.6</td><td>2.4</td><td>13.0</td><td>110.3</td><td>0.6</td><td>0.6</td><td>60.7</td></tr>
+<tr><td><a href="#">Caleb Ingram</a> <small>WAS</small></td><td>80.9</td><td>347.9</td><td>2.5</td><td>13.0</td><td>110.7</td><td>0.6</td><td>0.6</td><td>63.2</td></tr>
+<tr><td><a href="#">Zach Pettaway</a> <small>DET</small></td><td>74.2</td><td>318.9</td><td>2.3</td><td>12.3</td><td>105.0</td><td>0.6</td><td>0.6</td><td>58.3</td></tr>
+<tr><td><a href="#">Reggie Ellery</a> <small>TB</small></td><td>70.4</td><td>302.5</td><td>2.2</td><td>12.7</td><td>108.4</td><td>0.6</td><td>0.5</td><td>56.8</td></tr>
+<tr><td><a href="#">Shane Dunmore</a> <small>GB</small></td><td>70.9</td><td>304.9</td><td>2.2</td><td>10.2</td><td>86.4</td><td>0.5</td><td>0.5</td><td>54.2</td></tr>
+<tr><td><a href="#">Preston Yarbrough</a> <small>NE</small></td><td>72.4</td><td>311.3</td><td>2.2</td><td>10.7</td><td>91.4</td><td>0.5</td><td>0.5</td><td>55.7</td></tr>
+<tr><td><a href="#">Felix Ingram</a> <small>NE</small></td><td>62.8</td><td>270.2</td><td>1.9</td><td>8.8</td><td>74.9</td><td>0.4</td><td>0.4</td><td>47.7</td></tr>
+<tr><td><a href="#">Grant Mayfield</a> <small>BUF</small></td><td>56.6</td><td>243.5</td><td>1.7</td><td>10.6</td><td>89.7</td><td>0.5</td><td>0.4</td><td>45.9</td></tr>
+<tr><td><a href="#">Tyrell Jessup</a> <small>HOU</small></td><td>60.2</td><td>258.8</td><td>1.8</td><td>9.8</td><td>83.1</td><td>0.5</td><td>0.4</td><td>47.2</td></tr>
+<tr><td><a href="#">Caleb Ogletree</a> <small>ATL</small></td><td>50.9</td><td>218.7</td><td>1.6</td><td>9.4</td><td>80.1</td><td>0.4</td><td>0.4</td><td>41.1</td></tr>
+<tr><td><a href="#">Felix Bledsoe</a> <small>WAS</small></td><td>55.5</td><td>238.5</td><td>1.7</td><td>8.6</td><td>73.4</td><td>0.4</td><td>0.4</td><td>43.1</td></tr>
+<tr><td><a href="#">Hector Abernathy</a> <small>ARI</small></td><td>51.4</td><td>221.2</td><td>1.6</td><td>7.7</td><td>65.7</td><td>0.4</td><td>0.4</td><td>39.6</td></tr>
+<tr><td><a href="#">Nolan Fairbanks</a> <small>BUF</small></td><td>56.1</td><td>241.2</td><td>1.7</td><td>7.6</td><td>64.6</td><td>0.4</td><td>0.3</td><td>42.4</td></tr>
+<tr><td><a href="#">Nolan Rutherford</a> <small>JAC</small></td><td>40.3</td><td>173.2</td><td>1.2</td><td>6.3</td><td>53.9</td><td>0.3</td><td>0.3</td><td>31.4</td></tr>
+<tr><td><a href="#">Tyrell Vickers</a> <small>ATL</small></td><td>46.6</td><td>200.3</td><td>1.4</td><td>6.6</td><td>55.9</td><td>0.3</td><td>0.2</td><td>35.6</td></tr>
+</tbody></table></body></html>
@@ -0,0 +1,40 @@
+<html><body>
+<table id="experts"><tr><td>Consensus</td><td>FantasyPros</td><td>Fixture</td></tr></table>
+<table id="data"><thead><tr><th>Player</th></tr></thead><tbody>
+<tr><td><a href="#">Wesley Quarles</a> <small>WAS</small></td><td>81.4</td><td>935.5</td><td>6.2</td><td>1.1</td><td>128.7</td></tr>
+<tr><td><a href="#">Felix Thigpen</a> <small>CAR</small></td><td>82.3</td><td>946.0</td><td>6.3</td><td>0.9</td><td>130.7</td></tr>
+<tr><td><a href="#">Wesley Whitfield</a> <small>DET</small></td><td>71.2</td><td>818.6</td><td>5.5</td><td>1.0</td><td>112.5</td></tr>
+<tr><td><a href="#">Wesley Vickers</a> <small>NYG</small></td><td>75.8</td><td>872.2</td><td>5.8</td><td>1.0</td><td>120.2</td></tr>
+<tr><td><a href="#">Zach Upshaw</a> <small>DAL</small></td><td>76.5</td><td>879.3</td><td>5.9</td><td>0.8</td><td>121.6</td></tr>
+<tr><td><a href="#">Shane Quarles</a> <small>SD</small></td><td>83.3</td><td>957.7</td><td>6.4</td><td>0.9</td><td>132.3</td></tr>
+<tr><td><a href="#">Zach Kirkland</a> <small>SD</small></td><td>73.9</td><td>849.9</td><td>5.7</td><td>1.0</td><td>117.1</td></tr>
+<tr><td><a href="#">Victor Ogletree</a> <small>NO</small></td><td>60.8</td><td>699.5</td><td>4.7</td><td>0.8</td><td>96.3</td></tr>
+<tr><td><a href="#">Marcus Fairbanks</a> <small>ARI</small></td><td>78.7</td><td>905.3</td><td>6.0</td><td>0.9</td><td>125.0</td></tr>
+<tr><td><a href="#">Xavier Galloway</a> <small>MIA</small></td><td>66.9</td><td>769.7</td><td>5.1</td><td>0.7</td><td>106.4</td></tr>
+<tr><td><a href="#">Victor Quarles</a> <small>TB</small></td><td>62.4</td><td>717.1</td><td>4.8</td><td>0.7</td><td>98.9</td></tr>
+<tr><td><a href="#">Marcus Ogletree</a> <small>PHI</small></td><td>66.3</td><td>762.3</td><td>5.1</td><td>0.7</td><td>105.4</td></tr>
+<tr><td><a href="#">Blake Ellery</a> <small>PIT</small></td><td>64.2</td><td>738.3</td><td>4.9</td><td>0.6</td><td>102.1</td></tr>
+<tr><td><a href="#">Tyrell Yarbrough</a> <small>NYG</small></td><td>65.5</td><td>752.7</td><td>5.0</td><td>0.7</td><td>103.9</td></tr>
+<tr><td><a href="#">Xavier Kirkland</a> <small>NE</small></td><td>64.5</td><td>742.0</td><td>4.9</td><td>0.6</td><td>102.7</td></tr>
+<tr><td><a href="#">Elijah Stallworth</a> <small>NE</small></td><td>57.9</td><td>666.0</td><td>4.4</td><td>0.6</td><td>92.0</td></tr>
+<tr><td><a href="#">Victor Pettaway</a> <small>DET</small></td><td>51.3</td><td>590.1</td><td>3.9</td><td>0.6</td><td>81.5</td></tr>
+<tr><td><a href="#">Wesley Mayfield</a> <small>PIT</small></td><td>45.9</td><td>527.3</td><td>3.5</td><td>0.6</td><td>72.5</td></tr>
+<tr><td><a href="#">Isaac Vickers</a> <small>DAL</small></td><td>47.8</td><td>550.0</td><td>3.7</td><td>0.5</td><td>76.0</td></tr>
+<tr><td><a href="#">Blake Crenshaw</a> <small>PIT</small></td><td>52.7</td><td>606.0</td><td>4.0</td><td>0.5</td><td>83.8</td></tr>
+<tr><td><a href="#">Tyrell Pettaway</a> <small>GB</small></td><td>38.3</td><td>439.9</td><td>2.9</td><td>0.5</td><td>60.6</td></tr>
+<tr><td><a href="#">Preston Quarles</a> <small>IND</small></td><td>44.7</td><td>514.4</td><td>3.4</td><td>0.4</td><td>71.1</td></tr>
+<tr><td><a href="#">Shane Norwood</a> <small>KC</small></td><td>40.7</td><td>468.0</td><td>3.1</td><td>0.4</td><td>64.7</td></tr>
+<tr><td><a href="#">Marcus Upshaw</a> <small>PHI</small></td><td>34.0</td><td>391.5</td><td>2.6</td><td>0.5</td><td>53.8</td></tr>
+<tr><td><a href="#">Blake Rutherford</a> <small>NE</small></td><td>36.7</td><td>422.3</td><td>2.8</td><td>0.4</td><td>58.3</td></tr>
+<tr><td><a href="#">Shane Galloway</a> <small>BAL</small></td><td>38.6</td><td>443.8</td><td>3.0</td><td>0.4</td><td>61.3</td></tr>
+<tr><td><a href="#">Aaron Ellery</a> <small>WAS</small></td><td>31.8</td><td>365.5</td><td>2.4</td><td>0.4</td><td>50.4</td></tr>
+<tr><td><a href="#">Hector Vickers</a> <small>NYG</small></td><td>25.6</td><td>294.2</td><td>2.0</td><td>0.3</td><td>40.5</td></tr>
+<tr><td><a href="#">Elijah Ogletree</a> <small>KC</small></td><td>31.5</td><td>361.9</td><td>2.4</td><td>0.3</td><td>50.0</td></tr>
+<tr><td><a href="#">Xavier Whitfield</a> <small>TB</small></td><td>26.8</td><td>307.9</td><td>2.1</td><td>0.3</td><td>42.5</td></tr>
+<tr><td><a href="#">Hector Hollins</a> <small>STL</small></td><td>23.1</td><td>266.0</td><td>1.8</td><td>0.3</td><td>36.7</td></tr>
+<tr><td><a href="#">Dante Norwood</a> <small>MIA</small></td><td>19.2</td><td>221.3</td><td>1.5</td><td>0.3</td><td>30.5</td></tr>
+<tr><td><a href="#">Wesley Dunmore</a> <small>PHI</small></td><td>17.0</td><td>195.6</td><td>1.3</td><td>0.2</td><td>27.0</td></tr>
+<tr><td><a href="#">Lamar Pettaway</a> <small>ARI</small></td><td>19.1</td><td>219.6</td><td>1.5</td><td>0.2</td><td>30.4</td></tr>
+<tr><td><a href="#">Nolan Lockett</a> <small>BAL</small></td><td>16.7</td><td>191.9</td><td>1.3</td><td>0.2</td><td>26.5</td></tr>
+<tr><td><a href="#">Marcus Rutherford</a> <small>TB</small></td><td>15.0</td><td>172.7</td><td>1.2</td><td>0.2</td><td>23.9</td></tr>
+</tbody></table></body></html>
@@ -0,0 +1,84 @@
+<html><body>
+<table id="experts"><tr><td>Consensus</td><td>FantasyPros</td><td>Fixture</td></tr></table>
+<table id="data"><thead><tr><th>Player</th></tr></thead><tbody>
+<tr><td><a href="#">Wesley Rutherford</a> <small>MIA</small></td><td>5.6</td><td>33.6</td><td>0.1</td><td>94.8</td><td>1,232.9</td><td>8.8</td><td>1.8</td><td>176.5</td></tr>
+<tr><td><a href="#">Reggie Ogletree</a> <small>STL</small></td><td>6.7</td><td>40.2</td><td>0.1</td><td>84.6</td><td>1,099.6</td><td>7.9</td><td>1.9</td><td>157.9</td></tr>
+<tr><td><a href="#">Keenan Quarles</a> <small>NYG</small></td><td>6.6</td><td>39.4</td><td>0.1</td><td>100.9</td><td>1,312.0</td><td>9.4</td><td>1.8</td><td>188.3</td></tr>
+<tr><td><a href="#">Aaron Norwood</a> <small>CIN</small></td><td>5.9</td><td>35.6</td><td>0.1</td><td>85.9</td><td>1,117.1</td><td>8.0</td><td>2.0</td><td>159.7</td></tr>
+<tr><td><a href="#">Xavier Stallworth</a> <small>BAL</small></td><td>5.5</td><td>32.8</td><td>0.1</td><td>88.2</td><td>1,146.4</td><td>8.2</td><td>1.7</td><td>164.3</td></tr>
+<tr><td><a href="#">Hector Rutherford</a> <small>ARI</small></td><td>4.9</td><td>29.3</td><td>0.1</td><td>83.9</td><td>1,090.7</td><td>7.8</td><td>1.8</td><td>155.8</td></tr>
+<tr><td><a href="#">Jalen Ogletree</a> <small>CAR</small></td><td>5.6</td><td>33.8</td><td>0.1</td><td>91.0</td><td>1,182.6</td><td>8.4</td><td>2.1</td><td>168.7</td></tr>
+<tr><td><a href="#">Zach Ogletree</a> <small>MIN</small></td><td>5.8</td><td>34.6</td><td>0.1</td><td>100.9</td><td>1,312.1</td><td>9.4</td><td>1.9</td><td>187.7</td></tr>
+<tr><td><a href="#">Grant Crenshaw</a> <small>CIN</small></td><td>5.6</td><td>33.5</td><td>0.1</td><td>101.7</td><td>1,322.0</td><td>9.4</td><td>2.1</td><td>188.6</td></tr>
+<tr><td><a href="#">Grant Rutherford</a> <small>DET</small></td><td>5.2</td><td>31.4</td><td>0.1</td><td>97.6</td><td>1,269.3</td><td>9.1</td><td>1.9</td><td>181.3</td></tr>
+<tr><td><a href="#">Grant Yarbrough</a> <small>MIN</small></td><td>5.0</td><td>30.2</td><td>0.1</td><td>92.3</td><td>1,199.5</td><td>8.6</td><td>2.0</td><td>170.9</td></tr>
+<tr><td><a href="#">Nolan Pettaway</a> <small>ARI</small></td><td>4.6</td><td>27.3</td><td>0.1</td><td>90.1</td><td>1,171.7</td><td>8.4</td><td>1.6</td><td>167.4</td></tr>
+<tr><td><a href="#">Hector Norwood</a> <small>SEA</small></td><td>5.7</td><td>34.0</td><td>0.1</td><td>91.9</td><td>1,195.3</td><td>8.5</td><td>1.7</td><td>171.4</td></tr>
+<tr><td><a href="#">Zach Ellery</a> <small>HOU</small></td><td>4.6</td><td>27.4</td><td>0.1</td><td>76.6</td><td>996.0</td><td>7.1</td><td>1.9</td><td>141.7</td></tr>
+<tr><td><a href="#">Felix Quarles</a> <small>CLE</small></td><td>4.6</td><td>27.6</td><td>0.1</td><td>76.1</td><td>988.9</td><td>7.1</td><td>1.7</td><td>141.2</td></tr>
+<tr><td><a href="#">Felix Hollins</a> <small>CHI</small></td><td>5.0</td><td>30.1</td><td>0.1</td><td>85.2</td><td>1,107.6</td><td>7.9</td><td>1.8</td><td>158.2</td></tr>
+<tr><td><a href="#">Grant Abernathy</a> <small>NYJ</small></td><td>4.9</td><td>29.4</td><td>0.1</td><td>72.5</td><td>942.7</td><td>6.7</td><td>1.8</td><td>134.6</td></tr>
+<tr><td><a href="#">Elijah Galloway</a> <small>BUF</small></td><td>4.3</td><td>25.9</td><td>0.1</td><td>77.7</td><td>1,010.4</td><td>7.2</td><td>1.7</td><td>144.0</td></tr>
+<tr><td><a href="#">Keenan Dunmore</a> <small>STL</small></td><td>5.1</td><td>30.9</td><td>0.1</td><td>87.1</td><td>1,132.2</td><td>8.1</td><td>1.5</td><td>162.3</td></tr>
+<tr><td><a href="#">Dante Ingram</a> <small>MIN</small></td><td>4.1</td><td>24.7</td><td>0.1</td><td>82.9</td><td>1,077.5</td><td>7.7</td><td>1.4</td><td>154.1</td></tr>
+<tr><td><a href="#">Felix Pettaway</a> <small>OAK</small></td><td>4.8</td><td>28.5</td><td>0.1</td><td>83.1</td><td>1,079.7</td><td>7.7</td><td>1.8</td><td>154.0</td></tr>
+<tr><td><a href="#">Blake Kirkland</a> <small>NO</small></td><td>4.0</td><td>24.0</td><td>0.1</td><td>83.9</td><td>1,091.1</td><td>7.8</td><td>1.4</td><td>155.9</td></tr>
+<tr><td><a href="#">Dante Hollins</a> <small>CHI</small></td><td>5.2</td><td>31.2</td><td>0.1</td><td>80.5</td><td>1,045.9</td><td>7.5</td><td>1.4</td><td>150.3</td></tr>
+<tr><td><a href="#">Lamar Lockett</a> <small>PIT</small></td><td>4.2</td><td>25.2</td><td>0.1</td><td>67.8</td><td>881.4</td><td>6.3</td><td>1.5</td><td>125.9</td></tr>
+<tr><td><a href="#">Elijah Rutherford</a> <small>CLE</small></td><td>4.1</td><td>24.7</td><td>0.1</td><td>62.8</td><td>816.8</td><td>5.8</td><td>1.6</td><td>116.4</td></tr>
+<tr><td><a href="#">Shane Rutherford</a> <small>CIN</small></td><td>3.8</td><td>22.8</td><td>0.1</td><td>63.3</td><td>822.7</td><td>5.9</td><td>1.3</td><td>117.6</td></tr>
+<tr><td><a href="#">Nolan Abernathy</a> <small>HOU</small></td><td>4.4</td><td>26.4</td><td>0.1</td><td>72.0</td><td>935.8</td><td>6.7</td><td>1.4</td><td>134.0</td></tr>
+<tr><td><a href="#">Nolan Kirkland</a> <small>CIN</small></td><td>4.8</td><td>28.8</td><td>0.1</td><td>72.5</td><td>942.1</td><td>6.7</td><td>1.5</td><td>134.9</td></tr>
+<tr><td><a href="#">Isaac Norwood</a> <small>STL</small></td><td>4.2</td><td>25.1</td><td>0.1</td><td>62.1</td><td>806.9</td><td>5.8</td><td>1.4</td><td>115.4</td></tr>
+<tr><td><a href="#">Nolan Quarles</a> <small>OAK</small></td><td>3.8</td><td>23.1</td><td>0.1</td><td>70.8</td><td>921.0</td><td>6.6</td><td>1.4</td><td>131.5</td></tr>
+<tr><td><a href="#">Wesley Lockett</a> <small>IND</small></td><td>4.4</td><td>26.5</td><td>0.1</td><td>64.3</td><td>836.1</td><td>6.0</td><td>1.4</td><td>119.6</td></tr>
+<tr><td><a href="#">Quincy Dunmore</a> <small>SEA</small></td><td>3.6</td><td>21.7</td><td>0.1</td><td>64.3</td><td>835.4</td><td>6.0</td><td>1.5</td><td>119.0</td></tr>
+<tr><td><a href="#">Grant Upshaw</a> <small>NYG</small></td><td>3.4</td><td>20.1</td><td>0.1</td><td>66.1</td><td>859.1</td><td>6.1</td><td>1.4</td><td>122.2</td></tr>
+<tr><td><a href="#">Wesley Norwood</a> <small>MIA</small></td><td>4.2</td><td>25.4</td><td>0.1</td><td>67.3</td><td>874.9</td><td>6.2</td><td>1.2</td><td>125.5</td></tr>
+<tr><td><a href="#">Elijah Kirkland</a> <small>KC</small></td><td>3.9</td><td>23.2</td><td>0.1</td><td>54.8</td><td>712.8</td><td>5.1</td><td>1.2</td><td>102.1</td></tr>
+<tr><td><a href="#">Blake Upshaw</a> <small>TB</small></td><td>3.7</td><td>21.9</td><td>0.1</td><td>53.4</td><td>694.7</td><td>5.0</td><td>1.2</td><td>99.4</td></tr>
+<tr><td><a href="#">Preston Abernathy</a> <small>ATL</small></td><td>3.6</td><td>21.7</td><td>0.1</td><td>63.3</td><td>822.4</td><td>5.9</td><td>1.3</td><td>117.5</td></tr>
+<tr><td><a href="#">Victor Norwood</a> <small>BAL</small></td><td>3.9</td><td>23.3</td><td>0.1</td><td>54.9</td><td>714.0</td><td>5.1</td><td>1.0</td><td>102.6</td></tr>
+<tr><td><a href="#">Blake Lockett</a> <small>OAK</small></td><td>3.3</td><td>20.1</td><td>0.1</td><td>52.1</td><td>677.6</td><td>4.8</td><td>1.2</td><td>96.9</td></tr>
+<tr><td><a href="#">Felix Ellery</a> <small>MIN</small></td><td>3.9</td><td>23.6</td><td>0.1</td><td>59.8</td><td>777.6</td><td>5.6</td><td>1.1</td><td>111.6</td></tr>
+<tr><td><a href="#">Xavier Bledsoe</a> <small>SD</small></td><td>3.0</td><td>18.0</td><td>0.1</td><td>53.6</td><td>697.3</td><td>5.0</td><td>1.1</td><td>99.5</td></tr>
+<tr><td><a href="#">Zach Thigpen</a> <small>IND</small></td><td>3.6</td><td>21.3</td><td>0.1</td><td>53.8</td><td>699.9</td><td>5.0</td><td>1.0</td><td>100.5</td></tr>
+<tr><td><a href="#">Tyrell Thigpen</a> <small>SEA</small></td><td>3.6</td><td>21.8</td><td>0.1</td><td>59.7</td><td>776.3</td><td>5.5</td><td>1.2</td><td>111.1</td></tr>
+<tr><td><a href="#">Keenan Fairbanks</a> <small>SEA</small></td><td>3.2</td><td>19.3</td><td>0.1</td><td>60.9</td><td>791.8</td><td>5.7</td><td>1.1</td><td>113.2</td></tr>
+<tr><td><a href="#">Owen Mayfield</a> <small>CIN</small></td><td>3.5</td><td>21.1</td><td>0.1</td><td>45.0</td><td>585.1</td><td>4.2</td><td>1.0</td><td>84.1</td></tr>
+<tr><td><a href="#">Caleb Norwood</a> <small>PIT</small></td><td>3.2</td><td>18.9</td><td>0.1</td><td>49.8</td><td>647.8</td><td>4.6</td><td>1.1</td><td>92.6</td></tr>
+<tr><td><a href="#">Dante Bledsoe</a> <small>PHI</small></td><td>2.9</td><td>17.6</td><td>0.1</td><td>44.7</td><td>580.8</td><td>4.1</td><td>0.9</td><td>83.2</td></tr>
+<tr><td><a href="#">Preston Ingram</a> <small>CIN</small></td><td>2.6</td><td>15.9</td><td>0.0</td><td>50.9</td><td>662.1</td><td>4.7</td><td>0.9</td><td>94.6</td></tr>
+<tr><td><a href="#">Xavier Ingram</a> <small>SF</small></td><td>3.2</td><td>19.3</td><td>0.0</td><td>41.3</td><td>536.4</td><td>3.8</td><td>1.0</td><td>76.9</td></tr>
+<tr><td><a href="#">Quincy Crenshaw</a> <small>GB</small></td><td>2.4</td><td>14.3</td><td>0.0</td><td>52.5</td><td>683.0</td><td>4.9</td><td>0.9</td><td>97.5</td></tr>
+<tr><td><a href="#">Blake Bledsoe</a> <small>PHI</small></td><td>2.6</td><td>15.4</td><td>0.0</td><td>39.5</td><td>513.8</td><td>3.7</td><td>0.9</td><td>73.4</td></tr>
+<tr><td><a href="#">Wesley Bledsoe</a> <small>NYJ</small></td><td>2.7</td><td>16.4</td><td>0.0</td><td>46.6</td><td>606.2</td><td>4.3</td><td>0.8</td><td>86.8</td></tr>
+<tr><td><a href="#">Marcus Whitfield</a> <small>IND</small></td><td>2.5</td><td>14.8</td><td>0.0</td><td>46.0</td><td>597.9</td><td>4.3</td><td>0.8</td><td>85.6</td></tr>
+<tr><td><a href="#">Aaron Galloway</a> <small>SD</small></td><td>2.6</td><td>15.6</td><td>0.0</td><td>41.1</td><td>534.9</td><td>3.8</td><td>0.9</td><td>76.3</td></tr>
+<tr><td><a href="#">Victor Whitfield</a> <small>TB</small></td><td>2.2</td><td>12.9</td><td>0.0</td><td>43.5</td><td>565.9</td><td>4.0</td><td>0.9</td><td>80.5</td></tr>
+<tr><td><a href="#">Felix Yarbrough</a> <small>KC</small></td><td>2.1</td><td>12.7</td><td>0.0</td><td>38.7</td><td>503.5</td><td>3.6</td><td>0.8</td><td>71.9</td></tr>
+<tr><td><a href="#">Shane Vickers</a> <small>PHI</small></td><td>2.2</td><td>13.5</td><td>0.0</td><td>36.8</td><td>477.9</td><td>3.4</td><td>0.7</td><td>68.4</td></tr>
+<tr><td><a href="#">Felix Norwood</a> <small>NO</small></td><td>2.4</td><td>14.6</td><td>0.0</td><td>41.4</td><td>538.1</td><td>3.8</td><td>0.7</td><td>77.2</td></tr>
+<tr><td><a href="#">Owen Upshaw</a> <small>ARI</small></td><td>2.5</td><td>15.1</td><td>0.0</td><td>33.8</td><td>439.9</td><td>3.1</td><td>0.8</td><td>63.0</td></tr>
+<tr><td><a href="#">Felix Ogletree</a> <small>PIT</small></td><td>2.3</td><td>13.6</td><td>0.0</td><td>38.8</td><td>504.5</td><td>3.6</td><td>0.8</td><td>72.0</td></tr>
+<tr><td><a href="#">Preston Galloway</a> <small>DAL</small></td><td>1.9</td><td>11.4</td><td>0.0</td><td>35.9</td><td>466.4</td><td>3.3</td><td>0.7</td><td>66.5</td></tr>
+<tr><td><a href="#">Blake Whitfield</a> <small>PHI</small></td><td>2.2</td><td>13.4</td><td>0.0</td><td>36.7</td><td>477.1</td><td>3.4</td><td>0.7</td><td>68.3</td></tr>
+<tr><td><a href="#">Dante Ellery</a> <small>GB</small></td><td>1.9</td><td>11.3</td><td>0.0</td><td>36.5</td><td>474.5</td><td>3.4</td><td>0.7</td><td>67.7</td></tr>
+<tr><td><a href="#">Owen Vickers</a> <small>PIT</small></td><td>2.0</td><td>11.9</td><td>0.0</td><td>32.3</td><td>420.3</td><td>3.0</td><td>0.6</td><td>60.1</td></tr>
+<tr><td><a href="#">Quincy Mayfield</a> <small>STL</small></td><td>1.6</td><td>9.4</td><td>0.0</td><td>29.8</td><td>386.8</td><td>2.8</td><td>0.6</td><td>55.2</td></tr>
+<tr><td><a href="#">Isaac Pettaway</a> <small>TB</small></td><td>1.7</td><td>10.3</td><td>0.0</td><td>31.9</td><td>415.2</td><td>3.0</td><td>0.7</td><td>59.2</td></tr>
+<tr><td><a href="#">Reggie Stallworth</a> <small>WAS</small></td><td>1.6</td><td>9.7</td><td>0.0</td><td>28.2</td><td>366.0</td><td>2.6</td><td>0.5</td><td>52.5</td></tr>
+<tr><td><a href="#">Grant Lockett</a> <small>DET</small></td><td>1.7</td><td>10.1</td><td>0.0</td><td>24.4</td><td>316.8</td><td>2.3</td><td>0.5</td><td>45.4</td></tr>
+<tr><td><a href="#">Reggie Quarles</a> <small>GB</small></td><td>1.7</td><td>10.3</td><td>0.0</td><td>27.6</td><td>358.9</td><td>2.6</td><td>0.5</td><td>51.5</td></tr>
+<tr><td><a href="#">Nolan Dunmore</a> <small>PHI</small></td><td>1.6</td><td>9.4</td><td>0.0</td><td>24.0</td><td>311.6</td><td>2.2</td><td>0.5</td><td>44.7</td></tr>
+<tr><td><a href="#">Zach Quarles</a> <small>DAL</small></td><td>1.3</td><td>7.9</td><td>0.0</td><td>23.1</td><td>300.4</td><td>2.1</td><td>0.5</td><td>42.9</td></tr>
+<tr><td><a href="#">Preston Pettaway</a> <small>MIA</small></td><td>1.2</td><td>7.0</td><td>0.0</td><td>19.5</td><td>253.2</td><td>1.8</td><td>0.4</td><td>36.1</td></tr>
+<tr><td><a href="#">Shane Fairbanks</a> <small>BAL</small></td><td>1.2</td><td>6.9</td><td>0.0</td><td>24.6</td><td>319.5</td><td>2.3</td><td>0.5</td><td>45.5</td></tr>
+<tr><td><a href="#">Dante Rutherford</a> <small>SEA</small></td><td>1.2</td><td>7.0</td><td>0.0</td><td>23.4</td><td>304.4</td><td>2.2</td><td>0.4</td><td>43.5</td></tr>
+<tr><td><a href="#">Jalen Quarles</a> <small>KC</small></td><td>1.2</td><td>6.9</td><td>0.0</td><td>17.8</td><td>231.5</td><td>1.7</td><td>0.4</td><td>33.1</td></tr>
+<tr><td><a href="#">Owen Bledsoe</a> <small>KC</small></td><td>1.0</td><td>5.9</td><td>0.0</td><td>16.6</td><td>215.3</td><td>1.5</td><td>0.3</td><td>30.8</td></tr>
+<tr><td><a href="#">Caleb Mayfield</a> <small>IND</small></td><td>1.1</td><td>6.7</td><td>0.0</td><td>16.2</td><td>211.1</td><td>1.5</td><td>0.3</td><td>30.3</td></tr>
+<tr><td><a href="#">Nolan Stallworth</a> <small>NYJ</small></td><td>1.1</td><td>6.5</td><td>0.0</td><td>15.6</td><td>202.8</td><td>1.4</td><td>0.3</td><td>29.1</td></tr>
+<tr><td><a href="#">Marcus Thigpen</a> <small>CHI</small></td><td>1.0</td><td>5.9</td><td>0.0</td><td>15.9</td><td>206.2</td><td>1.5</td><td>0.3</td><td>29.5</td></tr>
+<tr><td><a href="#">Wesley Galloway</a> <small>TB</small></td><td>0.9</td><td>5.3</td><td>0.0</td><td>12.0</td><td>156.6</td><td>1.1</td><td>0.3</td><td>22.5</td></tr>
+</tbody></table></body></html>